@@ -48,7 +48,7 @@ class PostToolHandler(BaseHandler):
         await tm.add_message(session_id, tool_message)
 
         # Now create assistant message with tool call
-        # _process_tool_call will find the tool result in _tool_results
+        # _process_tool_call will find the result hash in _tool_result_hashes
         tool_call = ToolCall(
             id=tool_use_id,
             name=tool_name,
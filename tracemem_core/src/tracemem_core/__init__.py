@@ -1,5 +1,5 @@
 from tracemem_core.config import TraceMemConfig
-from tracemem_core.embedders import Embedder, OpenAIEmbedder
+from tracemem_core.embedders import CachedEmbedder, Embedder, OpenAIEmbedder
 from tracemem_core.extractors import (
     DefaultResourceExtractor,
     ResourceExtractor,
@@ -58,6 +58,7 @@ __all__ = [
     # Embedders
     "Embedder",
     "OpenAIEmbedder",
+    "CachedEmbedder",
     # Storage
     "GraphStore",
     "VectorStore",
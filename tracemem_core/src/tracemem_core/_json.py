@@ -0,0 +1,13 @@
+"""JSON decoding for stored node and edge properties.
+
+Uses orjson when the ``fast`` extra is installed (a few times faster on
+tool_uses payloads) and the standard library otherwise. Both raise a
+``ValueError`` subclass on invalid input.
+"""
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+__all__ = ["json_loads"]
@@ -33,16 +33,36 @@ class TraceMemConfig(BaseSettings):
     neo4j_user: str = "neo4j"
     neo4j_password: str = "password"
     neo4j_database: str = "neo4j"
+    neo4j_max_connection_pool_size: int = Field(default=50, ge=1)
+    neo4j_connection_acquisition_timeout: float = Field(default=5.0, gt=0)
+    neo4j_max_transaction_retry_time: float = Field(default=5.0, ge=0)
 
     # Namespace for Neo4j multi-user isolation
     namespace: str | None = None
 
+    # Seconds to cache graph context/conversation lookups (0, the default,
+    # disables). The cache is per process: writes from other processes or
+    # TraceMem instances stay invisible for up to this long
+    graph_read_cache_ttl: float = Field(default=0.0, ge=0)
+
+    # Reuse the search hits of a recent query whose embedding has at least
+    # this cosine similarity (e.g. 0.95), for similar_query_ttl seconds.
+    # None disables
+    similar_query_threshold: float | None = Field(default=None, gt=0, le=1)
+    similar_query_ttl: float = Field(default=5.0, gt=0)
+
     # LanceDB configuration (deprecated — use home instead)
     lancedb_path: Path | None = None
 
     # Embedding configuration
     embedding_model: str = "text-embedding-3-small"
     embedding_dimensions: int = Field(default=1536, ge=1)
+    # Texts whose embeddings are kept in memory for reuse (0, the default,
+    # disables). Each entry costs 8 bytes per dimension, about 12 KB at 1536
+    # dimensions or 12 MB for 1024 entries
+    embed_cache_size: int = Field(default=0, ge=0)
+    # Vector storage type for new LanceDB tables ("float16" halves the size)
+    vector_dtype: Literal["float32", "float16"] = "float32"
     openai_api_key: str | None = None
 
     # Reranker strategy (string key from registry, e.g. "rrf", "linear")
@@ -1,7 +1,9 @@
+from tracemem_core.embedders.cache import CachedEmbedder
 from tracemem_core.embedders.openai import OpenAIEmbedder
 from tracemem_core.embedders.protocol import Embedder
 
 __all__ = [
+    "CachedEmbedder",
     "Embedder",
     "OpenAIEmbedder",
 ]
@@ -0,0 +1,60 @@
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from tracemem_core.embedders.protocol import Embedder
+
+
+class CachedEmbedder:
+    """LRU cache in front of another embedder.
+
+    Embeddings depend only on the text, so entries never go stale. Vectors
+    are kept as compact double arrays (8 bytes per dimension) and every call
+    returns fresh lists, so callers may mutate them.
+
+    Args:
+        embedder: Embedder that computes vectors on a cache miss.
+        maxsize: Maximum number of texts kept (least recently used evicted).
+    """
+
+    def __init__(self, embedder: Embedder, maxsize: int = 1024) -> None:
+        self._embedder = embedder
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, array] = OrderedDict()
+
+    @property
+    def dimensions(self) -> int:
+        return self._embedder.dimensions
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed a single text string, reusing a cached vector if present."""
+        cached = self._entries.get(text)
+        if cached is not None:
+            self._entries.move_to_end(text)
+            return cached.tolist()
+        vector = await self._embedder.embed(text)
+        self._store(text, vector)
+        return vector
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed multiple texts, sending only uncached ones to the embedder."""
+        # Snapshot hits first: a concurrent call may evict them while the
+        # misses are being embedded
+        found: dict[str, Sequence[float]] = {}
+        for text in dict.fromkeys(texts):
+            if text in self._entries:
+                found[text] = self._entries[text]
+                self._entries.move_to_end(text)
+        missing = [t for t in dict.fromkeys(texts) if t not in found]
+        if missing:
+            vectors = await self._embedder.embed_batch(missing)
+            for text, vector in zip(missing, vectors):
+                found[text] = vector
+                self._store(text, vector)
+        return [list(found[t]) for t in texts]
+
+    def _store(self, text: str, vector: list[float]) -> None:
+        self._entries[text] = array("d", vector)
+        self._entries.move_to_end(text)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -4,11 +4,30 @@ This module provides protocols and implementations for extracting resource URIs
 from tool call arguments.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, Protocol
 from urllib.parse import urlparse
 
 
+@lru_cache(maxsize=1024)
+def _resolve_absolute(path: str) -> Path:
+    """Resolve an absolute path, caching the realpath syscalls per string."""
+    return Path(path).resolve()
+
+
+def _resolve(path: Path) -> Path:
+    """Resolve symlinks and normalize path. Internal helper.
+
+    Relative paths are anchored at the current directory before the cache
+    lookup, so a later chdir never returns a stale entry. Symlinks changed
+    after the first lookup are not seen until the cache is cleared.
+    """
+    if not path.is_absolute():
+        path = Path.cwd() / path
+    return _resolve_absolute(str(path))
+
+
 def _canonicalize_file_uri(uri: str, root: Path | None) -> str:
     """Canonicalize a file:// URI. Internal helper.
 
@@ -36,11 +55,11 @@ def _canonicalize_file_uri(uri: str, root: Path | None) -> str:
         path = Path(uri)
 
     # Resolve symlinks and normalize
-    path = path.resolve()
+    path = _resolve(path)
 
     if root is not None:
         try:
-            rel_path = path.relative_to(root.resolve())
+            rel_path = path.relative_to(_resolve(root))
             return f"file://{rel_path}"
         except ValueError:
             # Path is outside root, use absolute
@@ -83,8 +102,9 @@ class DefaultResourceExtractor:
               Defaults to cwd/.tracemem if not specified in local mode.
     """
 
-    FILE_ARGS = {"path", "file_path", "filepath", "file", "filename"}
-    URL_ARGS = {"url", "uri", "endpoint"}
+    # Checked in order; the first non-empty string wins.
+    FILE_ARGS = ("path", "file_path", "filepath", "file", "filename")
+    URL_ARGS = ("url", "uri", "endpoint")
 
     def __init__(
         self,
@@ -95,7 +115,7 @@ class DefaultResourceExtractor:
         self.mode = mode
         if mode == "local":
             _home = home or Path.cwd() / ".tracemem"
-            self._root: Path | None = _home.parent.resolve()
+            self._root: Path | None = _resolve(_home.parent)
         else:
             self._root = None
 
@@ -120,15 +140,13 @@ class DefaultResourceExtractor:
     def _extract_raw(self, tool_name: str, args: dict[str, Any]) -> str | None:
         """Extract a raw (uncanonicalized) resource URI."""
         for arg in self.FILE_ARGS:
-            if arg in args and args[arg]:
-                path = args[arg]
-                if isinstance(path, str):
-                    return f"file://{path}" if not path.startswith("file://") else path
+            path = args.get(arg)
+            if path and isinstance(path, str):
+                return path if path.startswith("file://") else f"file://{path}"
 
         for arg in self.URL_ARGS:
-            if arg in args and args[arg]:
-                url = args[arg]
-                if isinstance(url, str):
-                    return url
+            url = args.get(arg)
+            if url and isinstance(url, str):
+                return url
 
         return None
@@ -11,6 +11,11 @@ class EdgeBase(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
+    @property
+    def id_str(self) -> str:
+        """The edge id as a string."""
+        return str(self.id)
+
 
 class Relationship(EdgeBase):
     """A procedure/tool invocation that connects nodes.
@@ -1,8 +1,8 @@
 from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class NodeBase(BaseModel):
@@ -13,6 +13,11 @@ class NodeBase(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     last_accessed_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
+    @property
+    def id_str(self) -> str:
+        """The node id as a string."""
+        return str(self.id)
+
 
 class UserText(NodeBase):
     """User message node - indexed in LanceDB for hybrid search."""
@@ -49,7 +54,22 @@ class ResourceVersion(NodeBase):
 
 
 class Resource(NodeBase):
-    """Hypernode representing resource identity across versions (identified by URI)."""
+    """Hypernode representing resource identity across versions (identified by URI).
+
+    Unless given explicitly, ``id`` is a UUID5 of the URI. Stores merge
+    Resources on ``uri`` (ones written earlier have random ids), so the id
+    does not make creation cheaper. It keeps independent writers in
+    agreement instead: two imports that both found the URI missing each
+    queue edges to their own Resource, and after the merge those edges still
+    point at the one stored node.
+    """
 
     uri: str
     current_content_hash: str | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _id_from_uri(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "id" not in data and "uri" in data:
+            return {**data, "id": uuid5(NAMESPACE_URL, data["uri"])}
+        return data
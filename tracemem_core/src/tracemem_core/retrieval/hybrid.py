@@ -1,10 +1,16 @@
 """Hybrid retrieval strategy combining vector search and graph traversal."""
 
-import json
+import asyncio
 import logging
+import time
+from collections.abc import Hashable, Iterable
 from datetime import datetime
+from functools import lru_cache
 from uuid import UUID
 
+import numpy as np
+
+from tracemem_core._json import json_loads
 from tracemem_core.embedders.protocol import Embedder
 from tracemem_core.retrieval.results import (
     ConversationReference,
@@ -15,10 +21,16 @@ from tracemem_core.retrieval.results import (
     TrajectoryResult,
     TrajectoryStep,
 )
-from tracemem_core.storage.protocols import GraphStore, VectorStore
+from tracemem_core.storage.protocols import GraphStore, VectorSearchResult, VectorStore
 
 logger = logging.getLogger(__name__)
 
+# Used when a call passes no config; only ever read, never mutated
+_DEFAULT_CONFIG = RetrievalConfig()
+
+# Recent searches kept for similar-query reuse
+_RESULT_CACHE_SIZE = 64
+
 
 class HybridRetrievalStrategy:
     """Hybrid retrieval strategy combining vector search and graph traversal.
@@ -45,17 +57,31 @@ class HybridRetrievalStrategy:
         graph_store: GraphStore,
         vector_store: VectorStore,
         embedder: Embedder,
+        similar_query_threshold: float | None = None,
+        result_cache_ttl: float = 5.0,
     ) -> None:
         """Initialize the hybrid retrieval strategy.
 
         Args:
             graph_store: Graph storage for traversal queries.
             vector_store: Vector storage for similarity search.
-            embedder: Embedder for converting queries to vectors.
+            embedder: Embedder for converting queries to vectors. Wrap it in
+                a CachedEmbedder to skip the embedder for repeated queries.
+            similar_query_threshold: Cosine similarity (0-1] at which a query
+                reuses the vector store hits of a recent query with the same
+                search parameters. None (default) always searches.
+            result_cache_ttl: Seconds reused hits stay valid. Bounds staleness
+                from writes this instance does not see.
         """
         self._graph_store = graph_store
         self._vector_store = vector_store
         self._embedder = embedder
+        self._similar_query_threshold = similar_query_threshold
+        self._result_cache_ttl = result_cache_ttl
+        # (expires_at, params, unit query vector, hits), most recent last
+        self._result_cache: list[
+            tuple[float, Hashable, np.ndarray, list[VectorSearchResult]]
+        ] = []
 
     async def get_context(self, node_id: UUID) -> ContextResult:
         """Get full context for a UserText node.
@@ -90,7 +116,44 @@ class HybridRetrievalStrategy:
         Returns:
             List of RetrievalResult ordered by relevance.
         """
-        cfg = config or RetrievalConfig()
+        query_vector = await self._embedder.embed(query)
+        return await self._search_with_vector(query, query_vector, config)
+
+    async def search_batch(
+        self,
+        queries: list[str],
+        config: RetrievalConfig | None = None,
+    ) -> list[list[RetrievalResult]]:
+        """Run several independent searches concurrently.
+
+        Distinct queries are embedded in a single embed_batch call; the
+        searches then run concurrently.
+
+        Args:
+            queries: Search query texts.
+            config: Optional RetrievalConfig applied to every query.
+
+        Returns:
+            One result list per query, in the order of queries.
+        """
+        if not queries:
+            return []
+        distinct = list(dict.fromkeys(queries))
+        embedded = dict(zip(distinct, await self._embedder.embed_batch(distinct)))
+        return list(
+            await asyncio.gather(
+                *(self._search_with_vector(q, embedded[q], config) for q in queries)
+            )
+        )
+
+    async def _search_with_vector(
+        self,
+        query: str,
+        query_vector: list[float],
+        config: RetrievalConfig | None,
+    ) -> list[RetrievalResult]:
+        """Search with an already embedded query."""
+        cfg = config or _DEFAULT_CONFIG
 
         logger.debug(
             "search query=%r limit=%d include_context=%s",
@@ -99,20 +162,28 @@ class HybridRetrievalStrategy:
             cfg.include_context,
         )
 
-        # Get query embedding
-        query_vector = await self._embedder.embed(query)
-
         # Fetch more when deduplicating to ensure enough unique conversations
         fetch_limit = cfg.limit * 3 if cfg.unique_conversations else cfg.limit
 
-        # Perform vector search with vector_weight
-        vector_results = await self._vector_store.search(
-            query_vector=query_vector,
-            query_text=query,
-            limit=fetch_limit,
-            exclude_conversation_id=cfg.exclude_conversation_id,
-            vector_weight=cfg.vector_weight,
-        )
+        # Perform vector search with vector_weight, unless a similar recent
+        # query with the same parameters already has hits
+        params = (fetch_limit, cfg.exclude_conversation_id, cfg.vector_weight)
+        unit = None
+        vector_results = None
+        if self._similar_query_threshold is not None:
+            unit = np.asarray(query_vector, dtype=np.float32)
+            unit /= np.linalg.norm(unit) or 1.0
+            vector_results = self._similar_results(params, unit)
+        if vector_results is None:
+            vector_results = await self._vector_store.search(
+                query_vector=query_vector,
+                query_text=query,
+                limit=fetch_limit,
+                exclude_conversation_id=cfg.exclude_conversation_id,
+                vector_weight=cfg.vector_weight,
+            )
+            if unit is not None:
+                self._cache_results(params, unit, vector_results)
 
         # Deduplicate by conversation if requested (keep best score per conv)
         if cfg.unique_conversations:
@@ -142,17 +213,49 @@ class HybridRetrievalStrategy:
 
             results.append(result)
 
-        # Update last accessed timestamps
+        # Update last accessed timestamps in both stores concurrently
         if results:
             node_ids = [r.node_id for r in results]
-            await self._graph_store.update_last_accessed(node_ids)
-            # Also update in vector store
-            for node_id in node_ids:
-                await self._vector_store.update_last_accessed(node_id)
+            await asyncio.gather(
+                self._graph_store.update_last_accessed(node_ids),
+                self._vector_store.update_last_accessed(node_ids),
+            )
 
         logger.debug("search query=%r results=%d", query, len(results))
         return results
 
+    def _similar_results(
+        self, params: Hashable, unit: np.ndarray
+    ) -> list[VectorSearchResult] | None:
+        """Return hits of the most similar cached query above the threshold."""
+        now = time.monotonic()
+        self._result_cache = [e for e in self._result_cache if e[0] >= now]
+        best, best_sim = None, self._similar_query_threshold
+        for i, (_, cached_params, cached_unit, _) in enumerate(self._result_cache):
+            if cached_params == params:
+                sim = float(cached_unit @ unit)
+                if sim >= best_sim:
+                    best, best_sim = i, sim
+        if best is None:
+            return None
+        entry = self._result_cache.pop(best)
+        self._result_cache.append(entry)
+        return list(entry[3])
+
+    def _cache_results(
+        self, params: Hashable, unit: np.ndarray, hits: list[VectorSearchResult]
+    ) -> None:
+        if self._result_cache_ttl <= 0:
+            return
+        expires_at = time.monotonic() + self._result_cache_ttl
+        self._result_cache.append((expires_at, params, unit, list(hits)))
+        if len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.pop(0)
+
+    def clear_result_cache(self) -> None:
+        """Forget reused search hits, e.g. after new messages were indexed."""
+        self._result_cache.clear()
+
     async def get_conversations_for_resource(
         self,
         uri: str,
@@ -167,7 +270,7 @@ class HybridRetrievalStrategy:
         Returns:
             List of ConversationReference with sorting applied.
         """
-        cfg = config or RetrievalConfig()
+        cfg = config or _DEFAULT_CONFIG
         return await self._graph_store.get_resource_conversations(
             uri,
             limit=cfg.limit,
@@ -194,13 +297,39 @@ class HybridRetrievalStrategy:
         Returns:
             TrajectoryResult with all steps in chronological order.
         """
-        cfg = config or RetrievalConfig()
+        cfg = config or _DEFAULT_CONFIG
         records = await self._graph_store.get_trajectory_nodes(
             node_id,
             max_depth=cfg.trajectory_max_depth,
         )
         return self._parse_trajectory(node_id, records)
 
+    async def get_trajectories(
+        self,
+        node_ids: list[UUID],
+        config: RetrievalConfig | None = None,
+    ) -> list[TrajectoryResult]:
+        """Get trajectories for several UserText nodes with one graph query.
+
+        Args:
+            node_ids: UUIDs of the starting UserText nodes.
+            config: Optional RetrievalConfig for trajectory settings.
+
+        Returns:
+            One TrajectoryResult per node id, in the order of node_ids.
+        """
+        if not node_ids:
+            return []
+        cfg = config or _DEFAULT_CONFIG
+        records = await self._graph_store.get_trajectory_nodes_batch(
+            node_ids,
+            max_depth=cfg.trajectory_max_depth,
+        )
+        return [
+            self._parse_trajectory(node_id, records[str(node_id)])
+            for node_id in node_ids
+        ]
+
     def _parse_trajectory(
         self,
         node_id: UUID,
@@ -252,14 +381,8 @@ class HybridRetrievalStrategy:
             if node_type == "AgentText" and node.get("tool_uses"):
                 raw_tool_uses = node["tool_uses"]
                 if isinstance(raw_tool_uses, str):
-                    raw_tool_uses = json.loads(raw_tool_uses)
-                for tu in raw_tool_uses:
-                    tool_uses.append(
-                        ToolUse(
-                            tool_name=tu.get("name", ""),
-                            properties=tu.get("args", {}),
-                        )
-                    )
+                    raw_tool_uses = _decode_tool_uses(raw_tool_uses)
+                tool_uses = _build_tool_uses(raw_tool_uses)
 
             step = TrajectoryStep(
                 node_id=node["id"],
@@ -281,3 +404,21 @@ class HybridRetrievalStrategy:
         if raw and isinstance(raw, str):
             return datetime.fromisoformat(raw)
         return None
+
+
+def _build_tool_uses(records: Iterable[dict]) -> list[ToolUse]:
+    return [
+        ToolUse(tool_name=tu.get("name", ""), properties=tu.get("args", {}))
+        for tu in records
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _decode_tool_uses(raw: str) -> tuple[dict, ...]:
+    """Decode a stored tool_uses JSON string.
+
+    Stored strings never change, so overlapping trajectory expansions reuse
+    the decoded records. Callers only read them: ToolUse validation copies
+    the args into each new instance, so results never share state.
+    """
+    return tuple(json_loads(raw))
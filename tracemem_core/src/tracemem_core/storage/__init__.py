@@ -1,11 +1,17 @@
 from tracemem_core.storage.graph import KuzuGraphStore
-from tracemem_core.storage.protocols import GraphStore, VectorSearchResult, VectorStore
+from tracemem_core.storage.protocols import (
+    GraphStore,
+    VectorEntry,
+    VectorSearchResult,
+    VectorStore,
+)
 from tracemem_core.storage.vector import LanceDBVectorStore
 
 __all__ = [
     "GraphStore",
     "KuzuGraphStore",
     "LanceDBVectorStore",
+    "VectorEntry",
     "VectorSearchResult",
     "VectorStore",
 ]
@@ -0,0 +1,122 @@
+"""Write-behind view of a graph store for bulk imports."""
+
+from tracemem_core.models.edges import EdgeBase
+from tracemem_core.models.nodes import (
+    AgentText,
+    NodeBase,
+    Resource,
+    ResourceVersion,
+    UserText,
+)
+from tracemem_core.storage.protocols import GraphStore
+
+
+class BufferedGraphWriter:
+    """Collects node and edge writes and answers reads as if they had happened.
+
+    Adding a message reads back what earlier messages wrote: the current turn,
+    the last agent message, resources and their versions. This view answers
+    those reads from the pending writes and falls back to the store for
+    anything older, so a whole import is written by ``flush`` with one
+    ``create_nodes`` and one ``create_edges`` call.
+
+    Only the reads and writes used while adding messages are supported.
+
+    Args:
+        store: Graph store to read through to and flush into.
+    """
+
+    def __init__(self, store: GraphStore) -> None:
+        self._store = store
+        self._nodes: list[NodeBase] = []
+        self._edges: list[EdgeBase] = []
+        self._hash_updates: dict[str, str] = {}
+        # Read overlays, filled by writes (and resource lookups)
+        self._max_turn: dict[str, int] = {}
+        self._last_agent: dict[str, AgentText] = {}
+        self._last_in_turn: dict[tuple[str, int], UserText | AgentText] = {}
+        self._resources: dict[str, Resource] = {}
+        self._versions: dict[tuple[str, str], ResourceVersion] = {}
+
+    async def create_node(self, node: NodeBase) -> NodeBase:
+        """Queue a node for creation."""
+        self._nodes.append(node)
+        if isinstance(node, UserText | AgentText):
+            conversation_id = node.conversation_id
+            self._max_turn[conversation_id] = max(
+                self._max_turn.get(conversation_id, -1), node.turn_index
+            )
+            self._last_in_turn[(conversation_id, node.turn_index)] = node
+            if isinstance(node, AgentText):
+                self._last_agent[conversation_id] = node
+        elif isinstance(node, Resource):
+            self._resources[node.uri] = node
+        elif isinstance(node, ResourceVersion):
+            self._versions[(node.uri, node.content_hash)] = node
+        return node
+
+    async def create_edge(self, edge: EdgeBase) -> EdgeBase:
+        """Queue an edge for creation."""
+        self._edges.append(edge)
+        return edge
+
+    async def update_resource_hash(self, uri: str, content_hash: str) -> None:
+        """Queue a Resource hash update, visible to later lookups."""
+        resource = await self.get_resource_by_uri(uri)
+        if resource is None:
+            return
+        self._resources[uri] = resource.model_copy(
+            update={"current_content_hash": content_hash}
+        )
+        self._hash_updates[uri] = content_hash
+
+    async def get_resource_by_uri(self, uri: str) -> Resource | None:
+        """Get a Resource by URI, including queued ones."""
+        if uri not in self._resources:
+            resource = await self._store.get_resource_by_uri(uri)
+            if resource is None:
+                return None
+            self._resources[uri] = resource
+        return self._resources[uri]
+
+    async def get_resource_version_by_hash(
+        self, uri: str, content_hash: str
+    ) -> ResourceVersion | None:
+        """Get a ResourceVersion by URI and content hash, including queued ones."""
+        version = self._versions.get((uri, content_hash))
+        if version is not None:
+            return version
+        return await self._store.get_resource_version_by_hash(uri, content_hash)
+
+    async def get_max_turn_index(self, conversation_id: str) -> int:
+        """Get the maximum turn index, including queued nodes."""
+        if conversation_id in self._max_turn:
+            return self._max_turn[conversation_id]
+        return await self._store.get_max_turn_index(conversation_id)
+
+    async def get_last_agent_text(self, conversation_id: str) -> AgentText | None:
+        """Get the most recent AgentText, including queued nodes."""
+        if conversation_id in self._last_agent:
+            return self._last_agent[conversation_id]
+        return await self._store.get_last_agent_text(conversation_id)
+
+    async def get_last_node_in_turn(
+        self, conversation_id: str, turn_index: int
+    ) -> UserText | AgentText | None:
+        """Get the most recent node in a turn, including queued nodes."""
+        node = self._last_in_turn.get((conversation_id, turn_index))
+        if node is not None:
+            return node
+        return await self._store.get_last_node_in_turn(conversation_id, turn_index)
+
+    async def flush(self) -> None:
+        """Write queued nodes, then edges, then Resource hash updates."""
+        nodes, self._nodes = self._nodes, []
+        edges, self._edges = self._edges, []
+        hash_updates, self._hash_updates = self._hash_updates, {}
+        if nodes:
+            await self._store.create_nodes(nodes)
+        if edges:
+            await self._store.create_edges(edges)
+        for uri, content_hash in hash_updates.items():
+            await self._store.update_resource_hash(uri, content_hash)
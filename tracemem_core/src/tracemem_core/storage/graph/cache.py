@@ -0,0 +1,60 @@
+"""Read-through cache for graph store query results."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class ReadCache:
+    """Small LRU cache whose entries expire after a fixed TTL.
+
+    Graph stores clear it on every write they make, so entries only go stale
+    through writes from another process; the TTL bounds how long that lasts.
+    Callers must not mutate cached values — return copies instead.
+
+    Args:
+        ttl: Seconds an entry stays valid. 0 disables caching.
+        maxsize: Maximum number of entries kept (least recently used evicted).
+    """
+
+    def __init__(self, ttl: float = 5.0, maxsize: int = 256) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache value under key."""
+        if self._ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def evict(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches predicate."""
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss, and size counters."""
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._entries)}
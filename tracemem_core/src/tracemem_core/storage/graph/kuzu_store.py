@@ -10,6 +10,7 @@ from uuid import UUID
 
 import kuzu
 
+from tracemem_core._json import json_loads
 from tracemem_core.models.edges import EdgeBase, Relationship, VersionOf
 from tracemem_core.models.nodes import (
     AgentText,
@@ -28,6 +29,7 @@ from tracemem_core.retrieval.results import (
     ToolUse,
     UserTextInfo,
 )
+from tracemem_core.storage.graph.cache import ReadCache
 
 logger = logging.getLogger(__name__)
 
@@ -56,12 +58,20 @@ class KuzuGraphStore:
 
     Uses an embedded Kùzu database that requires no external server.
     All operations are synchronous in Kùzu and wrapped with asyncio.to_thread().
+
+    Args:
+        db_path: Directory holding the Kùzu database.
+        read_cache_ttl: Seconds to cache get_node_context and
+            get_resource_conversations results in this process. Writes made
+            through this store clear it; writes from elsewhere stay invisible
+            for up to this long. 0 (default) disables the cache.
     """
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, read_cache_ttl: float = 0.0) -> None:
         self._db_path = db_path
         self._db: kuzu.Database | None = None
         self._conn: kuzu.Connection | None = None
+        self._read_cache = ReadCache(ttl=read_cache_ttl)
 
     async def connect(self) -> None:
         """Connect to the Kùzu database."""
@@ -178,6 +188,7 @@ class KuzuGraphStore:
         """Create a node. Dispatches based on type."""
         if not self._conn:
             raise RuntimeError("Not connected")
+        self._read_cache.clear()
 
         if isinstance(node, UserText):
             return await self._create_user_text(node)
@@ -194,6 +205,7 @@ class KuzuGraphStore:
         """Create an edge. Dispatches based on type."""
         if not self._conn:
             raise RuntimeError("Not connected")
+        self._read_cache.clear()
 
         if isinstance(edge, Relationship):
             return await self._create_relationship(edge)
@@ -202,6 +214,18 @@ class KuzuGraphStore:
         else:
             raise TypeError(f"Unknown edge type: {type(edge)}")
 
+    async def create_nodes(self, nodes: list[NodeBase]) -> list[NodeBase]:
+        """Create many nodes.
+
+        Kùzu runs in-process, so there is no round trip to amortize and nodes
+        are created one at a time with the same semantics as ``create_node``.
+        """
+        return [await self.create_node(node) for node in nodes]
+
+    async def create_edges(self, edges: list[EdgeBase]) -> list[EdgeBase]:
+        """Create many edges, one at a time (see ``create_nodes``)."""
+        return [await self.create_edge(edge) for edge in edges]
+
     # =========================================================================
     # Private node creation methods
     # =========================================================================
@@ -223,7 +247,7 @@ class KuzuGraphStore:
                 })
                 """,
                 {
-                    "id": str(node.id),
+                    "id": node.id_str,
                     "text": node.text,
                     "conversation_id": node.conversation_id,
                     "turn_index": node.turn_index,
@@ -254,7 +278,7 @@ class KuzuGraphStore:
                 })
                 """,
                 {
-                    "id": str(node.id),
+                    "id": node.id_str,
                     "text": node.text,
                     "conversation_id": node.conversation_id,
                     "turn_index": node.turn_index,
@@ -284,7 +308,7 @@ class KuzuGraphStore:
                 })
                 """,
                 {
-                    "id": str(node.id),
+                    "id": node.id_str,
                     "content_hash": node.content_hash,
                     "uri": node.uri,
                     "conversation_id": node.conversation_id,
@@ -331,7 +355,7 @@ class KuzuGraphStore:
                 })
                 """,
                 {
-                    "id": str(node.id),
+                    "id": node.id_str,
                     "uri": node.uri,
                     "conversation_id": node.conversation_id,
                     "current_content_hash": node.current_content_hash or "",
@@ -372,6 +396,7 @@ class KuzuGraphStore:
         """Update the current content hash of a Resource."""
         if not self._conn:
             raise RuntimeError("Not connected")
+        self._read_cache.clear()
 
         def _update(conn: kuzu.Connection) -> None:
             conn.execute(
@@ -451,7 +476,7 @@ class KuzuGraphStore:
             params = {
                 "source_id": str(edge.source_id),
                 "target_id": str(edge.target_id),
-                "id": str(edge.id),
+                "id": edge.id_str,
                 "conversation_id": edge.conversation_id,
                 "created_at": edge.created_at.isoformat(),
                 "properties": json.dumps(edge.properties),
@@ -501,7 +526,7 @@ class KuzuGraphStore:
                 {
                     "source_id": str(edge.source_id),
                     "target_id": str(edge.target_id),
-                    "id": str(edge.id),
+                    "id": edge.id_str,
                     "tool_name": tool_name,
                     "conversation_id": edge.conversation_id,
                     "created_at": edge.created_at.isoformat(),
@@ -524,7 +549,7 @@ class KuzuGraphStore:
                 {
                     "version_id": str(edge.version_id),
                     "resource_id": str(edge.resource_id),
-                    "id": str(edge.id),
+                    "id": edge.id_str,
                     "created_at": edge.created_at.isoformat(),
                 },
             )
@@ -604,7 +629,7 @@ class KuzuGraphStore:
             )
             rec = _single(result)
             if rec:
-                tool_uses_data = json.loads(rec.get("a.tool_uses", "[]") or "[]")
+                tool_uses_data = json_loads(rec.get("a.tool_uses", "[]") or "[]")
                 tool_uses = [ToolUseRecord(**tu) for tu in tool_uses_data]
                 return AgentText(
                     id=UUID(rec["a.id"]),
@@ -658,7 +683,7 @@ class KuzuGraphStore:
                     last_accessed_at=datetime.fromisoformat(rec["accessed"]),
                 )
             else:
-                tool_uses_data = json.loads(rec.get("tool_uses") or "[]")
+                tool_uses_data = json_loads(rec.get("tool_uses") or "[]")
                 tool_uses = [ToolUseRecord(**tu) for tu in tool_uses_data]
                 return AgentText(
                     id=UUID(rec["id"]),
@@ -734,7 +759,7 @@ class KuzuGraphStore:
                     last_accessed_at=datetime.fromisoformat(rec["accessed"]),
                 )
             else:
-                tool_uses_data = json.loads(rec.get("tool_uses") or "[]")
+                tool_uses_data = json_loads(rec.get("tool_uses") or "[]")
                 tool_uses = [ToolUseRecord(**tu) for tu in tool_uses_data]
                 return AgentText(
                     id=UUID(rec["id"]),
@@ -753,6 +778,7 @@ class KuzuGraphStore:
         if not self._conn or not node_ids:
             return
 
+        self._evict_last_accessed_sorted()
         now = datetime.now(UTC).isoformat()
 
         def _update(conn: kuzu.Connection) -> None:
@@ -771,27 +797,51 @@ class KuzuGraphStore:
     # Retrieval query operations
     # =========================================================================
 
+    def cache_stats(self) -> dict[str, int]:
+        """Return hit, miss, and size counters of the read cache."""
+        return self._read_cache.stats()
+
+    def _evict_last_accessed_sorted(self) -> None:
+        """Drop cached conversation lists whose order depends on last access."""
+        self._read_cache.evict(
+            lambda key: (
+                key[0] == "get_resource_conversations" and key[3] != "created_at"
+            )
+        )
+
     async def get_node_context(self, node_id: UUID) -> ContextResult:
         """Get full context for a UserText node."""
         if not self._conn:
             raise RuntimeError("Not connected")
 
+        cache_key = ("get_node_context", node_id)
+        cached = self._read_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         logger.debug("get_node_context node_id=%s", node_id)
 
         def _get(conn: kuzu.Connection) -> ContextResult:
             context = ContextResult()
 
-            # Get user text and agent text
+            # One query: u/a columns repeat on every row, and each row with a
+            # tool_name carries one tool use
             result = conn.execute(
                 "MATCH (u:UserText) WHERE u.id = $id "
                 "OPTIONAL MATCH (u)-[:MESSAGE]->(a:AgentText) "
-                "RETURN u.id, u.text, u.conversation_id, a.id, a.text",
+                "OPTIONAL MATCH (a)-[r:TOOL_USE]->(v:ResourceVersion) "
+                "OPTIONAL MATCH (v)-[:VERSION_OF]->(res:Resource) "
+                "RETURN u.id, u.text, u.conversation_id, a.id, a.text, "
+                "r.tool_name as tool_name, r.properties as props, "
+                "v.id as v_id, v.uri as v_uri, v.content_hash as v_hash, "
+                "res.id as res_id, res.uri as res_uri",
                 {"id": str(node_id)},
             )
-            rec = _single(result)
-            if not rec:
+            records = _result_to_dicts(result)
+            if not records:
                 return context
 
+            rec = records[0]
             if rec.get("u.id"):
                 context.user_text = UserTextInfo(
                     id=rec["u.id"],
@@ -805,22 +855,12 @@ class KuzuGraphStore:
                     text=rec["a.text"],
                 )
 
-            # Get tool uses via TOOL_USE edges
-            result = conn.execute(
-                "MATCH (u:UserText)-[:MESSAGE]->(a:AgentText) WHERE u.id = $id "
-                "MATCH (a)-[r:TOOL_USE]->(v:ResourceVersion) "
-                "OPTIONAL MATCH (v)-[:VERSION_OF]->(res:Resource) "
-                "RETURN r.tool_name as tool_name, r.properties as props, "
-                "v.id as v_id, v.uri as v_uri, v.content_hash as v_hash, "
-                "res.id as res_id, res.uri as res_uri",
-                {"id": str(node_id)},
-            )
-            records = _result_to_dicts(result)
-
             for rec in records:
+                if rec["tool_name"] is None:
+                    continue
                 props = rec["props"]
                 if isinstance(props, str):
-                    props = json.loads(props)
+                    props = json_loads(props)
                 tool_use = ToolUse(
                     tool_name=rec["tool_name"],
                     properties=props or {},
@@ -844,6 +884,8 @@ class KuzuGraphStore:
         logger.debug(
             "get_node_context node_id=%s tool_uses=%d", node_id, len(result.tool_uses)
         )
+        if result.user_text is not None:
+            self._read_cache.set(cache_key, result.model_copy(deep=True))
         return result
 
     async def get_resource_conversations(
@@ -859,6 +901,18 @@ class KuzuGraphStore:
         if not self._conn:
             raise RuntimeError("Not connected")
 
+        cache_key = (
+            "get_resource_conversations",
+            uri,
+            limit,
+            sort_by,
+            sort_order,
+            exclude_conversation_id,
+        )
+        cached = self._read_cache.get(cache_key)
+        if cached is not None:
+            return [ref.model_copy() for ref in cached]
+
         logger.debug(
             "get_resource_conversations uri=%s limit=%d sort_by=%s sort_order=%s exclude=%s",
             uri,
@@ -921,6 +975,7 @@ class KuzuGraphStore:
 
         result = await asyncio.to_thread(_get, self._conn)
         logger.debug("get_resource_conversations uri=%s results=%d", uri, len(result))
+        self._read_cache.set(cache_key, [ref.model_copy() for ref in result])
         return result
 
     async def get_trajectory_nodes(
@@ -931,41 +986,62 @@ class KuzuGraphStore:
     ) -> list[dict[str, Any]]:
         """Get raw nodes reachable from a UserText via MESSAGE edges.
 
+        Traversal stops at the next UserText: paths may end at one but never
+        pass through it, so later turns are not fetched.
+
         Returns list of dicts with 'n' (node props dict) and 'node_labels' (list[str]).
         For Kùzu, label() returns a string; we wrap it in a list for compatibility
         with the Neo4j format expected by callers.
         """
+        logger.debug("get_trajectory_nodes node_id=%s max_depth=%d", node_id, max_depth)
+        batch = await self.get_trajectory_nodes_batch([node_id], max_depth=max_depth)
+        result = batch[str(node_id)]
+        logger.debug("get_trajectory_nodes node_id=%s results=%d", node_id, len(result))
+        return result
+
+    async def get_trajectory_nodes_batch(
+        self,
+        node_ids: list[UUID],
+        *,
+        max_depth: int = 100,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get trajectory nodes for several UserTexts in one query.
+
+        Returns a dict mapping each requested node id (as a string) to the
+        records get_trajectory_nodes would return for it.
+        """
         if not self._conn:
             raise RuntimeError("Not connected")
 
-        logger.debug("get_trajectory_nodes node_id=%s max_depth=%d", node_id, max_depth)
+        # The query runs once per listed id; repeats would duplicate rows
+        ids = list(dict.fromkeys(str(node_id) for node_id in node_ids))
 
-        def _get(conn: kuzu.Connection) -> list[dict[str, Any]]:
+        def _get(conn: kuzu.Connection) -> dict[str, list[dict[str, Any]]]:
             # Kùzu caps variable-length paths at 30
             depth = min(int(max_depth), 30)
             result = conn.execute(
-                f"MATCH (start:UserText)-[:MESSAGE*0..{depth}]->(n) "
-                "WHERE start.id = $id AND n.conversation_id = start.conversation_id "
-                "RETURN n.id as id, n.text as text, n.conversation_id as conversation_id, "
+                "UNWIND $ids AS start_id "
+                f"MATCH (start:UserText)-[:MESSAGE*0..{depth} "
+                "(r, m | WHERE label(m) <> 'UserText')]->(n) "
+                "WHERE start.id = start_id "
+                "AND n.conversation_id = start.conversation_id "
+                "RETURN start_id, n.id as id, n.text as text, "
+                "n.conversation_id as conversation_id, "
                 "n.turn_index as turn_index, n.created_at as created_at, "
                 "n.last_accessed_at as last_accessed_at, n.tool_uses as tool_uses, "
                 "label(n) as node_label "
                 "ORDER BY n.created_at ASC",
-                {"id": str(node_id)},
+                {"ids": ids},
             )
-            rows = _result_to_dicts(result)
-
+            records: dict[str, list[dict[str, Any]]] = {node_id: [] for node_id in ids}
             # Deduplicate by id (variable-length paths can yield duplicates)
-            seen: set[str] = set()
-            unique_rows: list[dict[str, Any]] = []
-            for row in rows:
-                if row["id"] not in seen:
-                    seen.add(row["id"])
-                    unique_rows.append(row)
-
-            # Convert to the format expected by callers (matching Neo4j format)
-            records = []
-            for row in unique_rows:
+            seen: set[tuple[str, str]] = set()
+            for row in _result_to_dicts(result):
+                if (row["start_id"], row["id"]) in seen:
+                    continue
+                seen.add((row["start_id"], row["id"]))
+
+                # Convert to the format expected by callers (matching Neo4j format)
                 node_props = {
                     "id": row["id"],
                     "text": row["text"],
@@ -976,7 +1052,7 @@ class KuzuGraphStore:
                 }
                 if row.get("tool_uses"):
                     node_props["tool_uses"] = row["tool_uses"]
-                records.append(
+                records[row["start_id"]].append(
                     {
                         "n": node_props,
                         "node_labels": [row["node_label"]],
@@ -984,9 +1060,7 @@ class KuzuGraphStore:
                 )
             return records
 
-        result = await asyncio.to_thread(_get, self._conn)
-        logger.debug("get_trajectory_nodes node_id=%s results=%d", node_id, len(result))
-        return result
+        return await asyncio.to_thread(_get, self._conn)
 
     # =========================================================================
     # Raw Cypher execution
@@ -1005,6 +1079,8 @@ class KuzuGraphStore:
         """
         if not self._conn:
             raise RuntimeError("Not connected")
+        # Raw queries may write, so cached reads can no longer be trusted
+        self._read_cache.clear()
 
         def _execute(conn: kuzu.Connection) -> list[dict[str, Any]]:
             result = conn.execute(query, parameters or {})
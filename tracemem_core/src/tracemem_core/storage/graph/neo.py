@@ -1,11 +1,21 @@
 import json
 import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
 from uuid import UUID
 
-from neo4j import AsyncGraphDatabase, AsyncDriver
+from neo4j import (
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncSession,
+    Record,
+)
 
+from tracemem_core._json import json_loads
 from tracemem_core.models.edges import EdgeBase, Relationship, VersionOf
 from tracemem_core.models.nodes import (
     AgentText,
@@ -24,12 +34,90 @@ from tracemem_core.retrieval.results import (
     ToolUse,
     UserTextInfo,
 )
+from tracemem_core.storage.graph.cache import ReadCache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Relationship.properties keys are stored as native relationship properties
+# under this prefix so they cannot clash with id/conversation_id/created_at.
+PROPERTY_PREFIX = "prop_"
+
+
+def _edge_properties(properties: dict[str, Any]) -> dict[str, Any]:
+    """Map Relationship.properties onto Neo4j relationship properties.
+
+    Scalar values are stored natively as ``prop_<key>``. Neo4j has no
+    map-valued or null properties, so a dict holding anything else is kept
+    whole as a JSON string under ``properties``.
+    """
+    if all(isinstance(v, str | int | float | bool) for v in properties.values()):
+        return {f"{PROPERTY_PREFIX}{k}": v for k, v in properties.items()}
+    return {"properties": json.dumps(properties)}
+
+
+def _read_edge_properties(stored: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild Relationship.properties from stored relationship properties."""
+    if isinstance(stored.get("properties"), str):
+        return json_loads(stored["properties"])
+    return {
+        k.removeprefix(PROPERTY_PREFIX): v
+        for k, v in stored.items()
+        if k.startswith(PROPERTY_PREFIX)
+    }
+
+
+async def _consume(tx: AsyncManagedTransaction, query: str, **params: Any) -> None:
+    """Run one statement in a managed transaction and discard its result."""
+    result = await tx.run(query, **params)
+    await result.consume()
+
+
+# Fixed statements shared by every store instance. Values are always bound as
+# parameters, so Neo4j sees one query text per statement and reuses its plan.
+QUERIES: dict[str, str] = {
+    "get_user_text": "MATCH (n:UserText {id: $id}) RETURN n",
+    "get_resource_by_uri": "MATCH (r:Resource {uri: $uri}) RETURN r",
+    "update_resource_hash": (
+        "MATCH (r:Resource {uri: $uri}) "
+        "SET r.current_content_hash = $content_hash, "
+        "r.last_accessed_at = $last_accessed_at"
+    ),
+    "get_resource_version_by_hash": (
+        "MATCH (v:ResourceVersion {uri: $uri, content_hash: $content_hash}) "
+        "RETURN v LIMIT 1"
+    ),
+    "create_version_of": (
+        "MATCH (v:ResourceVersion {id: $version_id}) "
+        "MATCH (r:Resource {id: $resource_id}) "
+        "CREATE (v)-[:VERSION_OF {id: $id, created_at: $created_at}]->(r)"
+    ),
+    "update_last_accessed": (
+        "MATCH (n) WHERE n.id IN $ids SET n.last_accessed_at = $now"
+    ),
+}
+
 
 class Neo4jGraphStore:
-    """Neo4j implementation of GraphStore."""
+    """Neo4j implementation of GraphStore.
+
+    Args:
+        uri: Bolt URI of the Neo4j server.
+        user: Username for authentication.
+        password: Password for authentication.
+        database: Database name.
+        namespace: Optional namespace for multi-user isolation.
+        max_connection_pool_size: Maximum connections held by the driver.
+        connection_acquisition_timeout: Seconds to wait for a pooled
+            connection before failing.
+        max_transaction_retry_time: Seconds the driver spends retrying
+            transient transaction failures.
+        read_cache_ttl: Seconds to cache get_node_context and
+            get_resource_conversations results in this process. Writes made
+            through this store clear it; writes from elsewhere stay invisible
+            for up to this long. 0 (default) disables the cache.
+    """
 
     def __init__(
         self,
@@ -38,12 +126,21 @@ class Neo4jGraphStore:
         password: str = "password",
         database: str = "neo4j",
         namespace: str | None = None,
+        max_connection_pool_size: int = 50,
+        connection_acquisition_timeout: float = 5.0,
+        max_transaction_retry_time: float = 5.0,
+        read_cache_ttl: float = 0.0,
     ) -> None:
         self._uri = uri
         self._user = user
         self._password = password
         self._database = database
         self._namespace = namespace
+        self._max_connection_pool_size = max_connection_pool_size
+        self._connection_acquisition_timeout = connection_acquisition_timeout
+        self._max_transaction_retry_time = max_transaction_retry_time
+        # One cache per store, so entries never cross namespaces
+        self._read_cache = ReadCache(ttl=read_cache_ttl)
         self._driver: AsyncDriver | None = None
 
     async def connect(self) -> None:
@@ -51,6 +148,9 @@ class Neo4jGraphStore:
         self._driver = AsyncGraphDatabase.driver(
             self._uri,
             auth=(self._user, self._password),
+            max_connection_pool_size=self._max_connection_pool_size,
+            connection_acquisition_timeout=self._connection_acquisition_timeout,
+            max_transaction_retry_time=self._max_transaction_retry_time,
         )
         await self._driver.verify_connectivity()
 
@@ -60,58 +160,92 @@ class Neo4jGraphStore:
             await self._driver.close()
             self._driver = None
 
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        """Yield a short-lived session for one operation.
+
+        Sessions are cheap and not safe for concurrent use, while the driver
+        pools the underlying connections; a session per operation lets
+        concurrent calls run in parallel. Results must be consumed inside
+        the block.
+        """
+        if not self._driver:
+            raise RuntimeError("Not connected")
+        async with self._driver.session(database=self._database) as session:
+            yield session
+
+    async def _write(
+        self,
+        work: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run work(tx, *args, **kwargs) in one managed write transaction.
+
+        The driver retries work on transient failures, so it must consume its
+        results inside the transaction and be safe to run more than once.
+        """
+        async with self._session() as session:
+            return await session.execute_write(work, *args, **kwargs)
+
     async def initialize_schema(self) -> None:
         """Create constraints and indexes."""
         if not self._driver:
             raise RuntimeError("Not connected")
 
-        async with self._driver.session(database=self._database) as session:
+        await self._write(self._create_schema)
+        # Block until new indexes are ONLINE so the first reads after setup
+        # can already use them
+        async with self._session() as session:
+            result = await session.run("CALL db.awaitIndexes(30)")
+            await result.consume()
+
+    async def _create_schema(self, tx: AsyncManagedTransaction) -> None:
+        """Create every constraint and index inside one transaction."""
+        statements = [
             # Resource URI uniqueness constraint
-            await session.run(
+            (
                 "CREATE CONSTRAINT resource_uri IF NOT EXISTS "
                 "FOR (r:Resource) REQUIRE r.uri IS UNIQUE"
-            )
+            ),
             # Index on ResourceVersion content_hash
-            await session.run(
+            (
                 "CREATE INDEX resource_version_hash IF NOT EXISTS "
                 "FOR (v:ResourceVersion) ON (v.content_hash)"
-            )
+            ),
             # Index on UserText conversation_id
-            await session.run(
+            (
                 "CREATE INDEX user_text_conversation IF NOT EXISTS "
                 "FOR (n:UserText) ON (n.conversation_id)"
-            )
+            ),
             # Index on node id for all node types
-            await session.run(
-                "CREATE INDEX user_text_id IF NOT EXISTS FOR (n:UserText) ON (n.id)"
-            )
-            await session.run(
-                "CREATE INDEX agent_text_id IF NOT EXISTS FOR (n:AgentText) ON (n.id)"
-            )
-            await session.run(
+            "CREATE INDEX user_text_id IF NOT EXISTS FOR (n:UserText) ON (n.id)",
+            "CREATE INDEX agent_text_id IF NOT EXISTS FOR (n:AgentText) ON (n.id)",
+            (
                 "CREATE INDEX resource_version_id IF NOT EXISTS "
                 "FOR (n:ResourceVersion) ON (n.id)"
-            )
-            await session.run(
-                "CREATE INDEX resource_id IF NOT EXISTS FOR (n:Resource) ON (n.id)"
-            )
+            ),
+            "CREATE INDEX resource_id IF NOT EXISTS FOR (n:Resource) ON (n.id)",
             # Turn index for UserText and AgentText
-            await session.run(
+            (
                 "CREATE INDEX user_text_turn IF NOT EXISTS "
                 "FOR (n:UserText) ON (n.turn_index)"
-            )
-            await session.run(
+            ),
+            (
                 "CREATE INDEX agent_text_turn IF NOT EXISTS "
                 "FOR (n:AgentText) ON (n.turn_index)"
-            )
-            # Namespace index for multi-user isolation
-            if self._namespace:
-                for label in ("UserText", "AgentText", "ResourceVersion", "Resource"):
-                    index_name = f"{label.lower()}_namespace"
-                    await session.run(
-                        f"CREATE INDEX {index_name} IF NOT EXISTS "
-                        f"FOR (n:{label}) ON (n.namespace)"
-                    )
+            ),
+        ]
+        # Namespace index for multi-user isolation
+        if self._namespace:
+            for label in ("UserText", "AgentText", "ResourceVersion", "Resource"):
+                index_name = f"{label.lower()}_namespace"
+                statements.append(
+                    f"CREATE INDEX {index_name} IF NOT EXISTS "
+                    f"FOR (n:{label}) ON (n.namespace)"
+                )
+        for statement in statements:
+            await _consume(tx, statement)
 
     @property
     def _ns_filter(self) -> str:
@@ -141,6 +275,7 @@ class Neo4jGraphStore:
         """Create a node. Dispatches based on type."""
         if not self._driver:
             raise RuntimeError("Not connected")
+        self._read_cache.clear()
 
         if isinstance(node, UserText):
             return await self._create_user_text(node)
@@ -157,6 +292,7 @@ class Neo4jGraphStore:
         """Create an edge. Dispatches based on type."""
         if not self._driver:
             raise RuntimeError("Not connected")
+        self._read_cache.clear()
 
         if isinstance(edge, Relationship):
             return await self._create_relationship(edge)
@@ -165,6 +301,159 @@ class Neo4jGraphStore:
         else:
             raise TypeError(f"Unknown edge type: {type(edge)}")
 
+    async def create_nodes(self, nodes: list[NodeBase]) -> list[NodeBase]:
+        """Create many nodes with one UNWIND statement per node label.
+
+        Resources are merged on uri like ``create_node``, so the returned list
+        holds the stored Resource wherever one already existed.
+        """
+        if not self._driver:
+            raise RuntimeError("Not connected")
+        self._read_cache.clear()
+
+        groups: dict[str, list[int]] = defaultdict(list)
+        rows: list[dict[str, Any]] = []
+        for i, node in enumerate(nodes):
+            label, row = self._node_row(node)
+            groups[label].append(i)
+            rows.append(row)
+
+        async def work(tx: AsyncManagedTransaction) -> list[NodeBase]:
+            created = list(nodes)
+            for label, indices in groups.items():
+                params = [rows[i] for i in indices]
+                if label == "Resource":
+                    result = await tx.run(
+                        """
+                        UNWIND $rows AS row
+                        MERGE (r:Resource {uri: row.uri})
+                        ON CREATE SET r += row
+                        RETURN r
+                        """,
+                        rows=params,
+                    )
+                    records = await result.data()
+                    for i, rec in zip(indices, records):
+                        r = rec["r"]
+                        created[i] = Resource(
+                            id=UUID(r["id"]),
+                            uri=r["uri"],
+                            conversation_id=r["conversation_id"],
+                            current_content_hash=r.get("current_content_hash"),
+                            created_at=datetime.fromisoformat(r["created_at"]),
+                            last_accessed_at=datetime.fromisoformat(
+                                r["last_accessed_at"]
+                            ),
+                        )
+                else:
+                    # Label comes from the fixed set in _node_row
+                    await _consume(
+                        tx,
+                        f"UNWIND $rows AS row CREATE (n:{label}) SET n = row",
+                        rows=params,
+                    )
+            return created
+
+        # All labels commit together in one transaction
+        return await self._write(work)
+
+    async def create_edges(self, edges: list[EdgeBase]) -> list[EdgeBase]:
+        """Create many edges with one UNWIND statement per relationship type."""
+        if not self._driver:
+            raise RuntimeError("Not connected")
+        self._read_cache.clear()
+
+        relationships: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        versions: list[dict[str, Any]] = []
+        for edge in edges:
+            if isinstance(edge, Relationship):
+                rel_type = edge.relationship_type.upper().replace(" ", "_")
+                relationships[rel_type].append(
+                    {
+                        "source_id": str(edge.source_id),
+                        "target_id": str(edge.target_id),
+                        "id": edge.id_str,
+                        "conversation_id": edge.conversation_id,
+                        "created_at": edge.created_at.isoformat(),
+                        "properties": _edge_properties(edge.properties),
+                    }
+                )
+            elif isinstance(edge, VersionOf):
+                versions.append(
+                    {
+                        "version_id": str(edge.version_id),
+                        "resource_id": str(edge.resource_id),
+                        "id": edge.id_str,
+                        "created_at": edge.created_at.isoformat(),
+                    }
+                )
+            else:
+                raise TypeError(f"Unknown edge type: {type(edge)}")
+
+        async def work(tx: AsyncManagedTransaction) -> None:
+            for rel_type, rows in relationships.items():
+                # Dynamic relationship type requires string interpolation
+                await _consume(
+                    tx,
+                    f"""
+                    UNWIND $rows AS row
+                    MATCH (source {{id: row.source_id}})
+                    MATCH (target {{id: row.target_id}})
+                    CREATE (source)-[r:{rel_type} {{
+                        id: row.id,
+                        conversation_id: row.conversation_id,
+                        created_at: row.created_at
+                    }}]->(target)
+                    SET r += row.properties
+                    """,
+                    rows=rows,
+                )
+            if versions:
+                await _consume(
+                    tx,
+                    """
+                    UNWIND $rows AS row
+                    MATCH (v:ResourceVersion {id: row.version_id})
+                    MATCH (r:Resource {id: row.resource_id})
+                    CREATE (v)-[:VERSION_OF {
+                        id: row.id,
+                        created_at: row.created_at
+                    }]->(r)
+                    """,
+                    rows=versions,
+                )
+
+        await self._write(work)
+        return list(edges)
+
+    def _node_row(self, node: NodeBase) -> tuple[str, dict[str, Any]]:
+        """Return the label and property map used to store a node."""
+        row: dict[str, Any] = {
+            "id": node.id_str,
+            "conversation_id": node.conversation_id,
+            "created_at": node.created_at.isoformat(),
+            "last_accessed_at": node.last_accessed_at.isoformat(),
+            **self._ns_params,
+        }
+        if isinstance(node, UserText):
+            row.update(text=node.text, turn_index=node.turn_index)
+            return "UserText", row
+        elif isinstance(node, AgentText):
+            row.update(
+                text=node.text,
+                turn_index=node.turn_index,
+                tool_uses=json.dumps([tu.model_dump() for tu in node.tool_uses]),
+            )
+            return "AgentText", row
+        elif isinstance(node, ResourceVersion):
+            row.update(content_hash=node.content_hash, uri=node.uri)
+            return "ResourceVersion", row
+        elif isinstance(node, Resource):
+            row.update(uri=node.uri, current_content_hash=node.current_content_hash)
+            return "Resource", row
+        else:
+            raise TypeError(f"Unknown node type: {type(node)}")
+
     # =========================================================================
     # Private node creation methods
     # =========================================================================
@@ -172,27 +461,27 @@ class Neo4jGraphStore:
     async def _create_user_text(self, node: UserText) -> UserText:
         """Create a UserText node."""
         assert self._driver is not None  # Checked by create_node
-        async with self._driver.session(database=self._database) as session:
-            await session.run(
-                f"""
-                CREATE (n:UserText {{
-                    id: $id,
-                    text: $text,
-                    conversation_id: $conversation_id,
-                    turn_index: $turn_index,
-                    created_at: $created_at,
-                    last_accessed_at: $last_accessed_at
-                }})
-                {"SET n.namespace = $namespace" if self._namespace else ""}
-                """,
-                id=str(node.id),
-                text=node.text,
-                conversation_id=node.conversation_id,
-                turn_index=node.turn_index,
-                created_at=node.created_at.isoformat(),
-                last_accessed_at=node.last_accessed_at.isoformat(),
-                **self._ns_params,
-            )
+        await self._write(
+            _consume,
+            f"""
+            CREATE (n:UserText {{
+                id: $id,
+                text: $text,
+                conversation_id: $conversation_id,
+                turn_index: $turn_index,
+                created_at: $created_at,
+                last_accessed_at: $last_accessed_at
+            }})
+            {"SET n.namespace = $namespace" if self._namespace else ""}
+            """,
+            id=node.id_str,
+            text=node.text,
+            conversation_id=node.conversation_id,
+            turn_index=node.turn_index,
+            created_at=node.created_at.isoformat(),
+            last_accessed_at=node.last_accessed_at.isoformat(),
+            **self._ns_params,
+        )
         return node
 
     async def _create_agent_text(self, node: AgentText) -> AgentText:
@@ -202,63 +491,64 @@ class Neo4jGraphStore:
         # Serialize tool_uses to JSON for Neo4j storage
         tool_uses_json = json.dumps([tu.model_dump() for tu in node.tool_uses])
 
-        async with self._driver.session(database=self._database) as session:
-            await session.run(
-                f"""
-                CREATE (n:AgentText {{
-                    id: $id,
-                    text: $text,
-                    conversation_id: $conversation_id,
-                    turn_index: $turn_index,
-                    tool_uses: $tool_uses,
-                    created_at: $created_at,
-                    last_accessed_at: $last_accessed_at
-                }})
-                {"SET n.namespace = $namespace" if self._namespace else ""}
-                """,
-                id=str(node.id),
-                text=node.text,
-                conversation_id=node.conversation_id,
-                turn_index=node.turn_index,
-                tool_uses=tool_uses_json,
-                created_at=node.created_at.isoformat(),
-                last_accessed_at=node.last_accessed_at.isoformat(),
-                **self._ns_params,
-            )
+        await self._write(
+            _consume,
+            f"""
+            CREATE (n:AgentText {{
+                id: $id,
+                text: $text,
+                conversation_id: $conversation_id,
+                turn_index: $turn_index,
+                tool_uses: $tool_uses,
+                created_at: $created_at,
+                last_accessed_at: $last_accessed_at
+            }})
+            {"SET n.namespace = $namespace" if self._namespace else ""}
+            """,
+            id=node.id_str,
+            text=node.text,
+            conversation_id=node.conversation_id,
+            turn_index=node.turn_index,
+            tool_uses=tool_uses_json,
+            created_at=node.created_at.isoformat(),
+            last_accessed_at=node.last_accessed_at.isoformat(),
+            **self._ns_params,
+        )
         return node
 
     async def _create_resource_version(self, node: ResourceVersion) -> ResourceVersion:
         """Create a ResourceVersion node."""
         assert self._driver is not None  # Checked by create_node
-        async with self._driver.session(database=self._database) as session:
-            await session.run(
-                f"""
-                CREATE (n:ResourceVersion {{
-                    id: $id,
-                    content_hash: $content_hash,
-                    uri: $uri,
-                    conversation_id: $conversation_id,
-                    created_at: $created_at,
-                    last_accessed_at: $last_accessed_at
-                }})
-                {"SET n.namespace = $namespace" if self._namespace else ""}
-                """,
-                id=str(node.id),
-                content_hash=node.content_hash,
-                uri=node.uri,
-                conversation_id=node.conversation_id,
-                created_at=node.created_at.isoformat(),
-                last_accessed_at=node.last_accessed_at.isoformat(),
-                **self._ns_params,
-            )
+        await self._write(
+            _consume,
+            f"""
+            CREATE (n:ResourceVersion {{
+                id: $id,
+                content_hash: $content_hash,
+                uri: $uri,
+                conversation_id: $conversation_id,
+                created_at: $created_at,
+                last_accessed_at: $last_accessed_at
+            }})
+            {"SET n.namespace = $namespace" if self._namespace else ""}
+            """,
+            id=node.id_str,
+            content_hash=node.content_hash,
+            uri=node.uri,
+            conversation_id=node.conversation_id,
+            created_at=node.created_at.isoformat(),
+            last_accessed_at=node.last_accessed_at.isoformat(),
+            **self._ns_params,
+        )
         return node
 
     async def _create_resource(self, node: Resource) -> Resource:
         """Create or get a Resource hypernode."""
         assert self._driver is not None  # Checked by create_node
         ns_on_create = ", r.namespace = $namespace" if self._namespace else ""
-        async with self._driver.session(database=self._database) as session:
-            result = await session.run(
+
+        async def work(tx: AsyncManagedTransaction) -> Record | None:
+            result = await tx.run(
                 f"""
                 MERGE (r:Resource {{uri: $uri}})
                 ON CREATE SET
@@ -271,24 +561,26 @@ class Neo4jGraphStore:
                 RETURN r
                 """,
                 uri=node.uri,
-                id=str(node.id),
+                id=node.id_str,
                 conversation_id=node.conversation_id,
                 current_content_hash=node.current_content_hash,
                 created_at=node.created_at.isoformat(),
                 last_accessed_at=node.last_accessed_at.isoformat(),
                 **self._ns_params,
             )
-            record = await result.single()
-            if record:
-                r = record["r"]
-                return Resource(
-                    id=UUID(r["id"]),
-                    uri=r["uri"],
-                    conversation_id=r["conversation_id"],
-                    current_content_hash=r.get("current_content_hash"),
-                    created_at=datetime.fromisoformat(r["created_at"]),
-                    last_accessed_at=datetime.fromisoformat(r["last_accessed_at"]),
-                )
+            return await result.single()
+
+        record = await self._write(work)
+        if record:
+            r = record["r"]
+            return Resource(
+                id=UUID(r["id"]),
+                uri=r["uri"],
+                conversation_id=r["conversation_id"],
+                current_content_hash=r.get("current_content_hash"),
+                created_at=datetime.fromisoformat(r["created_at"]),
+                last_accessed_at=datetime.fromisoformat(r["last_accessed_at"]),
+            )
         return node
 
     async def get_resource_by_uri(self, uri: str) -> Resource | None:
@@ -296,11 +588,8 @@ class Neo4jGraphStore:
         if not self._driver:
             raise RuntimeError("Not connected")
 
-        async with self._driver.session(database=self._database) as session:
-            result = await session.run(
-                "MATCH (r:Resource {uri: $uri}) RETURN r",
-                uri=uri,
-            )
+        async with self._session() as session:
+            result = await session.run(QUERIES["get_resource_by_uri"], uri=uri)
             record = await result.single()
             if record:
                 r = record["r"]
@@ -318,18 +607,15 @@ class Neo4jGraphStore:
         """Update the current content hash of a Resource."""
         if not self._driver:
             raise RuntimeError("Not connected")
-
-        async with self._driver.session(database=self._database) as session:
-            await session.run(
-                """
-                MATCH (r:Resource {uri: $uri})
-                SET r.current_content_hash = $content_hash,
-                    r.last_accessed_at = $last_accessed_at
-                """,
-                uri=uri,
-                content_hash=content_hash,
-                last_accessed_at=datetime.now(UTC).isoformat(),
-            )
+        self._read_cache.clear()
+
+        await self._write(
+            _consume,
+            QUERIES["update_resource_hash"],
+            uri=uri,
+            content_hash=content_hash,
+            last_accessed_at=datetime.now(UTC).isoformat(),
+        )
 
     async def get_resource_version_by_hash(
         self, uri: str, content_hash: str
@@ -338,13 +624,9 @@ class Neo4jGraphStore:
         if not self._driver:
             raise RuntimeError("Not connected")
 
-        async with self._driver.session(database=self._database) as session:
+        async with self._session() as session:
             result = await session.run(
-                """
-                MATCH (v:ResourceVersion {uri: $uri, content_hash: $content_hash})
-                RETURN v
-                LIMIT 1
-                """,
+                QUERIES["get_resource_version_by_hash"],
                 uri=uri,
                 content_hash=content_hash,
             )
@@ -371,55 +653,42 @@ class Neo4jGraphStore:
         # Sanitize relationship type for Cypher
         rel_type = edge.relationship_type.upper().replace(" ", "_")
 
-        async with self._driver.session(database=self._database) as session:
-            # Dynamic relationship type requires string interpolation
-            # Properties are still parameterized for safety
-            # Note: properties dict is serialized to JSON string since Neo4j
-            # doesn't support Map types as property values
-            query = f"""
-                MATCH (source {{id: $source_id}})
-                MATCH (target {{id: $target_id}})
-                CREATE (source)-[r:{rel_type} {{
-                    id: $id,
-                    conversation_id: $conversation_id,
-                    created_at: $created_at,
-                    properties: $properties
-                }}]->(target)
-                RETURN r
-                """
-            result = await session.run(
-                query,
-                source_id=str(edge.source_id),
-                target_id=str(edge.target_id),
-                id=str(edge.id),
-                conversation_id=edge.conversation_id,
-                created_at=edge.created_at.isoformat(),
-                properties=json.dumps(edge.properties),
-            )
-            # Consume result to commit the auto-commit transaction
-            await result.consume()
+        # Dynamic relationship type requires string interpolation
+        # Properties are still parameterized for safety
+        query = f"""
+            MATCH (source {{id: $source_id}})
+            MATCH (target {{id: $target_id}})
+            CREATE (source)-[r:{rel_type} {{
+                id: $id,
+                conversation_id: $conversation_id,
+                created_at: $created_at
+            }}]->(target)
+            SET r += $properties
+            RETURN r
+            """
+        await self._write(
+            _consume,
+            query,
+            source_id=str(edge.source_id),
+            target_id=str(edge.target_id),
+            id=edge.id_str,
+            conversation_id=edge.conversation_id,
+            created_at=edge.created_at.isoformat(),
+            properties=_edge_properties(edge.properties),
+        )
         return edge
 
     async def _create_version_of(self, edge: VersionOf) -> VersionOf:
         """Create a VERSION_OF relationship."""
         assert self._driver is not None  # Checked by create_edge
-        async with self._driver.session(database=self._database) as session:
-            result = await session.run(
-                """
-                MATCH (v:ResourceVersion {id: $version_id})
-                MATCH (r:Resource {id: $resource_id})
-                CREATE (v)-[:VERSION_OF {
-                    id: $id,
-                    created_at: $created_at
-                }]->(r)
-                """,
-                version_id=str(edge.version_id),
-                resource_id=str(edge.resource_id),
-                id=str(edge.id),
-                created_at=edge.created_at.isoformat(),
-            )
-            # Consume result to commit the auto-commit transaction
-            await result.consume()
+        await self._write(
+            _consume,
+            QUERIES["create_version_of"],
+            version_id=str(edge.version_id),
+            resource_id=str(edge.resource_id),
+            id=edge.id_str,
+            created_at=edge.created_at.isoformat(),
+        )
         return edge
 
     # =========================================================================
@@ -431,11 +700,8 @@ class Neo4jGraphStore:
         if not self._driver:
             raise RuntimeError("Not connected")
 
-        async with self._driver.session(database=self._database) as session:
-            result = await session.run(
-                "MATCH (n:UserText {id: $id}) RETURN n",
-                id=str(node_id),
-            )
+        async with self._session() as session:
+            result = await session.run(QUERIES["get_user_text"], id=str(node_id))
             record = await result.single()
             if record:
                 n = record["n"]
@@ -455,7 +721,7 @@ class Neo4jGraphStore:
             raise RuntimeError("Not connected")
 
         ns_where = "AND u.namespace = $namespace" if self._namespace else ""
-        async with self._driver.session(database=self._database) as session:
+        async with self._session() as session:
             result = await session.run(
                 f"""
                 MATCH (u:UserText {{conversation_id: $conversation_id}})
@@ -486,7 +752,7 @@ class Neo4jGraphStore:
             raise RuntimeError("Not connected")
 
         ns_where = "AND a.namespace = $namespace" if self._namespace else ""
-        async with self._driver.session(database=self._database) as session:
+        async with self._session() as session:
             result = await session.run(
                 f"""
                 MATCH (a:AgentText {{conversation_id: $conversation_id}})
@@ -502,7 +768,7 @@ class Neo4jGraphStore:
             if record:
                 a = record["a"]
                 # Deserialize tool_uses from JSON
-                tool_uses_data = json.loads(a.get("tool_uses", "[]"))
+                tool_uses_data = json_loads(a.get("tool_uses", "[]"))
                 tool_uses = [ToolUseRecord(**tu) for tu in tool_uses_data]
                 return AgentText(
                     id=UUID(a["id"]),
@@ -527,7 +793,7 @@ class Neo4jGraphStore:
             raise RuntimeError("Not connected")
 
         ns_filter = "AND n.namespace = $namespace" if self._namespace else ""
-        async with self._driver.session(database=self._database) as session:
+        async with self._session() as session:
             result = await session.run(
                 f"""
                 MATCH (n)
@@ -556,7 +822,7 @@ class Neo4jGraphStore:
                     )
                 elif "AgentText" in labels:
                     # Deserialize tool_uses from JSON
-                    tool_uses_data = json.loads(n.get("tool_uses", "[]"))
+                    tool_uses_data = json_loads(n.get("tool_uses", "[]"))
                     tool_uses = [ToolUseRecord(**tu) for tu in tool_uses_data]
                     return AgentText(
                         id=UUID(n["id"]),
@@ -578,7 +844,7 @@ class Neo4jGraphStore:
             raise RuntimeError("Not connected")
 
         ns_filter = "AND n.namespace = $namespace" if self._namespace else ""
-        async with self._driver.session(database=self._database) as session:
+        async with self._session() as session:
             result = await session.run(
                 f"""
                 MATCH (n)
@@ -603,7 +869,7 @@ class Neo4jGraphStore:
             raise RuntimeError("Not connected")
 
         ns_filter = "AND n.namespace = $namespace" if self._namespace else ""
-        async with self._driver.session(database=self._database) as session:
+        async with self._session() as session:
             result = await session.run(
                 f"""
                 MATCH (n)
@@ -634,7 +900,7 @@ class Neo4jGraphStore:
                     )
                 elif "AgentText" in labels:
                     # Deserialize tool_uses from JSON
-                    tool_uses_data = json.loads(n.get("tool_uses", "[]"))
+                    tool_uses_data = json_loads(n.get("tool_uses", "[]"))
                     tool_uses = [ToolUseRecord(**tu) for tu in tool_uses_data]
                     return AgentText(
                         id=UUID(n["id"]),
@@ -652,102 +918,91 @@ class Neo4jGraphStore:
         if not self._driver or not node_ids:
             return
 
+        self._evict_last_accessed_sorted()
         now = datetime.now(UTC).isoformat()
         str_ids = [str(nid) for nid in node_ids]
 
-        async with self._driver.session(database=self._database) as session:
-            await session.run(
-                """
-                MATCH (n)
-                WHERE n.id IN $ids
-                SET n.last_accessed_at = $now
-                """,
-                ids=str_ids,
-                now=now,
-            )
+        await self._write(
+            _consume,
+            QUERIES["update_last_accessed"],
+            ids=str_ids,
+            now=now,
+        )
 
     # =========================================================================
     # Retrieval query operations
     # =========================================================================
 
+    def cache_stats(self) -> dict[str, int]:
+        """Return hit, miss, and size counters of the read cache."""
+        return self._read_cache.stats()
+
+    def _evict_last_accessed_sorted(self) -> None:
+        """Drop cached conversation lists whose order depends on last access."""
+        self._read_cache.evict(
+            lambda key: (
+                key[0] == "get_resource_conversations" and key[3] != "created_at"
+            )
+        )
+
     async def get_node_context(self, node_id: UUID) -> ContextResult:
         """Get full context for a UserText node (user text, agent response, tool uses)."""
         if not self._driver:
             raise RuntimeError("Not connected")
 
+        cache_key = ("get_node_context", node_id)
+        cached = self._read_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         logger.debug("get_node_context node_id=%s", node_id)
         context = ContextResult()
 
-        async with self._driver.session(database=self._database) as session:
-            # Get user text and agent text
+        async with self._session() as session:
+            # One round trip: map projections return only the properties the
+            # result models need, and tool uses are collected server-side
             result = await session.run(
                 """
                 MATCH (u:UserText {id: $id})
-                OPTIONAL MATCH (u)-[m:MESSAGE]->(a:AgentText)
-                RETURN u, a
-                """,
-                id=str(node_id),
-            )
-            record = await result.single()
-
-            if not record:
-                logger.debug("get_node_context node_id=%s not found", node_id)
-                return context
-
-            if record.get("u"):
-                u = record["u"]
-                context.user_text = UserTextInfo(
-                    id=u["id"],
-                    text=u["text"],
-                    conversation_id=u["conversation_id"],
-                )
-
-            if record.get("a"):
-                a = record["a"]
-                context.agent_text = AgentTextInfo(
-                    id=a["id"],
-                    text=a["text"],
-                )
-
-            # Get tool uses
-            result = await session.run(
-                """
-                MATCH (u:UserText {id: $id})-[m:MESSAGE]->(a:AgentText)
-                MATCH (a)-[r]->(v:ResourceVersion)
+                OPTIONAL MATCH (u)-[:MESSAGE]->(a:AgentText)
+                OPTIONAL MATCH (a)-[r]->(v:ResourceVersion)
                 WHERE type(r) <> 'MESSAGE'
                 OPTIONAL MATCH (v)-[:VERSION_OF]->(res:Resource)
-                RETURN type(r) as tool_name, r.properties as props, v, res
+                RETURN u {.id, .text, .conversation_id} AS u,
+                       a {.id, .text} AS a,
+                       collect(CASE WHEN r IS NOT NULL THEN {
+                           tool_name: type(r),
+                           props: properties(r),
+                           v: v {.id, .uri, .content_hash},
+                           res: res {.id, .uri}
+                       } END) AS tool_uses
                 """,
                 id=str(node_id),
             )
-            records = await result.data()
+            record = await result.single()
 
-            for rec in records:
-                props = rec["props"]
-                if isinstance(props, str):
-                    props = json.loads(props)
-                tool_use = ToolUse(
-                    tool_name=rec["tool_name"],
-                    properties=props or {},
-                )
-                if rec.get("v"):
-                    v = rec["v"]
-                    tool_use.resource_version = ResourceVersionInfo(
-                        id=v["id"],
-                        uri=v["uri"],
-                        content_hash=v["content_hash"],
-                    )
-                if rec.get("res"):
-                    res = rec["res"]
-                    tool_use.resource = ResourceInfo(
-                        id=res["id"],
-                        uri=res["uri"],
-                    )
-                context.tool_uses.append(tool_use)
+        if not record:
+            logger.debug("get_node_context node_id=%s not found", node_id)
+            return context
+
+        context.user_text = UserTextInfo(**record["u"])
+        if record["a"]:
+            context.agent_text = AgentTextInfo(**record["a"])
+        for rec in record["tool_uses"]:
+            tool_use = ToolUse(
+                tool_name=rec["tool_name"],
+                properties=_read_edge_properties(rec["props"] or {}),
+            )
+            if rec["v"]:
+                tool_use.resource_version = ResourceVersionInfo(**rec["v"])
+            if rec["res"]:
+                tool_use.resource = ResourceInfo(**rec["res"])
+            context.tool_uses.append(tool_use)
 
         logger.debug(
             "get_node_context node_id=%s tool_uses=%d", node_id, len(context.tool_uses)
         )
+        self._read_cache.set(cache_key, context.model_copy(deep=True))
         return context
 
     async def get_resource_conversations(
@@ -763,6 +1018,18 @@ class Neo4jGraphStore:
         if not self._driver:
             raise RuntimeError("Not connected")
 
+        cache_key = (
+            "get_resource_conversations",
+            uri,
+            limit,
+            sort_by,
+            sort_order,
+            exclude_conversation_id,
+        )
+        cached = self._read_cache.get(cache_key)
+        if cached is not None:
+            return [ref.model_copy() for ref in cached]
+
         logger.debug(
             "get_resource_conversations uri=%s limit=%d sort_by=%s sort_order=%s exclude=%s",
             uri,
@@ -798,13 +1065,13 @@ class Neo4jGraphStore:
         """
         params["limit"] = limit
 
-        async with self._driver.session(database=self._database) as session:
+        async with self._session() as session:
             result = await session.run(query, params)
             records = await result.data()
 
         logger.debug("get_resource_conversations uri=%s results=%d", uri, len(records))
 
-        return [
+        references = [
             ConversationReference(
                 conversation_id=rec["conversation_id"],
                 user_text_id=rec["user_text_id"],
@@ -818,6 +1085,8 @@ class Neo4jGraphStore:
             )
             for rec in records
         ]
+        self._read_cache.set(cache_key, [ref.model_copy() for ref in references])
+        return references
 
     async def get_trajectory_nodes(
         self,
@@ -827,29 +1096,53 @@ class Neo4jGraphStore:
     ) -> list[dict[str, Any]]:
         """Get raw nodes reachable from a UserText via MESSAGE edges.
 
+        Traversal stops at the next UserText: paths may end at one but never
+        pass through it, so later turns are not fetched.
+
         Returns list of dicts with 'n' (node props) and 'node_labels' (list[str]).
         """
+        logger.debug("get_trajectory_nodes node_id=%s max_depth=%d", node_id, max_depth)
+        batch = await self.get_trajectory_nodes_batch([node_id], max_depth=max_depth)
+        records = batch[str(node_id)]
+        logger.debug(
+            "get_trajectory_nodes node_id=%s results=%d", node_id, len(records)
+        )
+        return records
+
+    async def get_trajectory_nodes_batch(
+        self,
+        node_ids: list[UUID],
+        *,
+        max_depth: int = 100,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get trajectory nodes for several UserTexts in one query.
+
+        Returns a dict mapping each requested node id (as a string) to the
+        records get_trajectory_nodes would return for it.
+        """
         if not self._driver:
             raise RuntimeError("Not connected")
 
-        logger.debug("get_trajectory_nodes node_id=%s max_depth=%d", node_id, max_depth)
-
         # Neo4j doesn't support parameterized hop depth, so we string-interpolate
         # the validated int (safe since max_depth is validated by RetrievalConfig).
         query = f"""
-            MATCH (start:UserText {{id: $id}})-[:MESSAGE*0..{int(max_depth)}]->(n)
+            UNWIND $ids AS start_id
+            MATCH p = (start:UserText {{id: start_id}})-[:MESSAGE*0..{int(max_depth)}]->(n)
             WHERE n.conversation_id = start.conversation_id
-            RETURN n, labels(n) as node_labels
+              AND none(m IN nodes(p)[1..-1] WHERE m:UserText)
+            RETURN start_id, n, labels(n) as node_labels
             ORDER BY n.created_at ASC
         """
 
-        async with self._driver.session(database=self._database) as session:
-            result = await session.run(query, {"id": str(node_id)})
-            records = await result.data()
+        # The query runs once per listed id; repeats would duplicate rows
+        ids = list(dict.fromkeys(str(node_id) for node_id in node_ids))
+        async with self._session() as session:
+            result = await session.run(query, {"ids": ids})
+            rows = await result.data()
 
-        logger.debug(
-            "get_trajectory_nodes node_id=%s results=%d", node_id, len(records)
-        )
+        records: dict[str, list[dict[str, Any]]] = {node_id: [] for node_id in ids}
+        for row in rows:
+            records[row.pop("start_id")].append(row)
         return records
 
     # =========================================================================
@@ -861,6 +1154,10 @@ class Neo4jGraphStore:
     ) -> list[dict[str, Any]]:
         """Execute a raw Cypher query and return results.
 
+        Pass values through ``parameters`` rather than formatting them into
+        ``query``: Neo4j caches plans by query text, so a constant statement is
+        planned once and reused.
+
         Args:
             query: Cypher query string.
             parameters: Optional query parameters.
@@ -878,7 +1175,11 @@ class Neo4jGraphStore:
         """
         if not self._driver:
             raise RuntimeError("Not connected")
+        # Raw queries may write, so cached reads can no longer be trusted
+        self._read_cache.clear()
 
-        async with self._driver.session(database=self._database) as session:
+        async with self._session() as session:
             result = await session.run(query, parameters or {})
-            return await result.data()
+            # Buffer every record at once instead of iterating row by row
+            eager = await result.to_eager_result()
+        return [record.data() for record in eager.records]
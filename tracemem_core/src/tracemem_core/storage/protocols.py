@@ -18,6 +18,15 @@ from tracemem_core.retrieval.results import (
 )
 
 
+class VectorEntry(BaseModel):
+    """Entry to add to the vector store."""
+
+    node_id: UUID
+    text: str
+    vector: list[float]
+    conversation_id: str
+
+
 class VectorSearchResult(BaseModel):
     """Result from vector search."""
 
@@ -49,6 +58,7 @@ class GraphStore(Protocol):
         ...
 
     # Polymorphic node/edge operations
+    # Implementations must be safe to call concurrently (e.g. via asyncio.gather)
     async def create_node(self, node: NodeBase) -> NodeBase:
         """Create a node. Dispatches to correct handler based on type."""
         ...
@@ -57,6 +67,14 @@ class GraphStore(Protocol):
         """Create an edge. Dispatches to correct handler based on type."""
         ...
 
+    async def create_nodes(self, nodes: list[NodeBase]) -> list[NodeBase]:
+        """Create many nodes in as few round trips as the backend allows."""
+        ...
+
+    async def create_edges(self, edges: list[EdgeBase]) -> list[EdgeBase]:
+        """Create many edges in as few round trips as the backend allows."""
+        ...
+
     # Resource-specific operations
     async def get_resource_by_uri(self, uri: str) -> Resource | None:
         """Get a Resource by its URI."""
@@ -141,6 +159,18 @@ class GraphStore(Protocol):
         """
         ...
 
+    async def get_trajectory_nodes_batch(
+        self,
+        node_ids: list[UUID],
+        *,
+        max_depth: int = 100,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get trajectory nodes for several UserTexts in one query.
+
+        Returns a dict mapping each node id (as a string) to its records.
+        """
+        ...
+
     # Raw query execution
     async def execute_cypher(
         self, query: str, parameters: dict[str, Any] | None = None
@@ -170,8 +200,12 @@ class VectorStore(Protocol):
         """Add a vector entry."""
         ...
 
-    async def update_last_accessed(self, node_id: UUID) -> None:
-        """Update last_accessed timestamp for a vector entry."""
+    async def add_batch(self, entries: list[VectorEntry]) -> None:
+        """Add many vector entries in a single write."""
+        ...
+
+    async def update_last_accessed(self, node_ids: list[UUID]) -> None:
+        """Update last_accessed timestamps for the given vector entries."""
         ...
 
     async def search(
@@ -180,7 +214,7 @@ class VectorStore(Protocol):
         query_text: str,
         limit: int = 10,
         exclude_conversation_id: str | None = None,
-        vector_weight: float = 0.7,
+        vector_weight: float = 0.5,
     ) -> list[VectorSearchResult]:
         """Search for similar vectors using hybrid search.
 
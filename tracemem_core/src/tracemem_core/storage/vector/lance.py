@@ -1,36 +1,53 @@
+import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
 import lancedb
 import pyarrow as pa
 
-from tracemem_core.storage.protocols import VectorSearchResult
-from tracemem_core.storage.vector.rerankers import get_reranker
+from tracemem_core.storage.protocols import VectorEntry, VectorSearchResult
+from tracemem_core.storage.vector.rerankers import WeightedRRFReranker, get_reranker
 
 
 class LanceDBVectorStore:
-    """LanceDB implementation of VectorStore with hybrid search."""
+    """LanceDB implementation of VectorStore with hybrid search.
+
+    Args:
+        path: Directory holding the database, or a LanceDB URI such as
+            ``memory://name`` or ``s3://bucket/prefix`` passed through as-is.
+        embedding_dimensions: Length of the stored vectors.
+        reranker: Reranker name from the registry or a reranker instance.
+        vector_dtype: Storage type for vectors in a newly created table.
+            "float16" halves the vector column; existing tables keep the
+            type they were created with.
+    """
 
     TABLE_NAME = "user_texts"
 
     def __init__(
         self,
-        path: Path,
+        path: Path | str,
         embedding_dimensions: int = 1536,
         reranker: str | Any = "rrf",
+        vector_dtype: Literal["float32", "float16"] = "float32",
     ) -> None:
         self._path = path
         self._embedding_dimensions = embedding_dimensions
+        self._vector_type = pa.float16() if vector_dtype == "float16" else pa.float32()
         self._reranker = get_reranker(reranker)
         self._db: lancedb.DBConnection | None = None
         self._table: lancedb.table.Table | None = None
 
     async def connect(self) -> None:
         """Connect to the LanceDB database."""
-        self._path.mkdir(parents=True, exist_ok=True)
-        self._db = lancedb.connect(str(self._path))
+        if isinstance(self._path, str) and "://" in self._path:
+            self._db = lancedb.connect(self._path)
+        else:
+            path = Path(self._path)
+            path.mkdir(parents=True, exist_ok=True)
+            self._db = lancedb.connect(str(path))
 
         # Check if table exists
         table_names = [t for t in self._db.list_tables()]
@@ -44,7 +61,8 @@ class LanceDBVectorStore:
                     pa.field("node_id", pa.string()),
                     pa.field("text", pa.string()),
                     pa.field(
-                        "vector", pa.list_(pa.float32(), self._embedding_dimensions)
+                        "vector",
+                        pa.list_(self._vector_type, self._embedding_dimensions),
                     ),
                     pa.field("conversation_id", pa.string()),
                     pa.field("created_at", pa.timestamp("us", tz="UTC")),
@@ -71,20 +89,44 @@ class LanceDBVectorStore:
         conversation_id: str,
     ) -> None:
         """Add a vector entry."""
+        await self.add_batch(
+            [
+                VectorEntry(
+                    node_id=node_id,
+                    text=text,
+                    vector=vector,
+                    conversation_id=conversation_id,
+                )
+            ]
+        )
+
+    async def add_batch(self, entries: list[VectorEntry]) -> None:
+        """Add many vector entries with a single table write.
+
+        Each ``add`` call commits a new table version, so ingesting entries
+        together is much cheaper than adding them one by one.
+        """
         if self._table is None:
             raise RuntimeError("Not connected")
+        if not entries:
+            return
 
         now = datetime.now(UTC)
-        row = {
-            "id": str(node_id),
-            "node_id": str(node_id),
-            "text": text,
-            "vector": vector,
-            "conversation_id": conversation_id,
-            "created_at": now,
-            "last_accessed": now,
-        }
-        self._table.add([row])
+        ids = [str(entry.node_id) for entry in entries]
+        timestamps = [now] * len(entries)
+        batch = pa.RecordBatch.from_arrays(
+            [
+                ids,
+                ids,
+                [entry.text for entry in entries],
+                [entry.vector for entry in entries],
+                [entry.conversation_id for entry in entries],
+                timestamps,
+                timestamps,
+            ],
+            schema=self._table.schema,
+        )
+        self._table.add(batch)
 
     async def search(
         self,
@@ -92,7 +134,9 @@ class LanceDBVectorStore:
         query_text: str,
         limit: int = 10,
         exclude_conversation_id: str | None = None,
-        vector_weight: float = 0.7,
+        vector_weight: float = 0.5,
+        reranker: str | Any | None = None,
+        rrf_k: int | None = None,
     ) -> list[VectorSearchResult]:
         """Search for similar vectors using hybrid search.
 
@@ -103,6 +147,12 @@ class LanceDBVectorStore:
             exclude_conversation_id: Optional conversation to exclude.
             vector_weight: Weight for vector vs text search (0.0-1.0).
                 0.0 = pure text search, 1.0 = pure vector search.
+                Applied to rank fusion when the reranker is RRF-based; the
+                default 0.5 gives plain RRF ordering.
+            reranker: Optional per-call reranker (string key or instance).
+                Defaults to the reranker the store was created with.
+            rrf_k: Optional per-call RRF smoothing constant. Applied when the
+                reranker is RRF-based; defaults to the reranker's own K.
 
         Returns:
             List of VectorSearchResult ordered by relevance.
@@ -110,12 +160,18 @@ class LanceDBVectorStore:
         if self._table is None:
             raise RuntimeError("Not connected")
 
+        resolved = get_reranker(reranker) if reranker is not None else self._reranker
+        if isinstance(resolved, WeightedRRFReranker):
+            if rrf_k is not None:
+                resolved = resolved.with_k(rrf_k)
+            resolved = resolved.with_vector_weight(vector_weight)
+
         # Build the query with hybrid search (vector + FTS)
         query = (
             self._table.search(query_type="hybrid")
             .vector(query_vector)
             .text(query_text)
-            .rerank(reranker=self._reranker)
+            .rerank(reranker=resolved)
             .limit(limit * 2)  # Get more results before filtering
         )
 
@@ -145,13 +201,17 @@ class LanceDBVectorStore:
 
         return search_results
 
-    async def update_last_accessed(self, node_id: UUID) -> None:
-        """Update last_accessed timestamp for a vector entry."""
+    async def update_last_accessed(self, node_ids: list[UUID]) -> None:
+        """Update last_accessed timestamps for vector entries in one write."""
         if self._table is None:
             raise RuntimeError("Not connected")
+        if not node_ids:
+            return
 
-        self._table.update(
-            where=f'node_id = "{node_id}"',
+        ids = ", ".join(f"'{node_id}'" for node_id in node_ids)
+        await asyncio.to_thread(
+            self._table.update,
+            where=f"node_id IN ({ids})",
             values={"last_accessed": datetime.now(UTC)},
         )
 
@@ -165,6 +225,6 @@ class LanceDBVectorStore:
         count = len(df[df["conversation_id"] == conversation_id])
 
         if count > 0:
-            self._table.delete(f'conversation_id = "{conversation_id}"')
+            self._table.delete(f"conversation_id = '{conversation_id}'")
 
         return count
@@ -7,12 +7,102 @@ Custom reranker instances (e.g. CohereReranker, CrossEncoderReranker) can be
 passed directly — they bypass the registry.
 """
 
+from collections import defaultdict
+from functools import lru_cache
 from typing import Any
 
+import pyarrow as pa
 from lancedb.rerankers import LinearCombinationReranker, RRFReranker
 
+
+class WeightedRRFReranker(RRFReranker):
+    """Reciprocal Rank Fusion with separate weights for vector and FTS ranks.
+
+    Each result scores ``vector_weight / (K + vector_rank)`` plus
+    ``(1 - vector_weight) / (K + fts_rank)``. With ``vector_weight=0.5`` the
+    ordering is identical to plain RRF.
+
+    Args:
+        K: RRF smoothing constant. Smaller values favor top-ranked results.
+        vector_weight: Weight for the vector ranking (0.0-1.0).
+            0.0 = pure text ranking, 1.0 = pure vector ranking.
+    """
+
+    def __init__(
+        self,
+        K: int = 60,
+        vector_weight: float = 0.5,
+        return_score: str = "relevance",
+    ) -> None:
+        if not 0.0 <= vector_weight <= 1.0:
+            raise ValueError("vector_weight must be between 0 and 1.")
+        super().__init__(K=K, return_score=return_score)
+        self.vector_weight = vector_weight
+
+    def __str__(self) -> str:
+        return f"WeightedRRFReranker(K={self.K}, vector_weight={self.vector_weight})"
+
+    def with_vector_weight(self, vector_weight: float) -> "WeightedRRFReranker":
+        """Return a reranker with the same K and a different vector weight.
+
+        Instances are shared per (K, weight, score), so repeated searches with
+        the same weight don't build a new reranker each time.
+        """
+        if vector_weight == self.vector_weight:
+            return self
+        return _weighted_rrf(self.K, vector_weight, self.score)
+
+    def with_k(self, K: int) -> "WeightedRRFReranker":
+        """Return a reranker with the same vector weight and a different K."""
+        if K == self.K:
+            return self
+        return _weighted_rrf(K, self.vector_weight, self.score)
+
+    def rerank_hybrid(
+        self,
+        query: str,
+        vector_results: pa.Table,
+        fts_results: pa.Table,
+    ) -> pa.Table:
+        vector_ids = vector_results["_rowid"].to_pylist() if vector_results else []
+        fts_ids = fts_results["_rowid"].to_pylist() if fts_results else []
+        rrf_score_map: dict[int, float] = defaultdict(float)
+
+        for ids, weight in (
+            (vector_ids, self.vector_weight),
+            (fts_ids, 1.0 - self.vector_weight),
+        ):
+            for rank, result_id in enumerate(ids, 1):
+                rrf_score_map[result_id] += weight / (rank + self.K)
+
+        combined_results = self.merge_results(vector_results, fts_results)
+        relevance_scores = [
+            rrf_score_map[row_id] for row_id in combined_results["_rowid"].to_pylist()
+        ]
+        combined_results = combined_results.append_column(
+            "_relevance_score", pa.array(relevance_scores, type=pa.float32())
+        )
+        combined_results = combined_results.sort_by(
+            [("_relevance_score", "descending")]
+        )
+
+        if self.score == "relevance":
+            combined_results = self._keep_relevance_score(combined_results)
+
+        return combined_results
+
+
+@lru_cache(maxsize=64)
+def _weighted_rrf(
+    K: int, vector_weight: float, return_score: str
+) -> WeightedRRFReranker:
+    return WeightedRRFReranker(
+        K=K, vector_weight=vector_weight, return_score=return_score
+    )
+
+
 RERANKER_REGISTRY: dict[str, Any] = {
-    "rrf": RRFReranker(),
+    "rrf": WeightedRRFReranker(),
     "linear": LinearCombinationReranker(weight=0.5),
 }
 
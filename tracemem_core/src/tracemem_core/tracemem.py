@@ -26,11 +26,15 @@ Direct usage:
     ```
 """
 
+import asyncio
 import hashlib
+import logging
+from contextvars import ContextVar
 from typing import Any
 from uuid import UUID
 
 from tracemem_core.config import TraceMemConfig
+from tracemem_core.embedders.cache import CachedEmbedder
 from tracemem_core.embedders.openai import OpenAIEmbedder
 from tracemem_core.embedders.protocol import Embedder
 from tracemem_core.extractors import DefaultResourceExtractor, ResourceExtractor
@@ -52,9 +56,26 @@ from tracemem_core.retrieval.results import (
     RetrievalResult,
     TrajectoryResult,
 )
+from tracemem_core.storage.graph.buffer import BufferedGraphWriter
 from tracemem_core.storage.graph.kuzu_store import KuzuGraphStore
+from tracemem_core.storage.protocols import GraphStore, VectorEntry
 from tracemem_core.storage.vector import LanceDBVectorStore
 
+logger = logging.getLogger(__name__)
+
+
+class _ImportBatch:
+    """State of one running import_trace call.
+
+    User text embeddings are computed up front; graph writes and vector
+    entries are collected and written in bulk when the import ends.
+    """
+
+    def __init__(self, graph_store: GraphStore, vectors: dict[str, list[float]]):
+        self.graph = BufferedGraphWriter(graph_store)
+        self.vectors = vectors
+        self.entries: list[VectorEntry] = []
+
 
 class TraceMem:
     """Knowledge graph memory system for AI agents.
@@ -130,6 +151,11 @@ class TraceMem:
                 dimensions=self._config.embedding_dimensions,
                 api_key=self._config.openai_api_key,
             )
+        # Repeated texts (greetings, retried prompts) skip the embedder
+        if self._config.embed_cache_size > 0:
+            self._embedder = CachedEmbedder(
+                self._embedder, maxsize=self._config.embed_cache_size
+            )
 
         # Resolve reranker: explicit param > config string
         resolved_reranker = reranker if reranker is not None else self._config.reranker
@@ -144,35 +170,51 @@ class TraceMem:
                 password=self._config.neo4j_password,
                 database=self._config.neo4j_database,
                 namespace=self._config.namespace,
+                max_connection_pool_size=self._config.neo4j_max_connection_pool_size,
+                connection_acquisition_timeout=(
+                    self._config.neo4j_connection_acquisition_timeout
+                ),
+                max_transaction_retry_time=(
+                    self._config.neo4j_max_transaction_retry_time
+                ),
+                read_cache_ttl=self._config.graph_read_cache_ttl,
             )
         else:
             self._graph_store = KuzuGraphStore(
                 db_path=self._config.get_graph_path(),
+                read_cache_ttl=self._config.graph_read_cache_ttl,
             )
 
         self._vector_store = LanceDBVectorStore(
             path=self._config.get_vector_path(),
             embedding_dimensions=self._config.embedding_dimensions,
             reranker=resolved_reranker,
+            vector_dtype=self._config.vector_dtype,
         )
 
         # Lazy-initialized retrieval strategy
         self._retrieval: HybridRetrievalStrategy | None = None
 
-        # State for message processing
-        self._tool_results: dict[str, str] = {}
+        # State for message processing: tool_call_id -> content hash of its
+        # result (the hash is all resource versioning needs, so the possibly
+        # large result text isn't kept alive)
+        self._tool_result_hashes: dict[str, str] = {}
+        # Set by import_trace for the task running it (and the tasks it
+        # spawns), so concurrent add_message calls and imports on this
+        # instance each write directly or to their own batch
+        self._import_batch: ContextVar[_ImportBatch | None] = ContextVar(
+            "tracemem_import_batch", default=None
+        )
 
     async def __aenter__(self) -> "TraceMem":
         """Async context manager entry."""
-        await self._graph_store.connect()
+        await asyncio.gather(self._graph_store.connect(), self._vector_store.connect())
         await self._graph_store.initialize_schema()
-        await self._vector_store.connect()
         return self
 
     async def __aexit__(self, _exc_type: Any, _exc_val: Any, _exc_tb: Any) -> None:
         """Async context manager exit - closes all connections."""
-        await self._graph_store.close()
-        await self._vector_store.close()
+        await asyncio.gather(self._graph_store.close(), self._vector_store.close())
 
     @property
     def retrieval(self) -> RetrievalStrategy:
@@ -186,6 +228,8 @@ class TraceMem:
                 graph_store=self._graph_store,
                 vector_store=self._vector_store,
                 embedder=self._embedder,
+                similar_query_threshold=self._config.similar_query_threshold,
+                result_cache_ttl=self._config.similar_query_ttl,
             )
         return self._retrieval
 
@@ -207,6 +251,24 @@ class TraceMem:
             query, config=config or self._config.retrieval
         )
 
+    async def search_batch(
+        self,
+        queries: list[str],
+        config: RetrievalConfig | None = None,
+    ) -> list[list[RetrievalResult]]:
+        """Run several searches concurrently with one embedding call.
+
+        Args:
+            queries: Search query texts.
+            config: Optional RetrievalConfig. Falls back to config.retrieval default.
+
+        Returns:
+            One list of RetrievalResult per query, in the order of queries.
+        """
+        return await self.retrieval.search_batch(
+            queries, config=config or self._config.retrieval
+        )
+
     async def get_context(self, node_id: UUID) -> ContextResult:
         """Get full context for a UserText node.
 
@@ -256,6 +318,33 @@ class TraceMem:
             config=config or self._config.retrieval,
         )
 
+    async def get_trajectories(
+        self,
+        node_ids: list[UUID],
+        config: RetrievalConfig | None = None,
+    ) -> list[TrajectoryResult]:
+        """Get trajectories for several UserText nodes with one graph query.
+
+        Args:
+            node_ids: UUIDs of the starting UserText nodes.
+            config: Optional RetrievalConfig. Falls back to config.retrieval default.
+
+        Returns:
+            One TrajectoryResult per node id, in the order of node_ids.
+        """
+        return await self.retrieval.get_trajectories(
+            node_ids,
+            config=config or self._config.retrieval,
+        )
+
+    @property
+    def _graph(self) -> GraphStore | BufferedGraphWriter:
+        """Graph target for message processing (buffered during import_trace)."""
+        batch = self._import_batch.get()
+        if batch is not None:
+            return batch.graph
+        return self._graph_store
+
     def _compute_content_hash(self, content: str) -> str:
         """Compute SHA-256 hash of content."""
         return hashlib.sha256(content.encode()).hexdigest()
@@ -289,18 +378,49 @@ class TraceMem:
         created: dict[str, UUID] = {}
 
         # First pass: collect tool results
-        self._tool_results.clear()
+        self._tool_result_hashes.clear()
         for msg in messages:
             if msg.role == "tool" and msg.tool_call_id:
-                self._tool_results[msg.tool_call_id] = msg.content
+                self._tool_result_hashes[msg.tool_call_id] = self._compute_content_hash(
+                    msg.content
+                )
 
-        # Second pass: process messages
-        for msg in messages:
-            result = await self.add_message(conversation_id, msg)
-            created.update(result)
+        # Embed every user text in one call
+        texts = list(dict.fromkeys(m.content for m in messages if m.role == "user"))
+        vectors = await self._embedder.embed_batch(texts) if texts else []
+        batch = _ImportBatch(self._graph_store, dict(zip(texts, vectors)))
+
+        # Second pass: process messages, writing the graph and then the vectors
+        # in bulk at the end (also on failure, so what was processed is kept)
+        token = self._import_batch.set(batch)
+        try:
+            for msg in messages:
+                result = await self.add_message(conversation_id, msg)
+                created.update(result)
+        except BaseException as exc:
+            self._import_batch.reset(token)
+            try:
+                await self._flush_import(batch)
+            except Exception as flush_exc:
+                logger.exception(
+                    "Flushing partial import of %s failed", conversation_id
+                )
+                exc.add_note(f"Flushing the partial import also failed: {flush_exc!r}")
+            raise
+        else:
+            self._import_batch.reset(token)
+            await self._flush_import(batch)
 
         return created
 
+    async def _flush_import(self, batch: _ImportBatch) -> None:
+        """Write an import's buffered graph changes, then its vectors."""
+        await batch.graph.flush()
+        if batch.entries:
+            await self._vector_store.add_batch(batch.entries)
+            if self._retrieval is not None:
+                self._retrieval.clear_result_cache()
+
     async def add_message(
         self,
         conversation_id: str,
@@ -335,7 +455,9 @@ class TraceMem:
 
         elif message.role == "tool" and message.tool_call_id:
             # Store tool result for later use when processing assistant messages
-            self._tool_results[message.tool_call_id] = message.content
+            self._tool_result_hashes[message.tool_call_id] = self._compute_content_hash(
+                message.content
+            )
 
         # System messages are not stored in the graph
 
@@ -349,39 +471,72 @@ class TraceMem:
         User messages start a new turn. If there's a previous turn, creates an edge
         from the last agent in that turn to this user text.
         """
-        # Get max turn and increment for new user message
-        max_turn = await self._graph_store.get_max_turn_index(conversation_id)
+        # Max turn (incremented for the new user message) and the previous
+        # turn's last agent (linked to the new user text) are independent reads
+        max_turn, last_agent = await asyncio.gather(
+            self._graph.get_max_turn_index(conversation_id),
+            self._graph.get_last_agent_text(conversation_id),
+        )
         turn_index = max_turn + 1
 
-        # Link from previous turn's last agent (if exists)
-        last_agent = await self._graph_store.get_last_agent_text(conversation_id)
-
         user_text = UserText(
             text=message.content,
             conversation_id=conversation_id,
             turn_index=turn_index,
         )
-        await self._graph_store.create_node(user_text)
-
-        # Link from previous agent message if exists (maintains conversation chain)
-        if last_agent:
-            edge = Relationship(
-                source_id=last_agent.id,
-                target_id=user_text.id,
-                conversation_id=conversation_id,
+        # Embed while the graph is written; the vector is only added once the
+        # node exists, so a failed graph write leaves no dangling vector
+        _, vector = await asyncio.gather(
+            self._write_user_text(user_text, last_agent),
+            self._embed_user_text(user_text.text),
+        )
+        batch = self._import_batch.get()
+        if batch is not None:
+            batch.entries.append(
+                VectorEntry(
+                    node_id=user_text.id,
+                    text=user_text.text,
+                    vector=vector,
+                    conversation_id=conversation_id,
+                )
             )
-            await self._graph_store.create_edge(edge)
+            return user_text
 
-        vector = await self._embedder.embed(user_text.text)
         await self._vector_store.add(
             node_id=user_text.id,
             text=user_text.text,
             vector=vector,
             conversation_id=conversation_id,
         )
+        # New text can match queries whose hits are being reused
+        if self._retrieval is not None:
+            self._retrieval.clear_result_cache()
 
         return user_text
 
+    async def _write_user_text(
+        self, user_text: UserText, last_agent: AgentText | None
+    ) -> None:
+        """Create the UserText node and link it to the previous turn."""
+        await self._graph.create_node(user_text)
+
+        # Link from previous agent message if exists (maintains conversation chain)
+        if last_agent:
+            edge = Relationship(
+                source_id=last_agent.id,
+                target_id=user_text.id,
+                conversation_id=user_text.conversation_id,
+            )
+            await self._graph.create_edge(edge)
+
+    async def _embed_user_text(self, text: str) -> list[float]:
+        """Embed user text, reusing a vector precomputed by import_trace."""
+        batch = self._import_batch.get()
+        vector = batch.vectors.get(text) if batch is not None else None
+        if vector is None:
+            vector = await self._embedder.embed(text)
+        return vector
+
     async def _add_assistant_message(
         self, conversation_id: str, message: Message
     ) -> tuple[AgentText, dict[str, UUID]]:
@@ -393,13 +548,11 @@ class TraceMem:
         created: dict[str, UUID] = {}
 
         # Get current turn (same as last user message)
-        max_turn = await self._graph_store.get_max_turn_index(conversation_id)
+        max_turn = await self._graph.get_max_turn_index(conversation_id)
         turn_index = max(0, max_turn)  # Use 0 if no turns exist
 
         # Get last node in this turn (could be UserText or AgentText)
-        last_node = await self._graph_store.get_last_node_in_turn(
-            conversation_id, turn_index
-        )
+        last_node = await self._graph.get_last_node_in_turn(conversation_id, turn_index)
 
         # Convert message tool_calls to ToolUseRecord
         tool_uses = [
@@ -413,7 +566,7 @@ class TraceMem:
             turn_index=turn_index,
             tool_uses=tool_uses,
         )
-        await self._graph_store.create_node(agent_text)
+        await self._graph.create_node(agent_text)
 
         # Link from previous node in turn (could be UserText or AgentText for tool flows)
         if last_node:
@@ -422,7 +575,7 @@ class TraceMem:
                 target_id=agent_text.id,
                 conversation_id=conversation_id,
             )
-            await self._graph_store.create_edge(edge)
+            await self._graph.create_edge(edge)
 
         # Process tool calls
         for tool_call in message.tool_calls:
@@ -449,11 +602,7 @@ class TraceMem:
             return created
 
         # Get content hash from tool result if available
-        content_hash: str | None = None
-        if tool_call.id in self._tool_results:
-            content = self._tool_results[tool_call.id]
-            content_hash = self._compute_content_hash(content)
-
+        content_hash = self._tool_result_hashes.get(tool_call.id)
         if not content_hash:
             return created
 
@@ -461,7 +610,7 @@ class TraceMem:
         canonical_uri = resource_uri
 
         # Get or create Resource hypernode
-        existing_resource = await self._graph_store.get_resource_by_uri(canonical_uri)
+        existing_resource = await self._graph.get_resource_by_uri(canonical_uri)
 
         if existing_resource:
             resource = existing_resource
@@ -473,20 +622,18 @@ class TraceMem:
                     uri=canonical_uri,
                     conversation_id=conversation_id,
                 )
-                await self._graph_store.create_node(version)
+                await self._graph.create_node(version)
                 created[f"resource_version_{canonical_uri}"] = version.id
 
                 # Update resource hash
-                await self._graph_store.update_resource_hash(
-                    canonical_uri, content_hash
-                )
+                await self._graph.update_resource_hash(canonical_uri, content_hash)
 
                 # Create VERSION_OF edge
                 version_edge = VersionOf(
                     version_id=version.id,
                     resource_id=resource.id,
                 )
-                await self._graph_store.create_edge(version_edge)
+                await self._graph.create_edge(version_edge)
 
                 # Create tool relationship
                 tool_edge = Relationship(
@@ -496,10 +643,10 @@ class TraceMem:
                     conversation_id=conversation_id,
                     properties=tool_call.args,
                 )
-                await self._graph_store.create_edge(tool_edge)
+                await self._graph.create_edge(tool_edge)
             else:
                 # Same content - still create tool relationship to existing version
-                existing_version = await self._graph_store.get_resource_version_by_hash(
+                existing_version = await self._graph.get_resource_version_by_hash(
                     canonical_uri, content_hash
                 )
                 if existing_version:
@@ -510,7 +657,7 @@ class TraceMem:
                         conversation_id=conversation_id,
                         properties=tool_call.args,
                     )
-                    await self._graph_store.create_edge(tool_edge)
+                    await self._graph.create_edge(tool_edge)
         else:
             # Create new resource and version
             resource = Resource(
@@ -518,7 +665,7 @@ class TraceMem:
                 current_content_hash=content_hash,
                 conversation_id=conversation_id,
             )
-            resource = await self._graph_store.create_node(resource)
+            resource = await self._graph.create_node(resource)
             created[f"resource_{canonical_uri}"] = resource.id
 
             version = ResourceVersion(
@@ -526,7 +673,7 @@ class TraceMem:
                 uri=canonical_uri,
                 conversation_id=conversation_id,
             )
-            await self._graph_store.create_node(version)
+            await self._graph.create_node(version)
             created[f"resource_version_{canonical_uri}"] = version.id
 
             # Create VERSION_OF edge
@@ -534,7 +681,7 @@ class TraceMem:
                 version_id=version.id,
                 resource_id=resource.id,
             )
-            await self._graph_store.create_edge(version_edge)
+            await self._graph.create_edge(version_edge)
 
             # Create tool relationship
             tool_edge = Relationship(
@@ -544,6 +691,6 @@ class TraceMem:
                 conversation_id=conversation_id,
                 properties=tool_call.args,
             )
-            await self._graph_store.create_edge(tool_edge)
+            await self._graph.create_edge(tool_edge)
 
         return created
@@ -57,6 +57,8 @@ def mock_graph_store(mocker) -> AsyncMock:
     # Polymorphic node/edge creation
     mock.create_node = AsyncMock(side_effect=lambda x: x)
     mock.create_edge = AsyncMock(side_effect=lambda x: x)
+    mock.create_nodes = AsyncMock(side_effect=lambda x: list(x))
+    mock.create_edges = AsyncMock(side_effect=lambda x: list(x))
     # Resource operations
     mock.get_resource_by_uri = AsyncMock(return_value=None)
     mock.update_resource_hash = AsyncMock()
@@ -74,6 +76,7 @@ def mock_graph_store(mocker) -> AsyncMock:
     mock.get_node_context = AsyncMock(return_value=ContextResult())
     mock.get_resource_conversations = AsyncMock(return_value=[])
     mock.get_trajectory_nodes = AsyncMock(return_value=[])
+    mock.get_trajectory_nodes_batch = AsyncMock(return_value={})
     # Raw Cypher execution
     mock.execute_cypher = AsyncMock(return_value=[])
     return mock
@@ -86,6 +89,7 @@ def mock_vector_store(mocker) -> AsyncMock:
     mock.connect = AsyncMock()
     mock.close = AsyncMock()
     mock.add = AsyncMock()
+    mock.add_batch = AsyncMock()
     mock.search = AsyncMock(return_value=[])
     mock.update_last_accessed = AsyncMock()
     mock.delete_by_conversation = AsyncMock(return_value=0)
@@ -124,6 +128,9 @@ def neo4j_config():
         "user": "neo4j",
         "password": "testpassword",
         "database": "neo4j",
+        "max_connection_pool_size": 10,
+        "connection_acquisition_timeout": 5.0,
+        "max_transaction_retry_time": 5.0,
     }
 
 
@@ -147,6 +154,11 @@ async def tracemem_integration(
         neo4j_user=neo4j_config["user"],
         neo4j_password=neo4j_config["password"],
         neo4j_database=neo4j_config["database"],
+        neo4j_max_connection_pool_size=neo4j_config["max_connection_pool_size"],
+        neo4j_connection_acquisition_timeout=neo4j_config[
+            "connection_acquisition_timeout"
+        ],
+        neo4j_max_transaction_retry_time=neo4j_config["max_transaction_retry_time"],
         lancedb_path=tmp_path / "lancedb",
     )
     tm = TraceMem(config=config, embedder=mock_embedder)
@@ -159,7 +171,11 @@ async def tracemem_integration(
     async with cleanup_store._driver.session(
         database=neo4j_config["database"]
     ) as session:
-        await session.run("MATCH (n) DETACH DELETE n")
+        # Batched delete keeps each transaction bounded; needs auto-commit
+        result = await session.run(
+            "MATCH (n) CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS"
+        )
+        await result.consume()
     await cleanup_store.close()
 
 
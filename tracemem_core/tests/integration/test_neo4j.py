@@ -85,10 +85,10 @@ class TestResourceVersionEdges:
                 RETURN v.content_hash as version_hash, res.uri as resource_uri
                 """
             )
-            records = await result.data()
-            assert len(records) == 1
+            # strict=True fails unless exactly one record matched
+            record = await result.single(strict=True)
             assert (
-                records[0]["version_hash"]
+                record["version_hash"]
                 == hashlib.sha256("version 1".encode()).hexdigest()
             )
 
@@ -401,9 +401,8 @@ class TestTurnIndexNeo4j:
                 ORDER BY a.created_at
                 """
             )
-            records = await result.data()
-            assert len(records) == 2
-            assert all(r["turn_index"] == 0 for r in records)
+            turn_indexes = await result.value("turn_index")
+            assert turn_indexes == [0, 0]
 
     async def test_turn_based_chain_query(self, tracemem_integration: TraceMem):
         """Can query all nodes in a specific turn."""
@@ -428,10 +427,8 @@ class TestTurnIndexNeo4j:
                 ORDER BY n.created_at
                 """
             )
-            records = await result.data()
-            assert len(records) == 2
-            assert records[0]["text"] == "User 1"
-            assert records[1]["text"] == "Agent 1"
+            texts = await result.value("text")
+            assert texts == ["User 1", "Agent 1"]
 
 
 class TestToolUsesIntegration:
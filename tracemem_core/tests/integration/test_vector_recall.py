@@ -144,40 +144,45 @@ class TestVectorRecall:
             f"Expected at least 3 trading results, got {trading_count}"
         )
 
-    async def test_hybrid_search_finds_specific_stock_ticker(
-        self, vector_store, openai_embedder
-    ):
-        """Test that hybrid search finds documents with specific stock tickers."""
-        # Documents mentioning various tickers
+    @pytest.fixture
+    async def ticker_store(self, vector_store, openai_embedder):
+        """Vector store seeded with one document per stock ticker."""
         documents = [
             "Bought 100 shares of TSLA at $245, planning to hold long term",
             "My GOOGL position is up 15% since I bought last month",
             "Considering selling my MSFT shares after the earnings report",
             "Added AMZN to my watchlist for a potential breakout play",
+            "NVDA is breaking out above resistance after earnings",
         ]
-
-        for i, text in enumerate(documents):
-            embedding = await openai_embedder.embed(text)
+        embeddings = await openai_embedder.embed_batch(documents)
+        for i, (text, embedding) in enumerate(zip(documents, embeddings)):
             await vector_store.add(
                 node_id=uuid4(),
                 text=text,
                 vector=embedding,
                 conversation_id=f"conv-{i}",
             )
+        return vector_store
 
-        # Search for specific ticker - FTS should boost exact match
-        query_text = "TSLA"
+    @pytest.mark.parametrize(
+        "query_text,must_contain", [("TSLA", "TSLA"), ("NVDA", "NVDA")]
+    )
+    async def test_hybrid_search_finds_specific_stock_ticker(
+        self, ticker_store, openai_embedder, query_text, must_contain
+    ):
+        """Weighted RRF (70% vector / 30% FTS) ranks the exact ticker match first."""
         query_vector = await openai_embedder.embed(query_text)
 
-        results = await vector_store.search(
+        results = await ticker_store.search(
             query_vector=query_vector,
             query_text=query_text,
             limit=2,
+            vector_weight=0.7,
+            reranker="rrf",
         )
 
-        # Should find the document with TSLA
-        assert any("TSLA" in r.text for r in results), (
-            f"Expected to find TSLA in results: {[r.text for r in results]}"
+        assert must_contain in results[0].text, (
+            f"Expected {must_contain} ranked first: {[r.text for r in results]}"
         )
 
     async def test_hybrid_search_finds_ticker_or_company_name(
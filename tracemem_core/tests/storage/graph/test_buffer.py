@@ -0,0 +1,75 @@
+"""Unit tests for the buffered graph writer used by imports."""
+
+from tracemem_core.models.edges import Relationship
+from tracemem_core.models.nodes import AgentText, Resource, ResourceVersion, UserText
+from tracemem_core.storage.graph.buffer import BufferedGraphWriter
+
+
+class TestBufferedGraphWriter:
+    """Tests for BufferedGraphWriter."""
+
+    async def test_reads_fall_back_to_store(self, mock_graph_store):
+        """Test that reads go to the store until a queued write answers them."""
+        stored_agent = AgentText(text="old", conversation_id="conv-1", turn_index=2)
+        mock_graph_store.get_max_turn_index.return_value = 2
+        mock_graph_store.get_last_agent_text.return_value = stored_agent
+        writer = BufferedGraphWriter(mock_graph_store)
+
+        assert await writer.get_max_turn_index("conv-1") == 2
+        assert await writer.get_last_agent_text("conv-1") is stored_agent
+
+        user = UserText(text="new", conversation_id="conv-1", turn_index=3)
+        await writer.create_node(user)
+        agent = AgentText(text="reply", conversation_id="conv-1", turn_index=3)
+        await writer.create_node(agent)
+
+        assert await writer.get_max_turn_index("conv-1") == 3
+        assert await writer.get_last_agent_text("conv-1") is agent
+        assert await writer.get_last_node_in_turn("conv-1", 3) is agent
+        assert mock_graph_store.get_max_turn_index.await_count == 1
+        mock_graph_store.create_node.assert_not_awaited()
+
+    async def test_resource_hash_update_is_visible(self, mock_graph_store):
+        """Test that queued resources, versions and hash updates are read back."""
+        writer = BufferedGraphWriter(mock_graph_store)
+        resource = Resource(
+            uri="file://a.py", current_content_hash="h1", conversation_id="conv-1"
+        )
+        version = ResourceVersion(
+            content_hash="h1", uri="file://a.py", conversation_id="conv-1"
+        )
+        await writer.create_node(resource)
+        await writer.create_node(version)
+        await writer.update_resource_hash("file://a.py", "h2")
+
+        found = await writer.get_resource_by_uri("file://a.py")
+        assert found.current_content_hash == "h2"
+        assert resource.current_content_hash == "h1"  # Queued node unchanged
+        assert await writer.get_resource_version_by_hash("file://a.py", "h1") is version
+        mock_graph_store.get_resource_by_uri.assert_not_awaited()
+
+    async def test_flush_writes_nodes_edges_then_hashes(self, mock_graph_store):
+        """Test that flush issues one bulk call per kind, in dependency order."""
+        writer = BufferedGraphWriter(mock_graph_store)
+        user = UserText(text="hi", conversation_id="conv-1", turn_index=0)
+        agent = AgentText(text="hello", conversation_id="conv-1", turn_index=0)
+        edge = Relationship(
+            source_id=user.id, target_id=agent.id, conversation_id="conv-1"
+        )
+        resource = Resource(uri="file://a.py", conversation_id="conv-1")
+        await writer.create_node(user)
+        await writer.create_node(agent)
+        await writer.create_edge(edge)
+        await writer.create_node(resource)
+        await writer.update_resource_hash("file://a.py", "h2")
+
+        await writer.flush()
+        await writer.flush()  # Nothing left to write
+
+        mock_graph_store.create_nodes.assert_awaited_once_with([user, agent, resource])
+        mock_graph_store.create_edges.assert_awaited_once_with([edge])
+        mock_graph_store.update_resource_hash.assert_awaited_once_with(
+            "file://a.py", "h2"
+        )
+        calls = [c[0] for c in mock_graph_store.mock_calls]
+        assert calls.index("create_edges") < calls.index("update_resource_hash")
@@ -0,0 +1,57 @@
+"""Unit tests for the graph store read cache."""
+
+from tracemem_core.storage.graph.cache import ReadCache
+
+
+class TestReadCache:
+    """Tests for ReadCache."""
+
+    def test_get_returns_cached_value(self):
+        """Test that a stored value is returned and counted as a hit."""
+        cache = ReadCache()
+        cache.set(("k",), [1])
+
+        assert cache.get(("k",)) == [1]
+        assert cache.stats() == {"hits": 1, "misses": 0, "size": 1}
+
+    def test_expired_entry_is_a_miss(self, mocker):
+        """Test that entries past their TTL are dropped."""
+        clock = mocker.patch("tracemem_core.storage.graph.cache.time.monotonic")
+        clock.return_value = 100.0
+        cache = ReadCache(ttl=5.0)
+        cache.set("k", "v")
+
+        clock.return_value = 106.0
+
+        assert cache.get("k") is None
+        assert cache.stats() == {"hits": 0, "misses": 1, "size": 0}
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that ttl=0 never stores entries."""
+        cache = ReadCache(ttl=0)
+        cache.set("k", "v")
+
+        assert cache.get("k") is None
+
+    def test_maxsize_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ReadCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_evict_drops_matching_keys(self):
+        """Test that evict only removes keys matching the predicate."""
+        cache = ReadCache()
+        cache.set(("x", 1), 1)
+        cache.set(("y", 2), 2)
+
+        cache.evict(lambda key: key[0] == "x")
+
+        assert cache.get(("x", 1)) is None
+        assert cache.get(("y", 2)) == 2
@@ -6,12 +6,15 @@ Run with:
     uv run pytest tests/storage/graph/test_kuzu.py -v
 """
 
-from uuid import uuid4
+import asyncio
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
 
 import pytest
 
 from tracemem_core.models.edges import Relationship, VersionOf
 from tracemem_core.models.nodes import AgentText, Resource, ResourceVersion, UserText
+from tracemem_core.storage.graph.buffer import BufferedGraphWriter
 from tracemem_core.storage.graph.kuzu_store import KuzuGraphStore
 
 
@@ -25,6 +28,55 @@ async def graph_store(tmp_path):
     await store.close()
 
 
+async def build_tool_use_scenario(
+    graph_store: KuzuGraphStore,
+    *,
+    conversation_id: str = "c1",
+    user_text: str = "Read file",
+    uri: str = "file://test.py",
+    tool_name: str = "READ",
+) -> dict[str, UUID]:
+    """Create a user -> agent -[tool]-> version -> resource chain in one query.
+
+    Returns the created node ids keyed by "user", "agent", "version" and
+    "resource".
+    """
+    ids = {key: uuid4() for key in ("user", "agent", "version", "resource")}
+    await graph_store.execute_cypher(
+        """
+        CREATE (u:UserText {id: $user, text: $user_text, conversation_id: $cid,
+                            turn_index: 0, created_at: $now, last_accessed_at: $now})
+        CREATE (a:AgentText {id: $agent, text: 'Reading', conversation_id: $cid,
+                             turn_index: 0, tool_uses: '[]', created_at: $now,
+                             last_accessed_at: $now})
+        CREATE (rv:ResourceVersion {id: $version, content_hash: 'h1', uri: $uri,
+                                   conversation_id: $cid, created_at: $now,
+                                   last_accessed_at: $now})
+        CREATE (res:Resource {id: $resource, uri: $uri, current_content_hash: 'h1',
+                             conversation_id: $cid, created_at: $now,
+                             last_accessed_at: $now})
+        CREATE (u)-[:MESSAGE {id: $message_edge, conversation_id: $cid,
+                              created_at: $now, properties: '{}'}]->(a)
+        CREATE (rv)-[:VERSION_OF {id: $version_edge, created_at: $now}]->(res)
+        CREATE (a)-[:TOOL_USE {id: $tool_edge, tool_name: $tool_name,
+                               conversation_id: $cid, created_at: $now,
+                               properties: '{}'}]->(rv)
+        """,
+        {
+            **{key: str(value) for key, value in ids.items()},
+            "message_edge": str(uuid4()),
+            "version_edge": str(uuid4()),
+            "tool_edge": str(uuid4()),
+            "cid": conversation_id,
+            "user_text": user_text,
+            "uri": uri,
+            "tool_name": tool_name,
+            "now": datetime.now(UTC).isoformat(),
+        },
+    )
+    return ids
+
+
 # =============================================================================
 # Lifecycle Tests
 # =============================================================================
@@ -121,7 +173,10 @@ class TestKuzuGraphStoreCreateNode:
         assert result.uri == "file:///test.py"
 
     async def test_create_resource_returns_existing_on_duplicate_uri(self, graph_store):
-        """Test MERGE behavior for Resource with existing URI."""
+        """Test MERGE behavior for Resource with existing URI.
+
+        The uri-derived id means the second caller's id is the stored one.
+        """
         res1 = Resource(
             uri="file:///shared.py",
             current_content_hash="hash1",
@@ -136,9 +191,77 @@ class TestKuzuGraphStoreCreateNode:
         result1 = await graph_store.create_node(res1)
         result2 = await graph_store.create_node(res2)
 
-        assert result1.id == result2.id
+        assert result1.id == result2.id == res2.id
         assert result2.current_content_hash == "hash1"
 
+    async def test_concurrent_imports_share_new_resource(self, graph_store):
+        """Edges queued by two imports that both found the uri missing survive."""
+        writers = [BufferedGraphWriter(graph_store) for _ in range(2)]
+        for i, writer in enumerate(writers):
+            assert await writer.get_resource_by_uri("file:///new.py") is None
+            resource = await writer.create_node(
+                Resource(uri="file:///new.py", conversation_id=f"conv{i}")
+            )
+            version = await writer.create_node(
+                ResourceVersion(
+                    content_hash=f"hash{i}",
+                    uri="file:///new.py",
+                    conversation_id=f"conv{i}",
+                )
+            )
+            await writer.create_edge(
+                VersionOf(version_id=version.id, resource_id=resource.id)
+            )
+
+        for writer in writers:
+            await writer.flush()
+
+        rows = await graph_store.execute_cypher(
+            "MATCH (v:ResourceVersion)-[:VERSION_OF]->(r:Resource) RETURN count(v) AS n"
+        )
+        assert rows == [{"n": 2}]
+
+    async def test_create_resource_matches_existing_random_id(self, graph_store):
+        """Resources stored with a random (pre-uuid5) id still merge on uri."""
+        legacy = await graph_store.create_node(
+            Resource(id=uuid4(), uri="file:///legacy.py", conversation_id="conv1")
+        )
+
+        result = await graph_store.create_node(
+            Resource(uri="file:///legacy.py", conversation_id="conv2")
+        )
+
+        assert result.id == legacy.id
+        rows = await graph_store.execute_cypher(
+            "MATCH (r:Resource) WHERE r.uri = 'file:///legacy.py' RETURN r.id"
+        )
+        assert len(rows) == 1
+
+    async def test_create_node_is_safe_under_concurrency(self, graph_store):
+        """Test that concurrent create_node calls on one store all persist."""
+        nodes = [
+            UserText(text=f"msg {i}", conversation_id="conv1", turn_index=i)
+            for i in range(5)
+        ]
+
+        await asyncio.gather(*(graph_store.create_node(n) for n in nodes))
+
+        assert await graph_store.get_max_turn_index("conv1") == 4
+
+    async def test_create_nodes_merges_resources(self, graph_store):
+        """Test that create_nodes keeps create_node semantics for each node."""
+        existing = await graph_store.create_node(
+            Resource(uri="file:///shared.py", conversation_id="conv1")
+        )
+        user = UserText(text="Batch", conversation_id="conv2")
+        duplicate = Resource(uri="file:///shared.py", conversation_id="conv2")
+
+        results = await graph_store.create_nodes([user, duplicate])
+
+        assert results[0] is user
+        assert results[1].id == existing.id
+        assert await graph_store.get_user_text(user.id) is not None
+
     async def test_user_text_persists_all_fields(self, graph_store):
         """Test that UserText fields are correctly persisted."""
         node = UserText(text="Test message", conversation_id="conv123", turn_index=5)
@@ -380,10 +503,9 @@ class TestKuzuGraphStoreContext:
         """Test basic context retrieval."""
         u = UserText(text="Read my file", conversation_id="c1")
         a = AgentText(text="Here it is", conversation_id="c1")
-        await graph_store.create_node(u)
-        await graph_store.create_node(a)
-        await graph_store.create_edge(
-            Relationship(source_id=u.id, target_id=a.id, conversation_id="c1")
+        await graph_store.create_nodes([u, a])
+        await graph_store.create_edges(
+            [Relationship(source_id=u.id, target_id=a.id, conversation_id="c1")]
         )
 
         ctx = await graph_store.get_node_context(u.id)
@@ -394,38 +516,50 @@ class TestKuzuGraphStoreContext:
 
     async def test_get_node_context_with_tool_uses(self, graph_store):
         """Test context retrieval with tool uses."""
-        u = UserText(text="Read file", conversation_id="c1")
-        a = AgentText(text="Reading", conversation_id="c1")
-        rv = ResourceVersion(
-            content_hash="h1", uri="file://test.py", conversation_id="c1"
-        )
-        res = Resource(
-            uri="file://test.py", current_content_hash="h1", conversation_id="c1"
-        )
-        await graph_store.create_node(u)
-        await graph_store.create_node(a)
-        await graph_store.create_node(rv)
-        await graph_store.create_node(res)
-
-        await graph_store.create_edge(
-            Relationship(source_id=u.id, target_id=a.id, conversation_id="c1")
-        )
-        await graph_store.create_edge(VersionOf(version_id=rv.id, resource_id=res.id))
-        await graph_store.create_edge(
-            Relationship(
-                source_id=a.id,
-                target_id=rv.id,
-                relationship_type="READ",
-                conversation_id="c1",
-            )
-        )
+        ids = await build_tool_use_scenario(graph_store)
 
-        ctx = await graph_store.get_node_context(u.id)
+        ctx = await graph_store.get_node_context(ids["user"])
         assert len(ctx.tool_uses) == 1
         assert ctx.tool_uses[0].tool_name == "READ"
         assert ctx.tool_uses[0].resource_version is not None
         assert ctx.tool_uses[0].resource is not None
 
+    async def test_read_cache_disabled_by_default(self, graph_store):
+        """Without a TTL, repeated reads always query the database."""
+        ids = await build_tool_use_scenario(graph_store)
+
+        await graph_store.get_node_context(ids["user"])
+        await graph_store.get_node_context(ids["user"])
+        assert graph_store.cache_stats() == {"hits": 0, "misses": 2, "size": 0}
+
+    async def test_get_node_context_is_cached_until_write(self, tmp_path):
+        """Test that repeated context reads hit the cache and writes clear it."""
+        graph_store = KuzuGraphStore(db_path=tmp_path / "graph", read_cache_ttl=5.0)
+        await graph_store.connect()
+        await graph_store.initialize_schema()
+        u = UserText(text="Read my file", conversation_id="c1")
+        a = AgentText(text="Here it is", conversation_id="c1")
+        await graph_store.create_nodes([u, a])
+
+        first = await graph_store.get_node_context(u.id)
+        first.user_text.text = "mutated by caller"
+        second = await graph_store.get_node_context(u.id)
+        assert second.user_text.text == "Read my file"
+        assert second.agent_text is None
+        assert graph_store.cache_stats()["hits"] == 1
+
+        await graph_store.create_edges(
+            [Relationship(source_id=u.id, target_id=a.id, conversation_id="c1")]
+        )
+
+        third = await graph_store.get_node_context(u.id)
+        assert third.agent_text is not None
+        assert third.agent_text.text == "Here it is"
+
+        await graph_store.update_resource_hash("file://test.py", "h2")
+        assert graph_store.cache_stats()["size"] == 0
+        await graph_store.close()
+
     async def test_get_node_context_not_found(self, graph_store):
         """Test context for non-existent node."""
         ctx = await graph_store.get_node_context(uuid4())
@@ -437,15 +571,13 @@ class TestKuzuGraphStoreContext:
         u = UserText(text="User", conversation_id="c1", turn_index=0)
         a1 = AgentText(text="Agent1", conversation_id="c1", turn_index=0)
         a2 = AgentText(text="Agent2", conversation_id="c1", turn_index=0)
-        await graph_store.create_node(u)
-        await graph_store.create_node(a1)
-        await graph_store.create_node(a2)
+        await graph_store.create_nodes([u, a1, a2])
 
-        await graph_store.create_edge(
-            Relationship(source_id=u.id, target_id=a1.id, conversation_id="c1")
-        )
-        await graph_store.create_edge(
-            Relationship(source_id=a1.id, target_id=a2.id, conversation_id="c1")
+        await graph_store.create_edges(
+            [
+                Relationship(source_id=u.id, target_id=a1.id, conversation_id="c1"),
+                Relationship(source_id=a1.id, target_id=a2.id, conversation_id="c1"),
+            ]
         )
 
         nodes = await graph_store.get_trajectory_nodes(u.id)
@@ -455,33 +587,34 @@ class TestKuzuGraphStoreContext:
         assert "UserText" in labels
         assert "AgentText" in labels
 
-    async def test_get_resource_conversations(self, graph_store):
-        """Test finding conversations that accessed a resource."""
-        u = UserText(text="Read file", conversation_id="c1")
-        a = AgentText(text="Reading", conversation_id="c1")
-        rv = ResourceVersion(
-            content_hash="h1", uri="file://test.py", conversation_id="c1"
-        )
-        res = Resource(
-            uri="file://test.py", current_content_hash="h1", conversation_id="c1"
+    async def test_get_trajectory_nodes_stops_at_next_user_text(self, graph_store):
+        """Traversal includes the next UserText but nothing after it."""
+        u1 = UserText(text="First", conversation_id="c1", turn_index=0)
+        a1 = AgentText(text="Answer1", conversation_id="c1", turn_index=0)
+        u2 = UserText(text="Second", conversation_id="c1", turn_index=1)
+        a2 = AgentText(text="Answer2", conversation_id="c1", turn_index=1)
+        await graph_store.create_nodes([u1, a1, u2, a2])
+        await graph_store.create_edges(
+            [
+                Relationship(source_id=u1.id, target_id=a1.id, conversation_id="c1"),
+                Relationship(source_id=a1.id, target_id=u2.id, conversation_id="c1"),
+                Relationship(source_id=u2.id, target_id=a2.id, conversation_id="c1"),
+            ]
         )
-        await graph_store.create_node(u)
-        await graph_store.create_node(a)
-        await graph_store.create_node(rv)
-        await graph_store.create_node(res)
 
-        await graph_store.create_edge(
-            Relationship(source_id=u.id, target_id=a.id, conversation_id="c1")
-        )
-        await graph_store.create_edge(VersionOf(version_id=rv.id, resource_id=res.id))
-        await graph_store.create_edge(
-            Relationship(
-                source_id=a.id,
-                target_id=rv.id,
-                relationship_type="READ",
-                conversation_id="c1",
-            )
+        nodes = await graph_store.get_trajectory_nodes(u1.id)
+        assert [n["n"]["text"] for n in nodes] == ["First", "Answer1", "Second"]
+
+        batch = await graph_store.get_trajectory_nodes_batch(
+            [u2.id, u1.id, uuid4(), u2.id]
         )
+        assert [n["n"]["text"] for n in batch[str(u2.id)]] == ["Second", "Answer2"]
+        assert batch[str(u1.id)] == nodes
+        assert len(batch) == 3
+
+    async def test_get_resource_conversations(self, graph_store):
+        """Test finding conversations that accessed a resource."""
+        await build_tool_use_scenario(graph_store)
 
         convs = await graph_store.get_resource_conversations("file://test.py")
         assert len(convs) == 1
@@ -490,31 +623,7 @@ class TestKuzuGraphStoreContext:
 
     async def test_get_resource_conversations_with_exclude(self, graph_store):
         """Test excluding a conversation from resource results."""
-        u = UserText(text="Read file", conversation_id="c1")
-        a = AgentText(text="Reading", conversation_id="c1")
-        rv = ResourceVersion(
-            content_hash="h1", uri="file://test.py", conversation_id="c1"
-        )
-        res = Resource(
-            uri="file://test.py", current_content_hash="h1", conversation_id="c1"
-        )
-        await graph_store.create_node(u)
-        await graph_store.create_node(a)
-        await graph_store.create_node(rv)
-        await graph_store.create_node(res)
-
-        await graph_store.create_edge(
-            Relationship(source_id=u.id, target_id=a.id, conversation_id="c1")
-        )
-        await graph_store.create_edge(VersionOf(version_id=rv.id, resource_id=res.id))
-        await graph_store.create_edge(
-            Relationship(
-                source_id=a.id,
-                target_id=rv.id,
-                relationship_type="READ",
-                conversation_id="c1",
-            )
-        )
+        await build_tool_use_scenario(graph_store)
 
         convs = await graph_store.get_resource_conversations(
             "file://test.py", exclude_conversation_id="c1"
@@ -537,7 +646,7 @@ class TestKuzuGraphStoreExecuteCypher:
 
         results = await graph_store.execute_cypher(
             "MATCH (n:UserText) WHERE n.id = $id RETURN n.text as text",
-            {"id": str(user.id)},
+            {"id": user.id_str},
         )
         assert len(results) == 1
         assert results[0]["text"] == "Test"
@@ -7,7 +7,10 @@ Run tests with:
     uv run pytest tests/storage/graph/ -v
 """
 
+import asyncio
 import json
+from collections.abc import Iterator
+from contextlib import contextmanager
 from uuid import uuid4
 
 import pytest
@@ -16,12 +19,45 @@ pytest.importorskip("neo4j", reason="neo4j driver not installed")
 
 from tracemem_core.models.edges import Relationship, VersionOf
 from tracemem_core.models.nodes import AgentText, Resource, ResourceVersion, UserText
-from tracemem_core.storage.graph.neo import Neo4jGraphStore
+from tracemem_core.storage.graph.neo import QUERIES, Neo4jGraphStore
 
 pytestmark = pytest.mark.neo4j
 
+# Deletes one namespace's nodes via the per-label namespace indexes, in
+# bounded batches. Must run as an auto-commit query (session.run).
+CLEAR_NAMESPACE = """
+    CALL {
+        MATCH (n:UserText {namespace: $namespace}) RETURN n
+        UNION MATCH (n:AgentText {namespace: $namespace}) RETURN n
+        UNION MATCH (n:ResourceVersion {namespace: $namespace}) RETURN n
+        UNION MATCH (n:Resource {namespace: $namespace}) RETURN n
+    }
+    CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS
+"""
 
-@pytest.fixture
+
+async def clear_namespace(store: Neo4jGraphStore) -> None:
+    """Delete every node the store wrote under its namespace."""
+    async with store._session() as session:
+        result = await session.run(CLEAR_NAMESPACE, namespace=store._namespace)
+        await result.consume()
+
+
+@contextmanager
+def use_namespace(store: Neo4jGraphStore, namespace: str) -> Iterator[None]:
+    """Point a connected store at another namespace for the block."""
+    previous = store._namespace
+    # Cache keys don't include the namespace, so drop entries on each switch
+    store._namespace = namespace
+    store._read_cache.clear()
+    try:
+        yield
+    finally:
+        store._namespace = previous
+        store._read_cache.clear()
+
+
+@pytest.fixture(scope="module")
 def neo4j_config():
     """Neo4j connection config for tests."""
     return {
@@ -29,22 +65,31 @@ def neo4j_config():
         "user": "neo4j",
         "password": "testpassword",
         "database": "neo4j",
+        "max_connection_pool_size": 10,
+        "connection_acquisition_timeout": 5.0,
+        "max_transaction_retry_time": 5.0,
     }
 
 
-@pytest.fixture
-async def graph_store(neo4j_config):
-    """Connected Neo4jGraphStore with clean database."""
-    store = Neo4jGraphStore(**neo4j_config)
+@pytest.fixture(scope="module")
+async def module_store(neo4j_config):
+    """Neo4jGraphStore connected and schema-initialized once per module."""
+    store = Neo4jGraphStore(**neo4j_config, namespace="pytest")
     await store.connect()
     await store.initialize_schema()
     yield store
-    # Cleanup: delete all nodes and relationships
-    async with store._driver.session(database=neo4j_config["database"]) as session:
-        await session.run("MATCH (n) DETACH DELETE n")
     await store.close()
 
 
+@pytest.fixture
+async def graph_store(module_store):
+    """The module's store, isolated in a fresh per-test namespace."""
+    with use_namespace(module_store, f"pytest-{uuid4()}"):
+        yield module_store
+        # Cleanup: delete only this test's nodes and their relationships
+        await clear_namespace(module_store)
+
+
 # =============================================================================
 # Lifecycle Tests (3 tests)
 # =============================================================================
@@ -90,23 +135,25 @@ class TestNeo4jGraphStoreLifecycle:
 
     async def test_initialize_schema_creates_constraints(self, graph_store):
         """Test that initialize_schema creates expected constraints and indexes."""
-        async with graph_store._driver.session(database="neo4j") as session:
-            # Check constraints
-            result = await session.run("SHOW CONSTRAINTS")
-            constraints = await result.data()
-            constraint_names = [c["name"] for c in constraints]
-            assert "resource_uri" in constraint_names
-
-            # Check indexes
-            result = await session.run("SHOW INDEXES")
-            indexes = await result.data()
-            index_names = [i["name"] for i in indexes]
-            assert "resource_version_hash" in index_names
-            assert "user_text_conversation" in index_names
-            assert "user_text_id" in index_names
-            assert "agent_text_id" in index_names
-            assert "resource_version_id" in index_names
-            assert "resource_id" in index_names
+        # Uniqueness constraints own a backing index, so one SHOW INDEXES call
+        # reports both (SHOW commands cannot be nested in CALL subqueries)
+        async with graph_store._session() as session:
+            result = await session.run(
+                "SHOW INDEXES YIELD name, owningConstraint, state "
+                "RETURN collect(name) AS i, collect(owningConstraint) AS c, "
+                "collect(DISTINCT state) AS s"
+            )
+            record = await result.single()
+        assert record is not None
+        assert "resource_uri" in record["c"]
+        assert "resource_version_hash" in record["i"]
+        assert "user_text_conversation" in record["i"]
+        assert "user_text_id" in record["i"]
+        assert "agent_text_id" in record["i"]
+        assert "resource_version_id" in record["i"]
+        assert "resource_id" in record["i"]
+        # initialize_schema waits for every index to come online
+        assert record["s"] == ["ONLINE"]
 
 
 # =============================================================================
@@ -175,18 +222,19 @@ class TestNeo4jGraphStoreCreateNode:
         await graph_store.create_node(node)
 
         # Retrieve and verify
-        async with graph_store._driver.session(database="neo4j") as session:
+        async with graph_store._session() as session:
             result = await session.run(
-                "MATCH (n:UserText {id: $id}) RETURN n",
-                id=str(node.id),
+                "MATCH (n:UserText {id: $id}) "
+                "RETURN n.text AS text, n.conversation_id AS conversation_id, "
+                "n.created_at AS created_at, n.last_accessed_at AS last_accessed_at",
+                id=node.id_str,
             )
             record = await result.single()
             assert record is not None
-            n = record["n"]
-            assert n["text"] == "Test message"
-            assert n["conversation_id"] == "conv123"
-            assert n["created_at"] is not None
-            assert n["last_accessed_at"] is not None
+            assert record["text"] == "Test message"
+            assert record["conversation_id"] == "conv123"
+            assert record["created_at"] is not None
+            assert record["last_accessed_at"] is not None
 
     async def test_create_node_agent_text_persists_all_fields(self, graph_store):
         """Test that AgentText fields are correctly persisted in Neo4j."""
@@ -195,16 +243,16 @@ class TestNeo4jGraphStoreCreateNode:
         await graph_store.create_node(node)
 
         # Retrieve and verify
-        async with graph_store._driver.session(database="neo4j") as session:
+        async with graph_store._session() as session:
             result = await session.run(
-                "MATCH (n:AgentText {id: $id}) RETURN n",
-                id=str(node.id),
+                "MATCH (n:AgentText {id: $id}) "
+                "RETURN n.text AS text, n.conversation_id AS conversation_id",
+                id=node.id_str,
             )
             record = await result.single()
             assert record is not None
-            n = record["n"]
-            assert n["text"] == "Agent response"
-            assert n["conversation_id"] == "conv456"
+            assert record["text"] == "Agent response"
+            assert record["conversation_id"] == "conv456"
 
     async def test_create_node_resource_version_persists_all_fields(self, graph_store):
         """Test that ResourceVersion fields are correctly persisted in Neo4j."""
@@ -217,17 +265,18 @@ class TestNeo4jGraphStoreCreateNode:
         await graph_store.create_node(node)
 
         # Retrieve and verify
-        async with graph_store._driver.session(database="neo4j") as session:
+        async with graph_store._session() as session:
             result = await session.run(
-                "MATCH (n:ResourceVersion {id: $id}) RETURN n",
-                id=str(node.id),
+                "MATCH (n:ResourceVersion {id: $id}) "
+                "RETURN n.content_hash AS content_hash, n.uri AS uri, "
+                "n.conversation_id AS conversation_id",
+                id=node.id_str,
             )
             record = await result.single()
             assert record is not None
-            n = record["n"]
-            assert n["content_hash"] == "sha256:abc123"
-            assert n["uri"] == "file:///path/to/file.py"
-            assert n["conversation_id"] == "conv789"
+            assert record["content_hash"] == "sha256:abc123"
+            assert record["uri"] == "file:///path/to/file.py"
+            assert record["conversation_id"] == "conv789"
 
     # Resource MERGE behavior test
 
@@ -255,6 +304,31 @@ class TestNeo4jGraphStoreCreateNode:
         # Original hash should be preserved (ON CREATE SET)
         assert result2.current_content_hash == "hash1"
 
+    async def test_create_node_is_safe_under_concurrency(self, graph_store):
+        """Test that concurrent create_node calls on one store all persist."""
+        nodes = [UserText(text=f"msg {i}", conversation_id="conv1") for i in range(5)]
+
+        await asyncio.gather(*(graph_store.create_node(n) for n in nodes))
+
+        for node in nodes:
+            assert await graph_store.get_user_text(node.id) is not None
+
+    async def test_create_nodes_batches_labels_and_merges_resources(self, graph_store):
+        """Test that create_nodes writes every label and merges Resources on uri."""
+        existing = await graph_store.create_node(
+            Resource(uri="file:///shared.py", conversation_id="conv1")
+        )
+        user = UserText(text="Batch", conversation_id="conv2")
+        agent = AgentText(text="Done", conversation_id="conv2")
+        duplicate = Resource(uri="file:///shared.py", conversation_id="conv2")
+
+        results = await graph_store.create_nodes([user, agent, duplicate])
+
+        assert results[0] is user
+        assert results[1] is agent
+        assert results[2].id == existing.id
+        assert await graph_store.get_user_text(user.id) is not None
+
 
 # =============================================================================
 # Edge Creation Tests (5 tests)
@@ -271,8 +345,7 @@ class TestNeo4jGraphStoreCreateEdge:
         # Create source and target nodes first
         user = UserText(text="User message", conversation_id="conv1")
         agent = AgentText(text="Agent response", conversation_id="conv1")
-        await graph_store.create_node(user)
-        await graph_store.create_node(agent)
+        await graph_store.create_nodes([user, agent])
 
         edge = Relationship(
             source_id=user.id,
@@ -299,8 +372,7 @@ class TestNeo4jGraphStoreCreateEdge:
             current_content_hash="abc123",
             conversation_id="conv1",
         )
-        await graph_store.create_node(version)
-        await graph_store.create_node(resource)
+        await graph_store.create_nodes([version, resource])
 
         edge = VersionOf(version_id=version.id, resource_id=resource.id)
 
@@ -315,8 +387,7 @@ class TestNeo4jGraphStoreCreateEdge:
         """Test that Relationship properties are correctly persisted."""
         user = UserText(text="Edit file", conversation_id="conv1")
         agent = AgentText(text="Done", conversation_id="conv1")
-        await graph_store.create_node(user)
-        await graph_store.create_node(agent)
+        await graph_store.create_nodes([user, agent])
 
         edge = Relationship(
             source_id=user.id,
@@ -328,18 +399,42 @@ class TestNeo4jGraphStoreCreateEdge:
 
         await graph_store.create_edge(edge)
 
-        # Verify properties are persisted (as JSON string)
-        async with graph_store._driver.session(database="neo4j") as session:
+        # Verify properties are persisted as native relationship properties
+        async with graph_store._session() as session:
             result = await session.run(
                 "MATCH ()-[r:EDIT {id: $id}]->() RETURN r",
-                id=str(edge.id),
+                id=edge.id_str,
             )
             record = await result.single()
             assert record is not None
             r = record["r"]
-            properties = json.loads(r["properties"])
-            assert properties["line_start"] == 10
-            assert properties["line_end"] == 20
+            assert r["prop_line_start"] == 10
+            assert r["prop_line_end"] == 20
+            assert "properties" not in r
+
+    async def test_create_edge_nested_properties_fall_back_to_json(self, graph_store):
+        """Test that non-scalar properties are kept as one JSON string."""
+        user = UserText(text="Run it", conversation_id="conv1")
+        agent = AgentText(text="Done", conversation_id="conv1")
+        await graph_store.create_nodes([user, agent])
+
+        edge = Relationship(
+            source_id=user.id,
+            target_id=agent.id,
+            relationship_type="BASH",
+            conversation_id="conv1",
+            properties={"command": "ls", "env": {"CI": "1"}},
+        )
+
+        await graph_store.create_edge(edge)
+
+        async with graph_store._session() as session:
+            result = await session.run(
+                "MATCH ()-[r:BASH {id: $id}]->() RETURN r.properties AS properties",
+                id=edge.id_str,
+            )
+            stored = await result.single(strict=True)
+        assert json.loads(stored["properties"]) == {"command": "ls", "env": {"CI": "1"}}
 
     async def test_create_edge_relationship_different_types(self, graph_store):
         """Test creating relationships with different types."""
@@ -349,34 +444,29 @@ class TestNeo4jGraphStoreCreateEdge:
             uri="file:///test.py",
             conversation_id="conv1",
         )
-        await graph_store.create_node(agent)
-        await graph_store.create_node(version)
+        await graph_store.create_nodes([agent, version])
 
-        # Create READ relationship
+        # Create READ and WRITE relationships in one batch
         read_edge = Relationship(
             source_id=agent.id,
             target_id=version.id,
             relationship_type="READ",
             conversation_id="conv1",
         )
-        await graph_store.create_edge(read_edge)
-
-        # Create WRITE relationship
         write_edge = Relationship(
             source_id=agent.id,
             target_id=version.id,
             relationship_type="WRITE",
             conversation_id="conv1",
         )
-        await graph_store.create_edge(write_edge)
+        await graph_store.create_edges([read_edge, write_edge])
 
         # Verify both exist with correct types
-        async with graph_store._driver.session(database="neo4j") as session:
+        async with graph_store._session() as session:
             result = await session.run(
                 "MATCH (a:AgentText)-[r]->(v:ResourceVersion) RETURN type(r) as rel_type",
             )
-            records = await result.data()
-            rel_types = {r["rel_type"] for r in records}
+            rel_types = set(await result.value("rel_type"))
             assert "READ" in rel_types
             assert "WRITE" in rel_types
 
@@ -394,21 +484,20 @@ class TestNeo4jGraphStoreCreateEdge:
             current_content_hash="def456",
             conversation_id="conv1",
         )
-        await graph_store.create_node(version)
-        await graph_store.create_node(resource)
+        await graph_store.create_nodes([version, resource])
 
         edge = VersionOf(version_id=version.id, resource_id=resource.id)
-        await graph_store.create_edge(edge)
+        await graph_store.create_edges([edge])
 
         # Verify the relationship exists and connects correctly
-        async with graph_store._driver.session(database="neo4j") as session:
+        async with graph_store._session() as session:
             result = await session.run(
                 """
                 MATCH (v:ResourceVersion {id: $version_id})-[r:VERSION_OF]->(res:Resource {id: $resource_id})
                 RETURN r, v.uri as version_uri, res.uri as resource_uri
                 """,
-                version_id=str(version.id),
-                resource_id=str(resource.id),
+                version_id=version.id_str,
+                resource_id=resource.id_str,
             )
             record = await result.single()
             assert record is not None
@@ -430,15 +519,14 @@ class TestNeo4jGraphStoreExecuteCypher:
         user = UserText(text="Test message", conversation_id="conv1")
         await graph_store.create_node(user)
 
-        # Query it with raw Cypher
+        # Query it with the same statement the store uses
         results = await graph_store.execute_cypher(
-            "MATCH (n:UserText {id: $id}) RETURN n.text as text, n.conversation_id as conv",
-            {"id": str(user.id)},
+            QUERIES["get_user_text"], {"id": user.id_str}
         )
 
         assert len(results) == 1
-        assert results[0]["text"] == "Test message"
-        assert results[0]["conv"] == "conv1"
+        assert results[0]["n"]["text"] == "Test message"
+        assert results[0]["n"]["conversation_id"] == "conv1"
 
     async def test_execute_cypher_raises_when_not_connected(self):
         """Test that execute_cypher raises RuntimeError when not connected."""
@@ -457,15 +545,11 @@ class TestNeo4jGraphStoreNamespace:
     """Tests for namespace-based multi-user isolation."""
 
     @pytest.fixture
-    async def ns_graph_store(self, neo4j_config):
-        """Connected Neo4jGraphStore with namespace set."""
-        store = Neo4jGraphStore(**neo4j_config, namespace="team-alpha")
-        await store.connect()
-        await store.initialize_schema()
-        yield store
-        async with store._driver.session(database=neo4j_config["database"]) as session:
-            await session.run("MATCH (n) DETACH DELETE n")
-        await store.close()
+    async def ns_graph_store(self, module_store):
+        """The module's store switched to the team-alpha namespace."""
+        with use_namespace(module_store, "team-alpha"):
+            yield module_store
+            await clear_namespace(module_store)
 
     async def test_namespace_stored_on_user_text(self, ns_graph_store):
         """UserText nodes should have namespace property set."""
@@ -474,7 +558,7 @@ class TestNeo4jGraphStoreNamespace:
 
         results = await ns_graph_store.execute_cypher(
             "MATCH (n:UserText {id: $id}) RETURN n.namespace as ns",
-            {"id": str(node.id)},
+            {"id": node.id_str},
         )
         assert results[0]["ns"] == "team-alpha"
 
@@ -485,7 +569,7 @@ class TestNeo4jGraphStoreNamespace:
 
         results = await ns_graph_store.execute_cypher(
             "MATCH (n:AgentText {id: $id}) RETURN n.namespace as ns",
-            {"id": str(node.id)},
+            {"id": node.id_str},
         )
         assert results[0]["ns"] == "team-alpha"
 
@@ -498,7 +582,7 @@ class TestNeo4jGraphStoreNamespace:
 
         results = await ns_graph_store.execute_cypher(
             "MATCH (n:ResourceVersion {id: $id}) RETURN n.namespace as ns",
-            {"id": str(node.id)},
+            {"id": node.id_str},
         )
         assert results[0]["ns"] == "team-alpha"
 
@@ -517,34 +601,29 @@ class TestNeo4jGraphStoreNamespace:
         )
         assert results[0]["ns"] == "team-alpha"
 
-    async def test_namespace_filters_queries(self, neo4j_config):
+    async def test_namespace_filters_queries(self, module_store):
         """Queries with namespace should only see nodes in that namespace."""
-        # Create two stores with different namespaces
-        store_a = Neo4jGraphStore(**neo4j_config, namespace="team-a")
-        store_b = Neo4jGraphStore(**neo4j_config, namespace="team-b")
-        await store_a.connect()
-        await store_b.connect()
-        await store_a.initialize_schema()
+        # Create a node in each namespace with the same conversation_id
+        user_a = UserText(text="From team A", conversation_id="shared-conv")
+        user_b = UserText(text="From team B", conversation_id="shared-conv")
 
         try:
-            # Create a node in each namespace with the same conversation_id
-            user_a = UserText(text="From team A", conversation_id="shared-conv")
-            user_b = UserText(text="From team B", conversation_id="shared-conv")
-            await store_a.create_node(user_a)
-            await store_b.create_node(user_b)
+            with use_namespace(module_store, "team-a"):
+                await module_store.create_node(user_a)
+            with use_namespace(module_store, "team-b"):
+                await module_store.create_node(user_b)
 
-            # Each store should only see its own namespace
-            result_a = await store_a.get_last_user_text("shared-conv")
-            result_b = await store_b.get_last_user_text("shared-conv")
+            # Each namespace should only see its own node
+            with use_namespace(module_store, "team-a"):
+                result_a = await module_store.get_last_user_text("shared-conv")
+            with use_namespace(module_store, "team-b"):
+                result_b = await module_store.get_last_user_text("shared-conv")
 
             assert result_a is not None
             assert result_a.text == "From team A"
             assert result_b is not None
             assert result_b.text == "From team B"
         finally:
-            async with store_a._driver.session(
-                database=neo4j_config["database"]
-            ) as session:
-                await session.run("MATCH (n) DETACH DELETE n")
-            await store_a.close()
-            await store_b.close()
+            for namespace in ("team-a", "team-b"):
+                with use_namespace(module_store, namespace):
+                    await clear_namespace(module_store)
@@ -1,39 +1,55 @@
 """Unit tests for LanceDBVectorStore wrapper."""
 
-import random
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import cache
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+import numpy as np
+import pyarrow as pa
 import pytest
 from lancedb.rerankers import LinearCombinationReranker, RRFReranker
 
-from tracemem_core.storage.protocols import VectorSearchResult
+from tracemem_core.storage.protocols import VectorEntry, VectorSearchResult
 from tracemem_core.storage.vector.lance import LanceDBVectorStore
 
+pytestmark = pytest.mark.slow
+
+
+@cache
+def _unit_vector(seed: int, dims: int) -> tuple[float, ...]:
+    """Generate a seeded unit vector once per (seed, dims) for the session."""
+    vec = np.random.default_rng(seed).standard_normal(dims, dtype=np.float32)
+    vec /= np.linalg.norm(vec)
+    return tuple(vec.tolist())
+
 
 @pytest.fixture
 def make_vector():
     """Create deterministic mock vectors for unit tests."""
 
     def _make(seed: int, dims: int = 1536) -> list[float]:
-        rng = random.Random(seed)
-        vec = [rng.gauss(0, 1) for _ in range(dims)]
-        norm = sum(x * x for x in vec) ** 0.5
-        return [x / norm for x in vec]
+        return list(_unit_vector(seed, dims))
 
     return _make
 
 
-@pytest.fixture
-async def vector_store(tmp_path: Path):
-    """Provide a connected LanceDBVectorStore."""
-    store = LanceDBVectorStore(path=tmp_path / "lancedb")
+@pytest.fixture(scope="module")
+async def module_vector_store():
+    """In-memory LanceDBVectorStore connected once per module."""
+    store = LanceDBVectorStore(path=f"memory://{uuid4()}")
     await store.connect()
     yield store
     await store.close()
 
 
+@pytest.fixture
+def vector_store(module_vector_store: LanceDBVectorStore):
+    """Provide the module's connected store, emptied after each test."""
+    yield module_vector_store
+    module_vector_store._table.delete("true")
+
+
 class TestLanceDBVectorStore:
     """Unit tests for LanceDBVectorStore wrapper behavior."""
 
@@ -57,11 +73,9 @@ class TestLanceDBVectorStore:
         assert store._db is None
         assert store._table is None
 
-    async def test_operations_raise_when_not_connected(
-        self, tmp_path: Path, make_vector
-    ):
+    async def test_operations_raise_when_not_connected(self, make_vector):
         """Test that operations raise RuntimeError when not connected."""
-        store = LanceDBVectorStore(path=tmp_path / "lancedb")
+        store = LanceDBVectorStore(path=f"memory://{uuid4()}")
         node_id = uuid4()
         vector = make_vector(42)
 
@@ -73,6 +87,9 @@ class TestLanceDBVectorStore:
                 conversation_id="conv-1",
             )
 
+        with pytest.raises(RuntimeError, match="Not connected"):
+            await store.add_batch([])
+
         with pytest.raises(RuntimeError, match="Not connected"):
             await store.search(
                 query_vector=vector,
@@ -80,7 +97,7 @@ class TestLanceDBVectorStore:
             )
 
         with pytest.raises(RuntimeError, match="Not connected"):
-            await store.update_last_accessed(node_id)
+            await store.update_last_accessed([node_id])
 
         with pytest.raises(RuntimeError, match="Not connected"):
             await store.delete_by_conversation("conv-1")
@@ -108,16 +125,47 @@ class TestLanceDBVectorStore:
         assert len(results) >= 1
         assert any(r.node_id == node_id for r in results)
 
+    async def test_add_and_search_float16_roundtrip(self, make_vector):
+        """Vectors stored as float16 still rank the nearest entry first."""
+        store = LanceDBVectorStore(path=f"memory://{uuid4()}", vector_dtype="float16")
+        await store.connect()
+        near, far = uuid4(), uuid4()
+        await store.add_batch(
+            [
+                VectorEntry(
+                    node_id=near,
+                    text="near",
+                    vector=make_vector(1),
+                    conversation_id="c",
+                ),
+                VectorEntry(
+                    node_id=far, text="far", vector=make_vector(2), conversation_id="c"
+                ),
+            ]
+        )
+
+        results = await store.search(
+            query_vector=make_vector(1), query_text="unrelated", vector_weight=1.0
+        )
+
+        assert store._table.schema.field("vector").type.value_type == pa.float16()
+        assert results[0].node_id == near
+        await store.close()
+
     async def test_search_respects_limit(self, vector_store, make_vector):
         """Test that search returns at most `limit` results."""
         # Add 5 entries
-        for i in range(5):
-            await vector_store.add(
-                node_id=uuid4(),
-                text=f"Document number {i} about testing",
-                vector=make_vector(i),
-                conversation_id="conv-1",
-            )
+        await vector_store.add_batch(
+            [
+                VectorEntry(
+                    node_id=uuid4(),
+                    text=f"Document number {i} about testing",
+                    vector=make_vector(i),
+                    conversation_id="conv-1",
+                )
+                for i in range(5)
+            ]
+        )
 
         # Search with limit=2
         results = await vector_store.search(
@@ -133,20 +181,22 @@ class TestLanceDBVectorStore:
         # Add entries from two conversations with same vector
         shared_vector = make_vector(42)
 
-        node_conv1 = uuid4()
-        await vector_store.add(
-            node_id=node_conv1,
-            text="Message from conversation one",
-            vector=shared_vector,
-            conversation_id="conv-1",
-        )
-
         node_conv2 = uuid4()
-        await vector_store.add(
-            node_id=node_conv2,
-            text="Message from conversation two",
-            vector=shared_vector,
-            conversation_id="conv-2",
+        await vector_store.add_batch(
+            [
+                VectorEntry(
+                    node_id=uuid4(),
+                    text="Message from conversation one",
+                    vector=shared_vector,
+                    conversation_id="conv-1",
+                ),
+                VectorEntry(
+                    node_id=node_conv2,
+                    text="Message from conversation two",
+                    vector=shared_vector,
+                    conversation_id="conv-2",
+                ),
+            ]
         )
 
         # Search excluding conv-1
@@ -164,20 +214,25 @@ class TestLanceDBVectorStore:
     async def test_delete_by_conversation(self, vector_store, make_vector):
         """Test deleting all entries for a conversation."""
         # Add entries from two conversations
-        for i in range(3):
-            await vector_store.add(
-                node_id=uuid4(),
-                text=f"Conv1 message {i}",
-                vector=make_vector(i),
-                conversation_id="conv-to-delete",
-            )
-
         node_to_keep = uuid4()
-        await vector_store.add(
-            node_id=node_to_keep,
-            text="Conv2 message",
-            vector=make_vector(100),
-            conversation_id="conv-to-keep",
+        await vector_store.add_batch(
+            [
+                *(
+                    VectorEntry(
+                        node_id=uuid4(),
+                        text=f"Conv1 message {i}",
+                        vector=make_vector(i),
+                        conversation_id="conv-to-delete",
+                    )
+                    for i in range(3)
+                ),
+                VectorEntry(
+                    node_id=node_to_keep,
+                    text="Conv2 message",
+                    vector=make_vector(100),
+                    conversation_id="conv-to-keep",
+                ),
+            ]
         )
 
         # Delete conv-to-delete
@@ -230,47 +285,37 @@ class TestLanceDBVectorStore:
         assert isinstance(result.last_accessed, datetime)
         assert isinstance(result.score, float)
 
-    async def test_update_last_accessed(self, vector_store, make_vector):
-        """Test that update_last_accessed updates the timestamp."""
-        import asyncio
-
-        node_id = uuid4()
-        vector = make_vector(42)
-
-        await vector_store.add(
-            node_id=node_id,
-            text="Test document",
-            vector=vector,
-            conversation_id="conv-1",
-        )
-
-        # Get initial last_accessed
-        results = await vector_store.search(
-            query_vector=vector,
-            query_text="test",
-            limit=1,
-        )
-        initial_last_accessed = results[0].last_accessed
-
-        # Wait a bit and update
-        await asyncio.sleep(0.01)
-        await vector_store.update_last_accessed(node_id)
-
-        # Verify last_accessed was updated
-        results = await vector_store.search(
-            query_vector=vector,
-            query_text="test",
-            limit=1,
-        )
-        updated_last_accessed = results[0].last_accessed
-
-        assert updated_last_accessed > initial_last_accessed
-
-    async def test_custom_reranker_instance(self, tmp_path: Path, make_vector):
+    async def test_update_last_accessed(self, vector_store, make_vector, mocker):
+        """Test that update_last_accessed updates all timestamps in one write."""
+        node_ids = [uuid4(), uuid4(), uuid4()]
+        for seed, node_id in enumerate(node_ids):
+            await vector_store.add(
+                node_id=node_id,
+                text=f"Test document {seed}",
+                vector=make_vector(seed),
+                conversation_id="conv-1",
+            )
+        initial = vector_store._table.to_pandas()["last_accessed"].max()
+        version = vector_store._table.version
+
+        # Advance the store's clock instead of sleeping, then update
+        clock = mocker.patch("tracemem_core.storage.vector.lance.datetime")
+        clock.now.return_value = initial.to_pydatetime() + timedelta(seconds=1)
+        await vector_store.update_last_accessed(node_ids[:2])
+        await vector_store.update_last_accessed([])
+
+        df = vector_store._table.to_pandas().set_index("node_id")
+        accessed = {UUID(k): v.to_pydatetime() for k, v in df["last_accessed"].items()}
+        assert vector_store._table.version == version + 1
+        assert accessed[node_ids[0]] == initial + timedelta(seconds=1)
+        assert accessed[node_ids[1]] == initial + timedelta(seconds=1)
+        assert accessed[node_ids[2]] <= initial
+
+    async def test_custom_reranker_instance(self, make_vector):
         """Test that a custom reranker instance is used during search."""
         custom_reranker = LinearCombinationReranker(weight=0.5)
         store = LanceDBVectorStore(
-            path=tmp_path / "lancedb",
+            path=f"memory://{uuid4()}",
             reranker=custom_reranker,
         )
         await store.connect()
@@ -289,17 +334,48 @@ class TestLanceDBVectorStore:
         assert len(results) >= 1
         await store.close()
 
-    async def test_default_reranker_is_rrf(self, tmp_path: Path):
+    async def test_per_call_reranker_override(self, vector_store, make_vector):
+        """A reranker passed to search() is used instead of the store default."""
+        node_id = uuid4()
+        vector = make_vector(42)
+        await vector_store.add(
+            node_id=node_id, text="test doc", vector=vector, conversation_id="c1"
+        )
+
+        results = await vector_store.search(
+            query_vector=vector, query_text="test", limit=1, reranker="linear"
+        )
+
+        assert [r.node_id for r in results] == [node_id]
+        assert isinstance(vector_store._reranker, RRFReranker)
+
+    async def test_search_rrf_k_override(self, vector_store, make_vector):
+        """rrf_k replaces the default K=60 for a single call."""
+        vector = make_vector(42)
+        await vector_store.add(
+            node_id=uuid4(), text="test doc", vector=vector, conversation_id="c1"
+        )
+
+        # Ranked first by both searches: 0.5 / (1 + K) + 0.5 / (1 + K)
+        default = await vector_store.search(query_vector=vector, query_text="test")
+        tuned = await vector_store.search(
+            query_vector=vector, query_text="test", rrf_k=9
+        )
+
+        assert default[0].score == pytest.approx(1 / 61)
+        assert tuned[0].score == pytest.approx(1 / 10)
+
+    async def test_default_reranker_is_rrf(self):
         """Default reranker resolves to RRFReranker via registry."""
-        store = LanceDBVectorStore(path=tmp_path / "lancedb")
+        store = LanceDBVectorStore(path="memory://")
         assert isinstance(store._reranker, RRFReranker)
 
-    async def test_string_reranker_resolution(self, tmp_path: Path):
+    async def test_string_reranker_resolution(self):
         """String reranker key is resolved via get_reranker registry."""
-        store = LanceDBVectorStore(path=tmp_path / "lancedb", reranker="linear")
+        store = LanceDBVectorStore(path="memory://", reranker="linear")
         assert isinstance(store._reranker, LinearCombinationReranker)
 
-    async def test_unknown_reranker_string_raises(self, tmp_path: Path):
+    async def test_unknown_reranker_string_raises(self):
         """Unknown reranker string raises ValueError at init."""
         with pytest.raises(ValueError, match="Unknown reranker"):
-            LanceDBVectorStore(path=tmp_path / "lancedb", reranker="unknown")
+            LanceDBVectorStore(path="memory://", reranker="unknown")
@@ -2,10 +2,11 @@
 
 from unittest.mock import MagicMock
 
+import pyarrow as pa
 import pytest
 from lancedb.rerankers import LinearCombinationReranker, RRFReranker
 
-from tracemem_core.storage.vector.rerankers import get_reranker
+from tracemem_core.storage.vector.rerankers import WeightedRRFReranker, get_reranker
 
 
 class TestGetReranker:
@@ -31,3 +32,68 @@ class TestGetReranker:
         custom = MagicMock()
         result = get_reranker(custom)
         assert result is custom
+
+
+class TestWeightedRRFReranker:
+    """Tests for weighted reciprocal rank fusion."""
+
+    @pytest.fixture
+    def ranked_results(self):
+        """Vector ranks rows 1, 2, 3; FTS ranks them in reverse."""
+        vector_results = pa.table(
+            {"_rowid": [1, 2, 3], "text": ["a", "b", "c"], "_distance": [0.1, 0.2, 0.3]}
+        )
+        fts_results = pa.table(
+            {"_rowid": [3, 2, 1], "text": ["c", "b", "a"], "_score": [3.0, 2.0, 1.0]}
+        )
+        return vector_results, fts_results
+
+    @pytest.mark.parametrize(
+        "vector_weight,expected_top",
+        [(1.0, "a"), (0.7, "a"), (0.3, "c"), (0.0, "c")],
+    )
+    def test_weight_decides_top_rank(self, ranked_results, vector_weight, expected_top):
+        """The heavier-weighted source wins the top rank."""
+        reranker = WeightedRRFReranker(K=10, vector_weight=vector_weight)
+
+        result = reranker.rerank_hybrid("q", *ranked_results)
+
+        assert result["text"].to_pylist()[0] == expected_top
+        assert "_relevance_score" in result.column_names
+
+    def test_rrf_registry_entry_is_weighted(self):
+        """The "rrf" registry key resolves to the weighted variant."""
+        assert isinstance(get_reranker("rrf"), WeightedRRFReranker)
+
+    def test_with_vector_weight_keeps_k(self):
+        """with_vector_weight copies K and leaves the original untouched."""
+        reranker = WeightedRRFReranker(K=10)
+
+        updated = reranker.with_vector_weight(0.7)
+
+        assert updated.K == 10
+        assert updated.vector_weight == 0.7
+        assert reranker.vector_weight == 0.5
+        assert reranker.with_vector_weight(0.5) is reranker
+
+    def test_with_k_keeps_vector_weight(self):
+        """with_k copies the vector weight and leaves the original untouched."""
+        reranker = WeightedRRFReranker(vector_weight=0.7)
+
+        updated = reranker.with_k(10)
+
+        assert (updated.K, updated.vector_weight) == (10, 0.7)
+        assert reranker.K == 60
+        assert reranker.with_k(60) is reranker
+
+    def test_with_vector_weight_shares_instances(self):
+        """Repeated calls with the same weight return the same reranker."""
+        first = get_reranker("rrf").with_vector_weight(0.7)
+
+        assert WeightedRRFReranker().with_vector_weight(0.7) is first
+        assert WeightedRRFReranker(K=10).with_vector_weight(0.7) is not first
+
+    def test_invalid_weight_raises(self):
+        """vector_weight outside 0-1 raises ValueError."""
+        with pytest.raises(ValueError, match="vector_weight"):
+            WeightedRRFReranker(vector_weight=1.5)
@@ -2,55 +2,110 @@
 
 import pytest
 
+pytest.importorskip("langchain_core", reason="langchain-core not installed")
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+
+from tracemem_core.adapters.langchain import LangChainAdapter
+
+
+class CustomMessage(BaseMessage):
+    """Message type the adapter has no explicit mapping for."""
+
+    type: str = "custom"
+
+
+# (message, expected role, expected content, expected tool_call_id)
+CONVERT_CASES = [
+    pytest.param(HumanMessage(content="Hello"), "user", "Hello", None, id="human"),
+    pytest.param(
+        SystemMessage(content="You are helpful"),
+        "system",
+        "You are helpful",
+        None,
+        id="system",
+    ),
+    pytest.param(
+        AIMessage(content="Hello there!"), "assistant", "Hello there!", None, id="ai"
+    ),
+    pytest.param(
+        AIMessage(content="Hello", tool_calls=[]),
+        "assistant",
+        "Hello",
+        None,
+        id="ai-empty-tool-calls",
+    ),
+    pytest.param(
+        ToolMessage(content="file content here", tool_call_id="call_1"),
+        "tool",
+        "file content here",
+        "call_1",
+        id="tool",
+    ),
+    # Multimodal list content is joined line by line
+    pytest.param(
+        HumanMessage(
+            content=[
+                {"type": "text", "text": "First line"},
+                {"type": "text", "text": "Second line"},
+            ]
+        ),
+        "user",
+        "First line\nSecond line",
+        None,
+        id="list-content",
+    ),
+    pytest.param(
+        HumanMessage(content=["Hello", "World"]),
+        "user",
+        "Hello\nWorld",
+        None,
+        id="list-content-strings",
+    ),
+    # Unknown message types default to the user role
+    pytest.param(
+        CustomMessage(content="Custom content"),
+        "user",
+        "Custom content",
+        None,
+        id="unknown-type",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def adapter():
+    """Create a LangChainAdapter instance shared by the module."""
+    return LangChainAdapter()
+
+
+@pytest.fixture(scope="module")
+def human_hello():
+    """A plain HumanMessage shared across the module."""
+    return HumanMessage(content="Hello")
+
 
 class TestLangChainAdapter:
     """Test LangChainAdapter."""
 
-    @pytest.fixture
-    def adapter(self):
-        """Create a LangChainAdapter instance."""
-        # Import inside test to avoid import errors when langchain is not installed
-        from tracemem_core.adapters.langchain import LangChainAdapter
-
-        return LangChainAdapter()
-
-    def test_convert_human_message(self, adapter) -> None:
-        """Convert HumanMessage to user Message."""
-        from langchain_core.messages import HumanMessage
-
-        msg = HumanMessage(content="Hello")
-        result = adapter.convert_single(msg)
-
-        assert result.role == "user"
-        assert result.content == "Hello"
-        assert result.tool_calls == []
-        assert result.tool_call_id is None
-
-    def test_convert_system_message(self, adapter) -> None:
-        """Convert SystemMessage to system Message."""
-        from langchain_core.messages import SystemMessage
-
-        msg = SystemMessage(content="You are helpful")
-        result = adapter.convert_single(msg)
-
-        assert result.role == "system"
-        assert result.content == "You are helpful"
-
-    def test_convert_ai_message_simple(self, adapter) -> None:
-        """Convert simple AIMessage to assistant Message."""
-        from langchain_core.messages import AIMessage
-
-        msg = AIMessage(content="Hello there!")
+    @pytest.mark.parametrize(("msg", "role", "content", "tool_call_id"), CONVERT_CASES)
+    def test_convert_single(self, adapter, msg, role, content, tool_call_id) -> None:
+        """Convert each plain message type to the matching Message."""
         result = adapter.convert_single(msg)
 
-        assert result.role == "assistant"
-        assert result.content == "Hello there!"
+        assert result.role == role
+        assert result.content == content
         assert result.tool_calls == []
+        assert result.tool_call_id == tool_call_id
 
     def test_convert_ai_message_with_tool_calls(self, adapter) -> None:
         """Convert AIMessage with tool_calls to assistant Message."""
-        from langchain_core.messages import AIMessage
-
         msg = AIMessage(
             content="I'll read the file",
             tool_calls=[
@@ -70,46 +125,10 @@ class TestLangChainAdapter:
         assert result.tool_calls[0].name == "read_file"
         assert result.tool_calls[0].args == {"path": "/home/user/file.py"}
 
-    def test_convert_tool_message(self, adapter) -> None:
-        """Convert ToolMessage to tool Message."""
-        from langchain_core.messages import ToolMessage
-
-        msg = ToolMessage(content="file content here", tool_call_id="call_1")
-        result = adapter.convert_single(msg)
-
-        assert result.role == "tool"
-        assert result.content == "file content here"
-        assert result.tool_call_id == "call_1"
-
-    def test_convert_list_content(self, adapter) -> None:
-        """Handle list content (multimodal messages)."""
-        from langchain_core.messages import HumanMessage
-
-        msg = HumanMessage(
-            content=[
-                {"type": "text", "text": "First line"},
-                {"type": "text", "text": "Second line"},
-            ]
-        )
-        result = adapter.convert_single(msg)
-
-        assert result.content == "First line\nSecond line"
-
-    def test_convert_list_content_with_strings(self, adapter) -> None:
-        """Handle list content with raw strings."""
-        from langchain_core.messages import HumanMessage
-
-        msg = HumanMessage(content=["Hello", "World"])
-        result = adapter.convert_single(msg)
-
-        assert result.content == "Hello\nWorld"
-
-    def test_convert_batch(self, adapter) -> None:
+    def test_convert_batch(self, adapter, human_hello) -> None:
         """Convert multiple messages at once."""
-        from langchain_core.messages import AIMessage, HumanMessage
-
         messages = [
-            HumanMessage(content="Hello"),
+            human_hello,
             AIMessage(content="Hi!"),
         ]
         results = adapter.convert(messages)
@@ -118,33 +137,8 @@ class TestLangChainAdapter:
         assert results[0].role == "user"
         assert results[1].role == "assistant"
 
-    def test_convert_unknown_message_type(self, adapter) -> None:
-        """Unknown message types default to user role."""
-        from langchain_core.messages import BaseMessage
-
-        # Create a custom message type
-        class CustomMessage(BaseMessage):
-            type: str = "custom"
-
-        msg = CustomMessage(content="Custom content")
-        result = adapter.convert_single(msg)
-
-        assert result.role == "user"
-        assert result.content == "Custom content"
-
-    def test_convert_ai_message_empty_tool_calls(self, adapter) -> None:
-        """AIMessage with empty tool_calls list should have empty list."""
-        from langchain_core.messages import AIMessage
-
-        msg = AIMessage(content="Hello", tool_calls=[])
-        result = adapter.convert_single(msg)
-
-        assert result.tool_calls == []
-
     def test_convert_tool_call_with_all_fields(self, adapter) -> None:
         """Handle tool_calls with all required fields."""
-        from langchain_core.messages import AIMessage
-
         msg = AIMessage(
             content="",
             tool_calls=[
@@ -0,0 +1,66 @@
+from unittest.mock import AsyncMock
+
+from tracemem_core.embedders import CachedEmbedder
+
+from .conftest import MockEmbedder
+
+
+def _counting_embedder() -> MockEmbedder:
+    embedder = MockEmbedder(dimensions=4)
+    embedder.embed = AsyncMock(wraps=embedder.embed)
+    embedder.embed_batch = AsyncMock(wraps=embedder.embed_batch)
+    return embedder
+
+
+class TestCachedEmbedder:
+    """Tests for CachedEmbedder."""
+
+    async def test_embed_reuses_vector(self) -> None:
+        """A repeated text returns the cached vector without re-embedding."""
+        inner = _counting_embedder()
+        cached = CachedEmbedder(inner)
+
+        first = await cached.embed("Hello")
+        second = await cached.embed("Hello")
+
+        assert second == first
+        assert inner.embed.await_count == 1
+        assert cached.dimensions == 4
+
+    async def test_embed_batch_only_sends_misses(self) -> None:
+        """Cached and duplicate texts are left out of the inner batch call."""
+        inner = _counting_embedder()
+        cached = CachedEmbedder(inner)
+        hello = await cached.embed("Hello")
+
+        vectors = await cached.embed_batch(["a", "Hello", "b", "a"])
+
+        inner.embed_batch.assert_awaited_once_with(["a", "b"])
+        assert vectors[1] == hello
+        assert vectors[0] == vectors[3]
+        assert vectors[2] == await inner.embed("b")
+
+    async def test_returned_vectors_are_copies(self) -> None:
+        """Mutating a returned vector leaves the cached entry intact."""
+        inner = _counting_embedder()
+        cached = CachedEmbedder(inner)
+        expected = await inner.embed("Hello")
+
+        first = await cached.embed("Hello")
+        first[0] = 42.0
+        (batched,) = await cached.embed_batch(["Hello"])
+        batched[0] = 42.0
+
+        assert await cached.embed("Hello") == expected
+        assert await cached.embed_batch(["Hello"]) == [expected]
+
+    async def test_evicts_least_recently_used(self) -> None:
+        """Past maxsize, the least recently used text is embedded again."""
+        inner = _counting_embedder()
+        cached = CachedEmbedder(inner, maxsize=2)
+
+        for text in ("a", "b", "a", "c", "a", "b"):
+            await cached.embed(text)
+
+        # "b" was evicted by "c"; "a" stayed because it was used again
+        assert [c.args[0] for c in inner.embed.await_args_list] == ["a", "b", "c", "b"]
@@ -2,7 +2,69 @@
 
 from pathlib import Path
 
-from tracemem_core.extractors import DefaultResourceExtractor, _canonicalize_file_uri
+import pytest
+
+from tracemem_core.extractors import (
+    DefaultResourceExtractor,
+    _canonicalize_file_uri,
+    _resolve,
+    _resolve_absolute,
+)
+
+
+@pytest.fixture(scope="module")
+def extractor() -> DefaultResourceExtractor:
+    """Default (global mode) extractor shared across the module."""
+    return DefaultResourceExtractor()
+
+
+@pytest.fixture(scope="session")
+def sample_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only file tree created once: file.py, outside.py, src/auth.py, project/."""
+    root = tmp_path_factory.mktemp("ext")
+    (root / "src").mkdir()
+    (root / "src" / "auth.py").touch()
+    (root / "file.py").touch()
+    (root / "outside.py").touch()
+    (root / "project").mkdir()
+    return root
+
+
+@pytest.fixture(scope="module")
+def local_extractor(sample_tree: Path) -> DefaultResourceExtractor:
+    """Local mode extractor rooted at sample_tree, shared across the module."""
+    return DefaultResourceExtractor(mode="local", home=sample_tree / ".tracemem")
+
+
+class TestResolve:
+    """Test the cached _resolve helper."""
+
+    def test_repeated_resolution_hits_cache(self, tmp_path: Path) -> None:
+        """Resolving the same path twice only touches the filesystem once."""
+        test_file = tmp_path / "cached.py"
+        test_file.touch()
+        hits = _resolve_absolute.cache_info().hits
+
+        first = _resolve(test_file)
+        second = _resolve(test_file)
+
+        assert first == second == test_file.resolve()
+        assert _resolve_absolute.cache_info().hits == hits + 1
+
+    def test_relative_path_anchored_at_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Relative paths resolve against the current directory at call time."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+
+        monkeypatch.chdir(tmp_path / "a")
+        in_a = _resolve(Path("file.py"))
+        monkeypatch.chdir(tmp_path / "b")
+        in_b = _resolve(Path("file.py"))
+
+        assert in_a == (tmp_path / "a" / "file.py").resolve()
+        assert in_b == (tmp_path / "b" / "file.py").resolve()
 
 
 class TestCanonicalizeFileUri:
@@ -19,29 +81,23 @@ class TestCanonicalizeFileUri:
         """Custom URI schemes pass through unchanged."""
         assert _canonicalize_file_uri("ticker://AAPL", root=None) == "ticker://AAPL"
 
-    def test_absolute_path_without_root(self, tmp_path: Path) -> None:
+    def test_absolute_path_without_root(self, sample_tree: Path) -> None:
         """Without root, absolute file URIs stay absolute."""
-        test_file = tmp_path / "file.py"
-        test_file.touch()
+        test_file = sample_tree / "file.py"
         result = _canonicalize_file_uri(f"file://{test_file}", root=None)
         assert result == f"file://{test_file.resolve()}"
 
-    def test_absolute_path_with_root_makes_relative(self, tmp_path: Path) -> None:
+    def test_absolute_path_with_root_makes_relative(self, sample_tree: Path) -> None:
         """With root, file URIs under root become relative."""
-        src_dir = tmp_path / "src"
-        src_dir.mkdir()
-        test_file = src_dir / "auth.py"
-        test_file.touch()
+        test_file = sample_tree / "src" / "auth.py"
 
-        result = _canonicalize_file_uri(f"file://{test_file}", root=tmp_path)
+        result = _canonicalize_file_uri(f"file://{test_file}", root=sample_tree)
         assert result == "file://src/auth.py"
 
-    def test_path_outside_root_stays_absolute(self, tmp_path: Path) -> None:
+    def test_path_outside_root_stays_absolute(self, sample_tree: Path) -> None:
         """File URIs outside root stay absolute."""
-        test_file = tmp_path / "outside.py"
-        test_file.touch()
-        other_root = tmp_path / "project"
-        other_root.mkdir()
+        test_file = sample_tree / "outside.py"
+        other_root = sample_tree / "project"
 
         result = _canonicalize_file_uri(f"file://{test_file}", root=other_root)
         assert result == f"file://{test_file.resolve()}"
@@ -50,119 +106,114 @@ class TestCanonicalizeFileUri:
 class TestDefaultResourceExtractor:
     """Test DefaultResourceExtractor."""
 
-    def test_extract_file_path(self, tmp_path: Path) -> None:
+    def test_extract_file_path(
+        self, sample_tree: Path, extractor: DefaultResourceExtractor
+    ) -> None:
         """Extract URI from path argument."""
-        test_file = tmp_path / "file.py"
-        test_file.touch()
-        extractor = DefaultResourceExtractor()
-
+        test_file = sample_tree / "file.py"
         result = extractor.extract("read_file", {"path": str(test_file)})
 
         assert result == f"file://{test_file.resolve()}"
 
-    def test_extract_file_path_variant(self, tmp_path: Path) -> None:
+    def test_extract_file_path_variant(
+        self, sample_tree: Path, extractor: DefaultResourceExtractor
+    ) -> None:
         """Extract URI from file_path argument."""
-        test_file = tmp_path / "file.py"
-        test_file.touch()
-        extractor = DefaultResourceExtractor()
-
+        test_file = sample_tree / "file.py"
         result = extractor.extract("read", {"file_path": str(test_file)})
 
         assert result == f"file://{test_file.resolve()}"
 
-    def test_extract_local_mode_returns_relative(self, tmp_path: Path) -> None:
+    def test_extract_local_mode_returns_relative(
+        self, sample_tree: Path, local_extractor: DefaultResourceExtractor
+    ) -> None:
         """Extractor in local mode makes file paths relative."""
-        src_dir = tmp_path / "src"
-        src_dir.mkdir()
-        test_file = src_dir / "auth.py"
-        test_file.touch()
+        test_file = sample_tree / "src" / "auth.py"
 
-        extractor = DefaultResourceExtractor(mode="local", home=tmp_path / ".tracemem")
-        result = extractor.extract("read", {"file_path": str(test_file)})
+        result = local_extractor.extract("read", {"file_path": str(test_file)})
         assert result == "file://src/auth.py"
 
-    def test_extract_global_mode_returns_absolute(self, tmp_path: Path) -> None:
+    def test_extract_global_mode_returns_absolute(self, sample_tree: Path) -> None:
         """Extractor in global mode uses absolute paths."""
-        test_file = tmp_path / "auth.py"
-        test_file.touch()
+        test_file = sample_tree / "src" / "auth.py"
 
         extractor = DefaultResourceExtractor(mode="global")
         result = extractor.extract("read", {"file_path": str(test_file)})
         assert result == f"file://{test_file.resolve()}"
 
-    def test_extract_default_mode_is_global(self, tmp_path: Path) -> None:
+    def test_extract_default_mode_is_global(self, sample_tree: Path) -> None:
         """Default mode is global (absolute paths)."""
-        test_file = tmp_path / "auth.py"
-        test_file.touch()
+        test_file = sample_tree / "src" / "auth.py"
 
         extractor = DefaultResourceExtractor()
         result = extractor.extract("read", {"file_path": str(test_file)})
         assert result == f"file://{test_file.resolve()}"
 
-    def test_extract_url_passes_through(self) -> None:
+    def test_extract_url_passes_through(
+        self, local_extractor: DefaultResourceExtractor
+    ) -> None:
         """Non-file URIs pass through unchanged."""
-        extractor = DefaultResourceExtractor(
-            mode="local", home=Path("/some/project/.tracemem")
-        )
-        result = extractor.extract("fetch", {"url": "https://example.com/api"})
+        result = local_extractor.extract("fetch", {"url": "https://example.com/api"})
         assert result == "https://example.com/api"
 
-    def test_extract_uri(self) -> None:
+    def test_extract_uri(self, extractor: DefaultResourceExtractor) -> None:
         """Extract URL from uri argument."""
-        extractor = DefaultResourceExtractor()
-
         result = extractor.extract("fetch", {"uri": "https://example.com/api"})
 
         assert result == "https://example.com/api"
 
-    def test_extract_endpoint(self) -> None:
+    def test_extract_endpoint(self, extractor: DefaultResourceExtractor) -> None:
         """Extract URL from endpoint argument."""
-        extractor = DefaultResourceExtractor()
-
         result = extractor.extract("api_call", {"endpoint": "https://api.example.com"})
 
         assert result == "https://api.example.com"
 
-    def test_extract_no_match(self) -> None:
+    def test_extract_no_match(self, extractor: DefaultResourceExtractor) -> None:
         """Return None when no known arguments found."""
-        extractor = DefaultResourceExtractor()
-
         result = extractor.extract("some_tool", {"data": "value", "count": 5})
 
         assert result is None
 
-    def test_extract_empty_value(self) -> None:
+    def test_extract_empty_value(self, extractor: DefaultResourceExtractor) -> None:
         """Return None when argument is empty."""
-        extractor = DefaultResourceExtractor()
-
         result = extractor.extract("read", {"path": ""})
 
         assert result is None
 
-    def test_extract_none_value(self) -> None:
+    def test_extract_none_value(self, extractor: DefaultResourceExtractor) -> None:
         """Return None when argument is None."""
-        extractor = DefaultResourceExtractor()
-
         result = extractor.extract("read", {"path": None})
 
         assert result is None
 
-    def test_extract_file_takes_precedence(self, tmp_path: Path) -> None:
+    def test_extract_file_takes_precedence(
+        self, sample_tree: Path, extractor: DefaultResourceExtractor
+    ) -> None:
         """File args should be checked before URL args."""
-        test_file = tmp_path / "file.py"
-        test_file.touch()
-        extractor = DefaultResourceExtractor()
-
+        test_file = sample_tree / "file.py"
         result = extractor.extract(
             "some_tool", {"path": str(test_file), "url": "https://example.com"}
         )
 
         assert result == f"file://{test_file.resolve()}"
 
-    def test_extract_non_string_value(self) -> None:
-        """Return None for non-string values."""
-        extractor = DefaultResourceExtractor()
+    def test_extract_file_arg_order(
+        self, sample_tree: Path, extractor: DefaultResourceExtractor
+    ) -> None:
+        """path is checked before file_path when both are given."""
+        first = sample_tree / "file.py"
+        second = sample_tree / "outside.py"
+
+        result = extractor.extract(
+            "read", {"file_path": str(second), "path": str(first)}
+        )
+
+        assert result == f"file://{first.resolve()}"
 
+    def test_extract_non_string_value(
+        self, extractor: DefaultResourceExtractor
+    ) -> None:
+        """Return None for non-string values."""
         result = extractor.extract("read", {"path": 123})
 
         assert result is None
@@ -1,10 +1,13 @@
 from datetime import datetime
-from uuid import UUID
+from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
 
 from tracemem_core.messages import Message, ToolCall
 from tracemem_core.models.edges import Relationship, VersionOf
 from tracemem_core.models.nodes import AgentText, Resource, ResourceVersion, UserText
 
+SOURCE_ID = UUID("12345678-1234-1234-1234-123456789012")
+TARGET_ID = UUID("87654321-4321-4321-4321-210987654321")
+
 
 class TestNodeModels:
     """Test node models."""
@@ -65,34 +68,58 @@ class TestNodeModels:
 
         assert resource.current_content_hash == "xyz789"
 
+    def test_resource_id_derived_from_uri(self) -> None:
+        """Resources default to a deterministic id derived from their URI."""
+        uri = "file:///project/src/auth.py"
+        first = Resource(uri=uri, conversation_id="conv-1")
+        second = Resource(uri=uri, conversation_id="conv-2")
+        explicit = SOURCE_ID
+
+        assert first.id == second.id == uuid5(NAMESPACE_URL, uri)
+        assert Resource(id=explicit, uri=uri, conversation_id="c").id == explicit
+
+    def test_id_str_not_serialized(self) -> None:
+        """id_str matches str(id) and stays out of model dumps."""
+        user_text = UserText(text="Hello", conversation_id="conv-1")
+
+        assert user_text.id_str == str(user_text.id)
+        assert "id_str" not in user_text.model_dump()
+
+    def test_id_str_follows_id_changes(self) -> None:
+        """id_str tracks reassignment and model_copy(update={"id": ...})."""
+        user_text = UserText(text="Hello", conversation_id="conv-1")
+        original = user_text.id_str
+        user_text.id = uuid4()
+        copied = user_text.model_copy(update={"id": uuid4()})
+
+        assert user_text.id_str == str(user_text.id) != original
+        assert copied.id_str == str(copied.id)
+
 
 class TestEdgeModels:
     """Test edge models."""
 
     def test_relationship_defaults(self) -> None:
         """Relationship should have auto-generated defaults."""
-        source_id = UUID("12345678-1234-1234-1234-123456789012")
-        target_id = UUID("87654321-4321-4321-4321-210987654321")
-
         rel = Relationship(
-            source_id=source_id,
-            target_id=target_id,
+            source_id=SOURCE_ID,
+            target_id=TARGET_ID,
             relationship_type="READ",
             conversation_id="conv-1",
         )
 
         assert isinstance(rel.id, UUID)
         assert isinstance(rel.created_at, datetime)
-        assert rel.source_id == source_id
-        assert rel.target_id == target_id
+        assert rel.source_id == SOURCE_ID
+        assert rel.target_id == TARGET_ID
         assert rel.relationship_type == "READ"
         assert rel.properties == {}
 
     def test_relationship_with_properties(self) -> None:
         """Relationship can have custom properties."""
         rel = Relationship(
-            source_id=UUID("12345678-1234-1234-1234-123456789012"),
-            target_id=UUID("87654321-4321-4321-4321-210987654321"),
+            source_id=SOURCE_ID,
+            target_id=TARGET_ID,
             relationship_type="EDIT",
             conversation_id="conv-1",
             properties={"line_start": 10, "line_end": 20},
@@ -102,18 +129,15 @@ class TestEdgeModels:
 
     def test_version_of_defaults(self) -> None:
         """VersionOf should have auto-generated defaults."""
-        version_id = UUID("12345678-1234-1234-1234-123456789012")
-        resource_id = UUID("87654321-4321-4321-4321-210987654321")
-
         edge = VersionOf(
-            version_id=version_id,
-            resource_id=resource_id,
+            version_id=SOURCE_ID,
+            resource_id=TARGET_ID,
         )
 
         assert isinstance(edge.id, UUID)
         assert isinstance(edge.created_at, datetime)
-        assert edge.version_id == version_id
-        assert edge.resource_id == resource_id
+        assert edge.version_id == SOURCE_ID
+        assert edge.resource_id == TARGET_ID
 
 
 class TestMessageModels:
@@ -1,8 +1,9 @@
 """Unit tests for retrieval strategies."""
 
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 
@@ -22,77 +23,86 @@ from tracemem_core.retrieval.results import (
 )
 from tracemem_core.storage.protocols import VectorSearchResult
 
+FAKE_EMBEDDING = [0.1] * 1536
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+DEFAULT_CONFIG = RetrievalConfig()
+NODE_ID = UUID("12345678-1234-1234-1234-123456789012")
+
+
+def _search_result(
+    text: str = "matching text", score: float = 0.95
+) -> VectorSearchResult:
+    """Build a conv-1 search hit for NODE_ID."""
+    return VectorSearchResult(
+        node_id=NODE_ID,
+        text=text,
+        conversation_id="conv-1",
+        created_at=NOW,
+        last_accessed=NOW,
+        score=score,
+    )
+
+
+@pytest.fixture
+def strategy(mock_graph_store, mock_vector_store, mock_embedder):
+    """Create a HybridRetrievalStrategy with mocks."""
+    return HybridRetrievalStrategy(
+        graph_store=mock_graph_store,
+        vector_store=mock_vector_store,
+        embedder=mock_embedder,
+    )
+
 
 class TestRetrievalConfig:
     """Tests for RetrievalConfig model."""
 
     def test_default_values(self):
         """Verify default configuration values."""
-        config = RetrievalConfig()
-
-        assert config.limit == 10
-        assert config.include_context is True
-        assert config.vector_weight == 0.5
-        assert config.expand_tool_uses is True
-        assert config.expand_resources is True
-        assert config.sort_by == "created_at"
-        assert config.sort_order == "desc"
-        assert config.exclude_conversation_id is None
-        assert config.trajectory_max_depth == 100
+        assert DEFAULT_CONFIG.model_dump() == {
+            "limit": 10,
+            "include_context": True,
+            "vector_weight": 0.5,
+            "expand_tool_uses": True,
+            "expand_resources": True,
+            "sort_by": "created_at",
+            "sort_order": "desc",
+            "exclude_conversation_id": None,
+            "trajectory_max_depth": 100,
+            "unique_conversations": False,
+        }
 
     def test_custom_values(self):
         """Verify custom configuration values are set."""
-        config = RetrievalConfig(
-            limit=5,
-            include_context=False,
-            vector_weight=0.9,
-            expand_tool_uses=False,
-            expand_resources=False,
-            sort_by="last_accessed_at",
-            sort_order="asc",
-            exclude_conversation_id="conv-123",
-            trajectory_max_depth=50,
-        )
-
-        assert config.limit == 5
-        assert config.include_context is False
-        assert config.vector_weight == 0.9
-        assert config.expand_tool_uses is False
-        assert config.expand_resources is False
-        assert config.sort_by == "last_accessed_at"
-        assert config.sort_order == "asc"
-        assert config.exclude_conversation_id == "conv-123"
-        assert config.trajectory_max_depth == 50
-
-    def test_limit_validation_min(self):
-        """Verify limit must be at least 1."""
-        with pytest.raises(ValueError):
-            RetrievalConfig(limit=0)
-
-    def test_limit_validation_max(self):
-        """Verify limit must be at most 100."""
-        with pytest.raises(ValueError):
-            RetrievalConfig(limit=101)
-
-    def test_vector_weight_validation_min(self):
-        """Verify vector_weight must be at least 0.0."""
-        with pytest.raises(ValueError):
-            RetrievalConfig(vector_weight=-0.1)
-
-    def test_vector_weight_validation_max(self):
-        """Verify vector_weight must be at most 1.0."""
-        with pytest.raises(ValueError):
-            RetrievalConfig(vector_weight=1.1)
-
-    def test_trajectory_max_depth_validation_min(self):
-        """Verify trajectory_max_depth must be at least 1."""
-        with pytest.raises(ValueError):
-            RetrievalConfig(trajectory_max_depth=0)
-
-    def test_trajectory_max_depth_validation_max(self):
-        """Verify trajectory_max_depth must be at most 500."""
+        values = {
+            "limit": 5,
+            "include_context": False,
+            "vector_weight": 0.9,
+            "expand_tool_uses": False,
+            "expand_resources": False,
+            "sort_by": "last_accessed_at",
+            "sort_order": "asc",
+            "exclude_conversation_id": "conv-123",
+            "trajectory_max_depth": 50,
+            "unique_conversations": True,
+        }
+
+        assert RetrievalConfig(**values).model_dump() == values
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("limit", 0),
+            ("limit", 101),
+            ("vector_weight", -0.1),
+            ("vector_weight", 1.1),
+            ("trajectory_max_depth", 0),
+            ("trajectory_max_depth", 501),
+        ],
+    )
+    def test_validation_bounds(self, field, value):
+        """Verify out-of-range limit, vector_weight and depth are rejected."""
         with pytest.raises(ValueError):
-            RetrievalConfig(trajectory_max_depth=501)
+            RetrievalConfig(**{field: value})
 
     def test_model_copy_update(self):
         """Verify model_copy with update works."""
@@ -177,48 +187,68 @@ class TestConversationReference:
 class TestHybridRetrievalStrategySearch:
     """Tests for HybridRetrievalStrategy.search method."""
 
-    @pytest.fixture
-    def strategy(self, mock_graph_store, mock_vector_store, mock_embedder):
-        """Create a HybridRetrievalStrategy with mocks."""
-        return HybridRetrievalStrategy(
-            graph_store=mock_graph_store,
-            vector_store=mock_vector_store,
-            embedder=mock_embedder,
-        )
+    @pytest.fixture(autouse=True)
+    def fixed_embedding(self, mock_embedder):
+        """Make the embedder return FAKE_EMBEDDING for every query."""
+        mock_embedder.embed = AsyncMock(return_value=FAKE_EMBEDDING)
 
     async def test_search_calls_embedder(self, strategy, mock_embedder):
         """Verify search embeds the query."""
-        mock_embedder.embed = AsyncMock(return_value=[0.1] * 1536)
-
         await strategy.search("test query")
 
         mock_embedder.embed.assert_called_once_with("test query")
 
-    async def test_search_calls_vector_store(
-        self, strategy, mock_vector_store, mock_embedder
+    async def test_search_reuses_hits_for_similar_query(
+        self, mock_graph_store, mock_vector_store, mock_embedder
     ):
-        """Verify search uses vector store with correct params."""
-        mock_embedder.embed = AsyncMock(return_value=[0.1] * 1536)
-        mock_vector_store.search = AsyncMock(return_value=[])
+        """A near-duplicate query reuses hits; other params or a clear search."""
+        mock_embedder.embed.side_effect = [
+            [1.0, 0.0],
+            [0.99, 0.1],
+            [0.99, 0.1],
+            [0.0, 1.0],
+            [1.0, 0.0],
+        ]
+        strategy = HybridRetrievalStrategy(
+            graph_store=mock_graph_store,
+            vector_store=mock_vector_store,
+            embedder=mock_embedder,
+            similar_query_threshold=0.95,
+        )
+
+        first = await strategy.search("fix the login bug")
+        second = await strategy.search("fix login bug")
+        assert mock_vector_store.search.await_count == 1
+        assert second == first
 
+        await strategy.search("fix login bug", config=RetrievalConfig(limit=3))
+        await strategy.search("deploy the app")
+        assert mock_vector_store.search.await_count == 3
+
+        strategy.clear_result_cache()
+        await strategy.search("fix the login bug")
+        assert mock_vector_store.search.await_count == 4
+
+    async def test_search_calls_vector_store(self, strategy, mock_vector_store):
+        """Verify search uses vector store with correct params."""
         config = RetrievalConfig(limit=5, vector_weight=0.8)
         await strategy.search("test query", config=config)
 
-        mock_vector_store.search.assert_called_once_with(
-            query_vector=[0.1] * 1536,
-            query_text="test query",
-            limit=5,
-            exclude_conversation_id=None,
-            vector_weight=0.8,
-        )
+        mock_vector_store.search.assert_called_once()
+        call_kwargs = dict(mock_vector_store.search.call_args.kwargs)
+        # The embedding is handed over as-is, not copied
+        assert call_kwargs.pop("query_vector") is FAKE_EMBEDDING
+        assert call_kwargs == {
+            "query_text": "test query",
+            "limit": 5,
+            "exclude_conversation_id": None,
+            "vector_weight": 0.8,
+        }
 
     async def test_search_with_config_exclude_conversation(
-        self, strategy, mock_vector_store, mock_embedder
+        self, strategy, mock_vector_store
     ):
         """Verify config.exclude_conversation_id is passed to vector store."""
-        mock_embedder.embed = AsyncMock(return_value=[0.1] * 1536)
-        mock_vector_store.search = AsyncMock(return_value=[])
-
         config = RetrievalConfig(exclude_conversation_id="conv-exclude")
         await strategy.search("test query", config=config)
 
@@ -227,12 +257,9 @@ class TestHybridRetrievalStrategySearch:
         assert call_kwargs["exclude_conversation_id"] == "conv-exclude"
 
     async def test_search_defaults_to_retrieval_config(
-        self, strategy, mock_vector_store, mock_embedder
+        self, strategy, mock_vector_store
     ):
         """Verify search uses default RetrievalConfig when none provided."""
-        mock_embedder.embed = AsyncMock(return_value=[0.1] * 1536)
-        mock_vector_store.search = AsyncMock(return_value=[])
-
         await strategy.search("test query")
 
         mock_vector_store.search.assert_called_once()
@@ -240,60 +267,32 @@ class TestHybridRetrievalStrategySearch:
         assert call_kwargs["limit"] == 10  # Default
         assert call_kwargs["exclude_conversation_id"] is None
 
-    async def test_search_returns_retrieval_results(
-        self, strategy, mock_vector_store, mock_embedder
-    ):
+    async def test_search_returns_retrieval_results(self, strategy, mock_vector_store):
         """Verify search returns properly formatted results."""
-        node_id = uuid4()
-        mock_embedder.embed = AsyncMock(return_value=[0.1] * 1536)
-        mock_vector_store.search = AsyncMock(
-            return_value=[
-                VectorSearchResult(
-                    node_id=node_id,
-                    text="matching text",
-                    conversation_id="conv-1",
-                    created_at=datetime.now(UTC),
-                    last_accessed=datetime.now(UTC),
-                    score=0.95,
-                )
-            ]
-        )
+        mock_vector_store.search.return_value = [_search_result()]
 
         config = RetrievalConfig(include_context=False)
         results = await strategy.search("test query", config=config)
 
         assert len(results) == 1
-        assert results[0].node_id == node_id
+        assert results[0].node_id == NODE_ID
         assert results[0].text == "matching text"
         assert results[0].conversation_id == "conv-1"
         assert results[0].score == 0.95
         assert results[0].context is None
 
     async def test_search_with_context_delegates_to_graph_store(
-        self, strategy, mock_graph_store, mock_vector_store, mock_embedder
+        self, strategy, mock_graph_store, mock_vector_store
     ):
         """Verify search with include_context=True calls get_node_context."""
-        node_id = uuid4()
-        mock_embedder.embed = AsyncMock(return_value=[0.1] * 1536)
-        mock_vector_store.search = AsyncMock(
-            return_value=[
-                VectorSearchResult(
-                    node_id=node_id,
-                    text="query text",
-                    conversation_id="conv-1",
-                    created_at=datetime.now(UTC),
-                    last_accessed=datetime.now(UTC),
-                    score=0.9,
-                )
-            ]
-        )
-        mock_graph_store.get_node_context = AsyncMock(
-            return_value=ContextResult(
-                user_text=UserTextInfo(
-                    id=str(node_id), text="query text", conversation_id="conv-1"
-                ),
-                agent_text=AgentTextInfo(id="agent-1", text="response text"),
-            )
+        mock_vector_store.search.return_value = [
+            _search_result(text="query text", score=0.9)
+        ]
+        mock_graph_store.get_node_context.return_value = ContextResult(
+            user_text=UserTextInfo(
+                id=str(NODE_ID), text="query text", conversation_id="conv-1"
+            ),
+            agent_text=AgentTextInfo(id="agent-1", text="response text"),
         )
 
         config = RetrievalConfig(include_context=True)
@@ -303,62 +302,112 @@ class TestHybridRetrievalStrategySearch:
         assert results[0].context is not None
         assert results[0].context.user_text.text == "query text"
         assert results[0].context.agent_text.text == "response text"
-        mock_graph_store.get_node_context.assert_called_once_with(node_id)
+        mock_graph_store.get_node_context.assert_called_once_with(NODE_ID)
 
     async def test_search_updates_last_accessed(
-        self, strategy, mock_graph_store, mock_vector_store, mock_embedder
+        self, strategy, mock_graph_store, mock_vector_store
     ):
         """Verify search updates last_accessed timestamps."""
-        node_id = uuid4()
-        mock_embedder.embed = AsyncMock(return_value=[0.1] * 1536)
-        mock_vector_store.search = AsyncMock(
-            return_value=[
-                VectorSearchResult(
-                    node_id=node_id,
-                    text="text",
-                    conversation_id="conv-1",
-                    created_at=datetime.now(UTC),
-                    last_accessed=datetime.now(UTC),
-                    score=0.9,
-                )
-            ]
-        )
+        mock_vector_store.search.return_value = [_search_result(text="text", score=0.9)]
 
         config = RetrievalConfig(include_context=False)
         await strategy.search("test query", config=config)
 
-        mock_graph_store.update_last_accessed.assert_called_once_with([node_id])
-        mock_vector_store.update_last_accessed.assert_called_once_with(node_id)
+        mock_graph_store.update_last_accessed.assert_called_once_with([NODE_ID])
+        mock_vector_store.update_last_accessed.assert_called_once_with([NODE_ID])
 
+    async def test_search_updates_stores_concurrently(
+        self, strategy, mock_graph_store, mock_vector_store
+    ):
+        """The graph update is in flight while the vector store is updated."""
+        mock_vector_store.search.return_value = [_search_result()]
+        vector_touched = asyncio.Event()
 
-class TestHybridRetrievalStrategyGetContext:
-    """Tests for HybridRetrievalStrategy.get_context method."""
+        async def graph_update(node_ids):
+            await asyncio.wait_for(vector_touched.wait(), timeout=1)
 
-    @pytest.fixture
-    def strategy(self, mock_graph_store, mock_vector_store, mock_embedder):
-        """Create a HybridRetrievalStrategy with mocks."""
-        return HybridRetrievalStrategy(
-            graph_store=mock_graph_store,
-            vector_store=mock_vector_store,
-            embedder=mock_embedder,
+        async def vector_update(node_ids):
+            vector_touched.set()
+
+        mock_graph_store.update_last_accessed.side_effect = graph_update
+        mock_vector_store.update_last_accessed.side_effect = vector_update
+
+        await strategy.search("test query", RetrievalConfig(include_context=False))
+
+        mock_graph_store.update_last_accessed.assert_awaited_once_with([NODE_ID])
+        mock_vector_store.update_last_accessed.assert_awaited_once_with([NODE_ID])
+
+
+class TestHybridRetrievalStrategySearchBatch:
+    """Tests for HybridRetrievalStrategy.search_batch method."""
+
+    @pytest.fixture(autouse=True)
+    def fixed_embeddings(self, mock_embedder):
+        """Make embed_batch return FAKE_EMBEDDING for every text."""
+        mock_embedder.embed_batch = AsyncMock(
+            side_effect=lambda texts: [FAKE_EMBEDDING] * len(texts)
+        )
+        mock_embedder.embed = AsyncMock(return_value=FAKE_EMBEDDING)
+
+    async def test_search_batch_calls_embed_batch_once(
+        self, strategy, mock_embedder, mock_vector_store
+    ):
+        """Distinct queries are embedded in one call, in order."""
+        results = await strategy.search_batch(["a", "b", "a"])
+
+        mock_embedder.embed_batch.assert_awaited_once_with(["a", "b"])
+        mock_embedder.embed.assert_not_awaited()
+        assert len(results) == 3
+        queries = [
+            c.kwargs["query_text"] for c in mock_vector_store.search.call_args_list
+        ]
+        assert queries == ["a", "b", "a"]
+
+    async def test_search_batch_parallel(self, strategy, mock_vector_store):
+        """Every query's vector search is in flight before any finishes."""
+        queries = ["a", "b", "c"]
+        started: list[str] = []
+        all_started = asyncio.Event()
+
+        async def search(**kwargs):
+            started.append(kwargs["query_text"])
+            if len(started) == len(queries):
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return [_search_result(text=kwargs["query_text"])]
+
+        mock_vector_store.search.side_effect = search
+
+        results = await strategy.search_batch(
+            queries, RetrievalConfig(include_context=False)
         )
 
+        assert [r[0].text for r in results] == queries
+
+    async def test_search_batch_empty(self, strategy, mock_embedder):
+        """No queries means no embedding call."""
+        assert await strategy.search_batch([]) == []
+        mock_embedder.embed_batch.assert_not_awaited()
+
+
+class TestHybridRetrievalStrategyGetContext:
+    """Tests for HybridRetrievalStrategy.get_context method."""
+
     async def test_get_context_delegates_to_graph_store(
         self, strategy, mock_graph_store
     ):
         """Verify get_context delegates to graph_store.get_node_context."""
-        node_id = uuid4()
         expected = ContextResult(
             user_text=UserTextInfo(
-                id=str(node_id), text="question", conversation_id="c1"
+                id=str(NODE_ID), text="question", conversation_id="c1"
             ),
             agent_text=AgentTextInfo(id="a1", text="answer"),
         )
-        mock_graph_store.get_node_context = AsyncMock(return_value=expected)
+        mock_graph_store.get_node_context.return_value = expected
 
-        result = await strategy.get_context(node_id)
+        result = await strategy.get_context(NODE_ID)
 
-        mock_graph_store.get_node_context.assert_called_once_with(node_id)
+        mock_graph_store.get_node_context.assert_called_once_with(NODE_ID)
         assert result.user_text.text == "question"
         assert result.agent_text.text == "answer"
 
@@ -366,9 +415,7 @@ class TestHybridRetrievalStrategyGetContext:
         self, strategy, mock_graph_store
     ):
         """Verify get_context returns empty context when node not found."""
-        mock_graph_store.get_node_context = AsyncMock(return_value=ContextResult())
-
-        context = await strategy.get_context(uuid4())
+        context = await strategy.get_context(NODE_ID)
 
         assert context.user_text is None
         assert context.agent_text is None
@@ -378,21 +425,10 @@ class TestHybridRetrievalStrategyGetContext:
 class TestHybridRetrievalStrategyGetConversationsForResource:
     """Tests for HybridRetrievalStrategy.get_conversations_for_resource method."""
 
-    @pytest.fixture
-    def strategy(self, mock_graph_store, mock_vector_store, mock_embedder):
-        """Create a HybridRetrievalStrategy with mocks."""
-        return HybridRetrievalStrategy(
-            graph_store=mock_graph_store,
-            vector_store=mock_vector_store,
-            embedder=mock_embedder,
-        )
-
     async def test_get_conversations_returns_empty_list(
         self, strategy, mock_graph_store
     ):
         """Verify returns empty list when no conversations found."""
-        mock_graph_store.get_resource_conversations = AsyncMock(return_value=[])
-
         result = await strategy.get_conversations_for_resource("file:///test.py")
 
         assert result == []
@@ -407,10 +443,10 @@ class TestHybridRetrievalStrategyGetConversationsForResource:
                 user_text_id="user-1",
                 user_text="Read the file",
                 agent_text="Here's the content",
-                created_at=datetime.now(UTC),
+                created_at=NOW,
             )
         ]
-        mock_graph_store.get_resource_conversations = AsyncMock(return_value=expected)
+        mock_graph_store.get_resource_conversations.return_value = expected
 
         result = await strategy.get_conversations_for_resource("file:///test.py")
 
@@ -420,8 +456,6 @@ class TestHybridRetrievalStrategyGetConversationsForResource:
 
     async def test_get_conversations_passes_config(self, strategy, mock_graph_store):
         """Verify config values are passed to graph_store."""
-        mock_graph_store.get_resource_conversations = AsyncMock(return_value=[])
-
         config = RetrievalConfig(
             limit=5,
             sort_by="last_accessed_at",
@@ -442,8 +476,6 @@ class TestHybridRetrievalStrategyGetConversationsForResource:
         self, strategy, mock_graph_store
     ):
         """Verify default config is used when none provided."""
-        mock_graph_store.get_resource_conversations = AsyncMock(return_value=[])
-
         await strategy.get_conversations_for_resource("file:///test.py")
 
         mock_graph_store.get_resource_conversations.assert_called_once_with(
@@ -458,26 +490,15 @@ class TestHybridRetrievalStrategyGetConversationsForResource:
 class TestHybridRetrievalStrategyGetTrajectory:
     """Tests for HybridRetrievalStrategy.get_trajectory method."""
 
-    @pytest.fixture
-    def strategy(self, mock_graph_store, mock_vector_store, mock_embedder):
-        """Create a HybridRetrievalStrategy with mocks."""
-        return HybridRetrievalStrategy(
-            graph_store=mock_graph_store,
-            vector_store=mock_vector_store,
-            embedder=mock_embedder,
-        )
-
     async def test_get_trajectory_delegates_to_graph_store(
         self, strategy, mock_graph_store
     ):
         """Verify get_trajectory delegates data fetch to graph_store."""
-        node_id = uuid4()
-        mock_graph_store.get_trajectory_nodes = AsyncMock(return_value=[])
 
-        await strategy.get_trajectory(node_id)
+        await strategy.get_trajectory(NODE_ID)
 
         mock_graph_store.get_trajectory_nodes.assert_called_once_with(
-            node_id,
+            NODE_ID,
             max_depth=100,
         )
 
@@ -485,14 +506,12 @@ class TestHybridRetrievalStrategyGetTrajectory:
         self, strategy, mock_graph_store
     ):
         """Verify trajectory_max_depth from config is passed."""
-        node_id = uuid4()
-        mock_graph_store.get_trajectory_nodes = AsyncMock(return_value=[])
 
         config = RetrievalConfig(trajectory_max_depth=50)
-        await strategy.get_trajectory(node_id, config=config)
+        await strategy.get_trajectory(NODE_ID, config=config)
 
         mock_graph_store.get_trajectory_nodes.assert_called_once_with(
-            node_id,
+            NODE_ID,
             max_depth=50,
         )
 
@@ -549,15 +568,14 @@ class TestRetrievalResultModel:
 
     def test_required_fields(self):
         """Verify required fields are enforced."""
-        node_id = uuid4()
         result = RetrievalResult(
-            node_id=node_id,
+            node_id=NODE_ID,
             text="matching text",
             conversation_id="conv-1",
             score=0.95,
         )
 
-        assert result.node_id == node_id
+        assert result.node_id == NODE_ID
         assert result.text == "matching text"
         assert result.conversation_id == "conv-1"
         assert result.score == 0.95
@@ -566,7 +584,7 @@ class TestRetrievalResultModel:
     def test_with_context(self):
         """Verify context can be attached."""
         result = RetrievalResult(
-            node_id=uuid4(),
+            node_id=NODE_ID,
             text="text",
             conversation_id="c1",
             score=0.8,
@@ -582,7 +600,7 @@ class TestRetrievalResultModel:
     def test_str(self):
         """Verify __str__ produces readable output."""
         result = RetrievalResult(
-            node_id=uuid4(),
+            node_id=NODE_ID,
             text="matching text",
             conversation_id="conv-1",
             score=0.95,
@@ -1,4 +1,7 @@
+import asyncio
+import hashlib
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -11,29 +14,35 @@ from tracemem_core.models.nodes import AgentText, ToolUseRecord, UserText
 from tracemem_core.retrieval.results import (
     ContextResult,
     RetrievalConfig,
-    TrajectoryResult,
 )
 from tracemem_core.tracemem import TraceMem
 
 from .conftest import MockEmbedder
 
 
+@pytest.fixture
+def tm(
+    mock_embedder: MockEmbedder,
+    mock_graph_store: AsyncMock,
+    mock_vector_store: AsyncMock,
+) -> TraceMem:
+    """TraceMem with the default config, wired to the mock stores."""
+    tm = TraceMem(config=TraceMemConfig(), embedder=mock_embedder)
+    tm._graph_store = mock_graph_store
+    tm._vector_store = mock_vector_store
+    return tm
+
+
 class TestTraceMemMessageAPI:
     """Test Message-based API."""
 
-    @pytest.mark.asyncio
     async def test_add_message_user(
         self,
-        mock_embedder: MockEmbedder,
+        tm: TraceMem,
         mock_graph_store: AsyncMock,
         mock_vector_store: AsyncMock,
     ) -> None:
         """Add a user message."""
-        config = TraceMemConfig()
-        tm = TraceMem(config=config, embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
         message = Message(role="user", content="Hello")
         result = await tm.add_message("conv-1", message)
 
@@ -41,19 +50,78 @@ class TestTraceMemMessageAPI:
         mock_graph_store.create_node.assert_called_once()
         mock_vector_store.add.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_add_message_assistant(
+    async def test_add_message_user_embeds_during_graph_write(
         self,
+        tm: TraceMem,
         mock_embedder: MockEmbedder,
         mock_graph_store: AsyncMock,
         mock_vector_store: AsyncMock,
     ) -> None:
-        """Add an assistant message after a user message."""
-        config = TraceMemConfig()
-        tm = TraceMem(config=config, embedder=mock_embedder)
+        """Embedding overlaps create_node; the vector is added after it."""
+        embedding_started = asyncio.Event()
+        embed = mock_embedder.embed
+
+        async def create_node(node):
+            await asyncio.wait_for(embedding_started.wait(), timeout=1)
+            mock_vector_store.add.assert_not_awaited()
+            return node
+
+        async def tracked_embed(text):
+            embedding_started.set()
+            return await embed(text)
+
+        mock_graph_store.create_node.side_effect = create_node
+        mock_embedder.embed = tracked_embed
+
+        await tm.add_message("conv-1", Message(role="user", content="Hello"))
+
+        mock_vector_store.add.assert_awaited_once()
+
+    async def test_add_message_reuses_embedding_for_repeated_text(
+        self,
+        mock_graph_store: AsyncMock,
+        mock_vector_store: AsyncMock,
+    ) -> None:
+        """The same user text is embedded once; embed_cache_size=0 disables."""
+        for cache_size, expected_calls in ((1024, 1), (0, 2)):
+            embedder = MockEmbedder()
+            embedder.embed = AsyncMock(wraps=embedder.embed)
+            tm = TraceMem(
+                config=TraceMemConfig(embed_cache_size=cache_size), embedder=embedder
+            )
+            tm._graph_store = mock_graph_store
+            tm._vector_store = mock_vector_store
+
+            await tm.add_message("conv-1", Message(role="user", content="Hello"))
+            await tm.add_message("conv-2", Message(role="user", content="Hello"))
+
+            assert embedder.embed.await_count == expected_calls
+
+    async def test_search_reuses_hits_with_only_similar_query_threshold(
+        self,
+        mock_embedder: MockEmbedder,
+        mock_graph_store: AsyncMock,
+        mock_vector_store: AsyncMock,
+    ) -> None:
+        """similar_query_threshold works without any other cache setting."""
+        tm = TraceMem(
+            config=TraceMemConfig(similar_query_threshold=0.95),
+            embedder=mock_embedder,
+        )
         tm._graph_store = mock_graph_store
         tm._vector_store = mock_vector_store
 
+        await tm.search("fix the login bug")
+        await tm.search("fix the login bug")
+
+        assert mock_vector_store.search.await_count == 1
+
+    async def test_add_message_assistant(
+        self,
+        tm: TraceMem,
+        mock_graph_store: AsyncMock,
+    ) -> None:
+        """Add an assistant message after a user message."""
         # First add a user message
         user_result = await tm.add_message(
             "conv-1", Message(role="user", content="Hello")
@@ -62,11 +130,9 @@ class TestTraceMemMessageAPI:
 
         # Configure turn-based methods to return appropriate values
         # After adding user message, max turn is 0
-        mock_graph_store.get_max_turn_index = AsyncMock(return_value=0)
-        mock_graph_store.get_last_node_in_turn = AsyncMock(
-            return_value=UserText(
-                id=user_text_id, text="Hello", conversation_id="conv-1", turn_index=0
-            )
+        mock_graph_store.get_max_turn_index.return_value = 0
+        mock_graph_store.get_last_node_in_turn.return_value = UserText(
+            id=user_text_id, text="Hello", conversation_id="conv-1", turn_index=0
         )
 
         # Then add assistant message
@@ -79,40 +145,35 @@ class TestTraceMemMessageAPI:
         assert mock_graph_store.create_node.call_count == 2
         mock_graph_store.create_edge.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_add_message_tool_stores_result(
         self,
+        tm: TraceMem,
         mock_embedder: MockEmbedder,
-        mock_graph_store: AsyncMock,
         mock_vector_store: AsyncMock,
     ) -> None:
-        """Tool messages should store their content for later use."""
-        config = TraceMemConfig()
-        tm = TraceMem(config=config, embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
+        """Tool messages store their content hash and are not embedded."""
+        mock_embedder.embed = AsyncMock()
         message = Message(
             role="tool", content="file content here", tool_call_id="call_123"
         )
-        await tm.add_message("conv-1", message)
+        result = await tm.add_message("conv-1", message)
+
+        assert result == {}
+        mock_embedder.embed.assert_not_awaited()
+        mock_vector_store.add.assert_not_awaited()
 
-        assert tm._tool_results["call_123"] == "file content here"
+        assert (
+            tm._tool_result_hashes["call_123"]
+            == hashlib.sha256(b"file content here").hexdigest()
+        )
 
-    @pytest.mark.asyncio
     async def test_import_trace_with_tool_calls(
         self,
-        mock_embedder: MockEmbedder,
+        tm: TraceMem,
         mock_graph_store: AsyncMock,
-        mock_vector_store: AsyncMock,
         tmp_path: Path,
     ) -> None:
         """Import a trace with tool calls and results."""
-        config = TraceMemConfig()
-        tm = TraceMem(config=config, embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
         # Create a test file
         test_file = tmp_path / "auth.py"
         test_file.touch()
@@ -139,22 +200,25 @@ class TestTraceMemMessageAPI:
 
         assert "user_text" in result
         assert "agent_text" in result
-        # Resource nodes should be created
-        mock_graph_store.create_node.assert_called()
+        # All nodes (including the resource and its version) and all edges
+        # are written in one bulk call each
+        mock_graph_store.create_node.assert_not_awaited()
+        mock_graph_store.create_edge.assert_not_awaited()
+        (nodes,) = mock_graph_store.create_nodes.await_args.args
+        assert [type(n).__name__ for n in nodes] == [
+            "UserText",
+            "AgentText",
+            "Resource",
+            "ResourceVersion",
+        ]
+        (edges,) = mock_graph_store.create_edges.await_args.args
+        assert len(edges) == 3  # MESSAGE, VERSION_OF, READ_FILE
 
-    @pytest.mark.asyncio
     async def test_import_trace_collects_tool_results_first(
         self,
-        mock_embedder: MockEmbedder,
-        mock_graph_store: AsyncMock,
-        mock_vector_store: AsyncMock,
+        tm: TraceMem,
     ) -> None:
         """Import trace should collect tool results before processing."""
-        config = TraceMemConfig()
-        tm = TraceMem(config=config, embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
         messages = [
             Message(role="user", content="Hello"),
             Message(role="tool", content="result1", tool_call_id="call_1"),
@@ -164,30 +228,153 @@ class TestTraceMemMessageAPI:
         await tm.import_trace("conv-1", messages)
 
         # Tool results should be collected
-        assert "call_1" in tm._tool_results
-        assert "call_2" in tm._tool_results
+        assert "call_1" in tm._tool_result_hashes
+        assert "call_2" in tm._tool_result_hashes
+
+    async def test_import_trace_embeds_and_writes_vectors_once(
+        self,
+        mock_graph_store: AsyncMock,
+        mock_vector_store: AsyncMock,
+    ) -> None:
+        """User texts are embedded in one batch and written in one batch."""
+        embedder = MockEmbedder()
+        embedder.embed = AsyncMock()
+        embedder.embed_batch = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] * 1536 for t in texts]
+        )
+        tm = TraceMem(config=TraceMemConfig(embed_cache_size=0), embedder=embedder)
+        tm._graph_store = mock_graph_store
+        tm._vector_store = mock_vector_store
+
+        messages = [
+            Message(role="user", content="Hello"),
+            Message(role="assistant", content="Hi"),
+            Message(role="user", content="Fix the bug"),
+            Message(role="user", content="Hello"),
+        ]
+        await tm.import_trace("conv-1", messages)
+
+        embedder.embed_batch.assert_awaited_once_with(["Hello", "Fix the bug"])
+        embedder.embed.assert_not_awaited()
+        mock_vector_store.add.assert_not_awaited()
+        mock_vector_store.add_batch.assert_awaited_once()
+        (entries,) = mock_vector_store.add_batch.await_args.args
+        assert [e.text for e in entries] == ["Hello", "Fix the bug", "Hello"]
+        assert [e.vector[0] for e in entries] == [5.0, 11.0, 5.0]
+
+    async def test_import_trace_writes_vectors_on_failure(
+        self,
+        tm: TraceMem,
+        mock_graph_store: AsyncMock,
+        mock_vector_store: AsyncMock,
+    ) -> None:
+        """Messages processed before a failure are still written."""
+        mock_graph_store.get_last_agent_text.side_effect = [None, RuntimeError("boom")]
+
+        messages = [
+            Message(role="user", content="first"),
+            Message(role="user", content="second"),
+        ]
+        with pytest.raises(RuntimeError, match="boom"):
+            await tm.import_trace("conv-1", messages)
+
+        (nodes,) = mock_graph_store.create_nodes.await_args.args
+        assert [n.text for n in nodes] == ["first"]
+        (entries,) = mock_vector_store.add_batch.await_args.args
+        assert [e.text for e in entries] == ["first"]
+
+        # Later messages are written directly again
+        mock_graph_store.get_last_agent_text.side_effect = None
+        await tm.add_message("conv-1", Message(role="user", content="third"))
+        mock_graph_store.create_node.assert_awaited_once()
+        mock_vector_store.add.assert_awaited_once()
+
+    async def test_import_trace_flush_failure_keeps_original_error(
+        self,
+        tm: TraceMem,
+        mock_graph_store: AsyncMock,
+    ) -> None:
+        """A failing flush after a failed import doesn't mask the first error."""
+        mock_graph_store.get_last_agent_text.side_effect = [None, RuntimeError("boom")]
+        mock_graph_store.create_nodes.side_effect = ConnectionError("flush")
+
+        messages = [
+            Message(role="user", content="first"),
+            Message(role="user", content="second"),
+        ]
+        with pytest.raises(RuntimeError, match="boom") as exc_info:
+            await tm.import_trace("conv-1", messages)
+
+        assert "flush" in exc_info.value.__notes__[0]
+
+    async def test_add_message_during_import_is_written_directly(
+        self,
+        tm: TraceMem,
+        mock_graph_store: AsyncMock,
+        mock_vector_store: AsyncMock,
+    ) -> None:
+        """Messages added while another task imports don't join its batch."""
+        importing = asyncio.Event()
+        release = asyncio.Event()
+
+        async def get_max_turn_index(conversation_id):
+            if conversation_id == "imported":
+                importing.set()
+                await release.wait()
+            return -1
+
+        mock_graph_store.get_max_turn_index.side_effect = get_max_turn_index
+        task = asyncio.create_task(
+            tm.import_trace("imported", [Message(role="user", content="old")])
+        )
+        await asyncio.wait_for(importing.wait(), timeout=1)
+
+        await tm.add_message("live", Message(role="user", content="new"))
+        mock_graph_store.create_node.assert_awaited_once()
+        mock_vector_store.add.assert_awaited_once()
+
+        release.set()
+        await task
+        (nodes,) = mock_graph_store.create_nodes.await_args.args
+        assert [n.text for n in nodes] == ["old"]
+
+    async def test_concurrent_imports_keep_their_own_writes(
+        self,
+        tm: TraceMem,
+        mock_graph_store: AsyncMock,
+        mock_vector_store: AsyncMock,
+    ) -> None:
+        """Two imports running at once each flush their own messages."""
+        await asyncio.gather(
+            tm.import_trace("conv-a", [Message(role="user", content="a")]),
+            tm.import_trace("conv-b", [Message(role="user", content="b")]),
+        )
+
+        written = [
+            [n.text for n in call.args[0]]
+            for call in mock_graph_store.create_nodes.await_args_list
+        ]
+        indexed = [
+            [e.text for e in call.args[0]]
+            for call in mock_vector_store.add_batch.await_args_list
+        ]
+        assert sorted(written) == [["a"], ["b"]]
+        assert sorted(indexed) == [["a"], ["b"]]
 
 
 class TestTraceMemToolUses:
     """Test tool_uses tracking on AgentText nodes."""
 
-    @pytest.mark.asyncio
     async def test_agent_text_stores_tool_uses(
         self,
-        mock_embedder: MockEmbedder,
+        tm: TraceMem,
         mock_graph_store: AsyncMock,
-        mock_vector_store: AsyncMock,
     ) -> None:
         """AgentText node should have tool_uses populated from message."""
-        config = TraceMemConfig()
-        tm = TraceMem(config=config, embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
         # Configure turn-based methods
-        mock_graph_store.get_max_turn_index = AsyncMock(return_value=0)
-        mock_graph_store.get_last_node_in_turn = AsyncMock(
-            return_value=UserText(text="Hello", conversation_id="conv-1", turn_index=0)
+        mock_graph_store.get_max_turn_index.return_value = 0
+        mock_graph_store.get_last_node_in_turn.return_value = UserText(
+            text="Hello", conversation_id="conv-1", turn_index=0
         )
 
         message = Message(
@@ -214,22 +401,15 @@ class TestTraceMemToolUses:
         assert agent_text.tool_uses[1].name == "read_file"
         assert agent_text.tool_uses[1].args == {"path": "config.py"}
 
-    @pytest.mark.asyncio
     async def test_tool_uses_empty_when_no_tools(
         self,
-        mock_embedder: MockEmbedder,
+        tm: TraceMem,
         mock_graph_store: AsyncMock,
-        mock_vector_store: AsyncMock,
     ) -> None:
         """AgentText without tools should have empty tool_uses list."""
-        config = TraceMemConfig()
-        tm = TraceMem(config=config, embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
-        mock_graph_store.get_max_turn_index = AsyncMock(return_value=0)
-        mock_graph_store.get_last_node_in_turn = AsyncMock(
-            return_value=UserText(text="Hello", conversation_id="conv-1", turn_index=0)
+        mock_graph_store.get_max_turn_index.return_value = 0
+        mock_graph_store.get_last_node_in_turn.return_value = UserText(
+            text="Hello", conversation_id="conv-1", turn_index=0
         )
 
         message = Message(role="assistant", content="Hello, how can I help?")
@@ -241,22 +421,15 @@ class TestTraceMemToolUses:
         assert isinstance(agent_text, AgentText)
         assert agent_text.tool_uses == []
 
-    @pytest.mark.asyncio
     async def test_tool_uses_includes_non_resource_tools(
         self,
-        mock_embedder: MockEmbedder,
+        tm: TraceMem,
         mock_graph_store: AsyncMock,
-        mock_vector_store: AsyncMock,
     ) -> None:
         """Tools that don't produce resources (bash, web_search) should be tracked."""
-        config = TraceMemConfig()
-        tm = TraceMem(config=config, embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
-        mock_graph_store.get_max_turn_index = AsyncMock(return_value=0)
-        mock_graph_store.get_last_node_in_turn = AsyncMock(
-            return_value=UserText(text="Hello", conversation_id="conv-1", turn_index=0)
+        mock_graph_store.get_max_turn_index.return_value = 0
+        mock_graph_store.get_last_node_in_turn.return_value = UserText(
+            text="Hello", conversation_id="conv-1", turn_index=0
         )
 
         # These tools don't create resources via the extractor
@@ -310,7 +483,10 @@ class TestTraceMemConfig:
         config = TraceMemConfig()
 
         assert config.neo4j_uri == "bolt://localhost:7687"
+        assert config.neo4j_max_connection_pool_size == 50
+        assert config.neo4j_connection_acquisition_timeout == 5.0
         assert config.embedding_dimensions == 1536
+        assert config.embed_cache_size == 0
 
     def test_default_graph_store_is_kuzu(self) -> None:
         """Default graph store should be kuzu."""
@@ -395,6 +571,7 @@ class TestTraceMemStoreSelection:
         self, tmp_path: Path, mock_embedder: MockEmbedder
     ) -> None:
         """graph_store='neo4j' should create Neo4jGraphStore."""
+        pytest.importorskip("neo4j", reason="neo4j driver not installed")
         from tracemem_core.storage.graph.neo import Neo4jGraphStore
 
         config = TraceMemConfig(
@@ -441,116 +618,43 @@ class TestTraceMemReranker:
 class TestTraceMemRetrieval:
     """Test top-level retrieval delegate methods on TraceMem."""
 
-    @pytest.mark.asyncio
-    async def test_search_delegates_to_retrieval(
+    @pytest.mark.parametrize(
+        ("method", "args", "config"),
+        [
+            ("search", ("test query",), None),
+            ("search", ("test query",), RetrievalConfig(limit=3)),
+            ("search_batch", (["query a", "query b"],), None),
+            ("get_conversations_for_resource", ("file://src/auth.py",), None),
+            ("get_trajectory", (uuid4(),), RetrievalConfig(trajectory_max_depth=50)),
+            ("get_trajectories", ([uuid4(), uuid4()],), None),
+        ],
+    )
+    async def test_delegates_with_config(
         self,
-        mock_embedder: MockEmbedder,
-        mock_graph_store: AsyncMock,
-        mock_vector_store: AsyncMock,
+        tm: TraceMem,
+        method: str,
+        args: tuple,
+        config: RetrievalConfig | None,
     ) -> None:
-        """TraceMem.search() delegates to retrieval.search() with default config."""
-        tm = TraceMem(config=TraceMemConfig(), embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
-        mock_retrieval = MagicMock()
-        mock_retrieval.search = AsyncMock(return_value=[])
-        tm._retrieval = mock_retrieval
+        """Forward args to retrieval; config falls back to config.retrieval."""
+        delegate = AsyncMock(return_value=[])
+        tm._retrieval = SimpleNamespace(**{method: delegate})
 
-        await tm.search("test query")
+        await getattr(tm, method)(*args, config=config)
 
-        mock_retrieval.search.assert_called_once()
-        call_args = mock_retrieval.search.call_args
-        assert call_args[0][0] == "test query"
-        assert isinstance(call_args.kwargs["config"], RetrievalConfig)
+        delegate.assert_awaited_once()
+        assert delegate.await_args.args == args
+        assert delegate.await_args.kwargs["config"] is (config or tm._config.retrieval)
 
-    @pytest.mark.asyncio
-    async def test_search_uses_custom_config(
-        self,
-        mock_embedder: MockEmbedder,
-        mock_graph_store: AsyncMock,
-        mock_vector_store: AsyncMock,
-    ) -> None:
-        """TraceMem.search(config=custom) uses custom config over default."""
-        tm = TraceMem(config=TraceMemConfig(), embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
-        mock_retrieval = MagicMock()
-        mock_retrieval.search = AsyncMock(return_value=[])
-        tm._retrieval = mock_retrieval
-
-        custom_config = RetrievalConfig(limit=3)
-        await tm.search("test query", config=custom_config)
-
-        call_args = mock_retrieval.search.call_args
-        assert call_args.kwargs["config"] is custom_config
-
-    @pytest.mark.asyncio
     async def test_get_context_delegates(
         self,
-        mock_embedder: MockEmbedder,
-        mock_graph_store: AsyncMock,
-        mock_vector_store: AsyncMock,
+        tm: TraceMem,
     ) -> None:
         """TraceMem.get_context() delegates to retrieval.get_context()."""
-        tm = TraceMem(config=TraceMemConfig(), embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
-        mock_retrieval = MagicMock()
-        mock_retrieval.get_context = AsyncMock(return_value=ContextResult())
-        tm._retrieval = mock_retrieval
+        get_context = AsyncMock(return_value=ContextResult())
+        tm._retrieval = SimpleNamespace(get_context=get_context)
 
         node_id = uuid4()
         await tm.get_context(node_id)
 
-        mock_retrieval.get_context.assert_called_once_with(node_id)
-
-    @pytest.mark.asyncio
-    async def test_get_conversations_for_resource_delegates(
-        self,
-        mock_embedder: MockEmbedder,
-        mock_graph_store: AsyncMock,
-        mock_vector_store: AsyncMock,
-    ) -> None:
-        """TraceMem.get_conversations_for_resource() delegates correctly."""
-        tm = TraceMem(config=TraceMemConfig(), embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
-        mock_retrieval = MagicMock()
-        mock_retrieval.get_conversations_for_resource = AsyncMock(return_value=[])
-        tm._retrieval = mock_retrieval
-
-        await tm.get_conversations_for_resource("file://src/auth.py")
-
-        mock_retrieval.get_conversations_for_resource.assert_called_once()
-        call_args = mock_retrieval.get_conversations_for_resource.call_args
-        assert call_args[0][0] == "file://src/auth.py"
-        assert isinstance(call_args.kwargs["config"], RetrievalConfig)
-
-    @pytest.mark.asyncio
-    async def test_get_trajectory_delegates(
-        self,
-        mock_embedder: MockEmbedder,
-        mock_graph_store: AsyncMock,
-        mock_vector_store: AsyncMock,
-    ) -> None:
-        """TraceMem.get_trajectory() delegates correctly."""
-        tm = TraceMem(config=TraceMemConfig(), embedder=mock_embedder)
-        tm._graph_store = mock_graph_store
-        tm._vector_store = mock_vector_store
-
-        mock_retrieval = MagicMock()
-        mock_retrieval.get_trajectory = AsyncMock(return_value=TrajectoryResult())
-        tm._retrieval = mock_retrieval
-
-        node_id = uuid4()
-        custom_config = RetrievalConfig(trajectory_max_depth=50)
-        await tm.get_trajectory(node_id, config=custom_config)
-
-        mock_retrieval.get_trajectory.assert_called_once()
-        call_args = mock_retrieval.get_trajectory.call_args
-        assert call_args[0][0] == node_id
-        assert call_args.kwargs["config"] is custom_config
+        get_context.assert_awaited_once_with(node_id)
@@ -298,6 +298,13 @@ class TestGetTrajectory:
         assert len(result.steps[1].tool_uses) == 1
         assert result.steps[1].tool_uses[0].tool_name == "Bash"
 
+        # A repeated expansion builds its own ToolUse objects, so mutating
+        # one result doesn't leak into the next
+        result.steps[1].tool_uses[0].properties["command"] = "rm -rf /"
+        again = await strategy.get_trajectory(UUID(user_id))
+        assert again.steps[1].tool_uses[0] is not result.steps[1].tool_uses[0]
+        assert again.steps[1].tool_uses[0].properties == {"command": "ls"}
+
     async def test_get_trajectory_parses_tool_uses_from_list(
         self, strategy, mock_graph_store
     ):
@@ -402,6 +409,32 @@ class TestGetTrajectory:
         assert len(result.steps) == 1
         assert result.steps[0].node_type == "UserText"
 
+    async def test_get_trajectories_uses_one_batch_query(
+        self, strategy, mock_graph_store
+    ):
+        """Several trajectories come from a single batched graph query."""
+        u1, u2 = str(uuid4()), str(uuid4())
+        mock_graph_store.get_trajectory_nodes_batch = AsyncMock(
+            return_value={
+                u1: [
+                    {
+                        "n": {"id": u1, "text": "first", "conversation_id": "c1"},
+                        "node_labels": ["UserText"],
+                    }
+                ],
+                u2: [],
+            }
+        )
+
+        results = await strategy.get_trajectories([UUID(u1), UUID(u2)])
+
+        mock_graph_store.get_trajectory_nodes_batch.assert_awaited_once_with(
+            [UUID(u1), UUID(u2)], max_depth=100
+        )
+        mock_graph_store.get_trajectory_nodes.assert_not_called()
+        assert [len(r.steps) for r in results] == [1, 0]
+        assert results[0].steps[0].text == "first"
+
 
 class TestTraceMemRetrievalProperty:
     """Tests for TraceMem.retrieval property."""